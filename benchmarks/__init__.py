@@ -0,0 +1,3 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Ad-hoc performance benchmarks, run as ``python -m benchmarks.<name>``."""
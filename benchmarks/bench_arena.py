@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Memory held by a parsed document as a node tree and as an ``Arena``, and the
+time to decode each to python objects.
+
+Run with ``python -m benchmarks.bench_arena``.
+"""
+from __future__ import absolute_import, print_function
+
+from pureyaml.arena import ArenaConstructor
+from pureyaml.decoder import YAMLDecoder
+from pureyaml.grammar.constructors import NodeConstructor
+from pureyaml.parser import get_parser
+
+from .bench_hash_consing import held_memory
+from .bench_lazy_views import bundle
+from .bench_node_memory import count_nodes
+from .utils import best_of, report
+
+SIZES = (1000, 5000)
+
+
+def main(sizes=SIZES):
+    parser = get_parser()
+    rows = []
+    for sections in sizes:
+        text = bundle(sections)
+        nodes = count_nodes(parser.parse(text, constructor=NodeConstructor()))
+        for label, constructor, decoder in [  # :off
+            ('node tree', NodeConstructor, YAMLDecoder(direct=False)),
+            ('arena', ArenaConstructor, YAMLDecoder(arena=True)),
+        ]:  # :on
+            held = held_memory(lambda: parser.parse(text, constructor=constructor()))
+            seconds = best_of(lambda: decoder.decode(text), repeat=3)
+            rows.append((sections, label, '%.1f' % (held / 1024.0), '%.1f' % (held / float(nodes)),
+                         '%.1f' % (seconds * 1e3)))
+
+    report('node tree vs arena', rows, headers=('sections', 'mode', 'held KiB', 'bytes/node', 'decode ms'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Dump and load a document holding a multi-MB ``!!binary`` blob: time, and peak
+memory on top of the blob itself.
+
+Run with ``python -m benchmarks.bench_binary``.
+"""
+from __future__ import absolute_import, print_function
+
+import os
+
+import pureyaml
+from pureyaml.emitter import YAMLEmitter
+from pureyaml.encoder import YAMLEncoder
+
+from .bench_direct_construction import peak_memory
+from .utils import best_of, report
+
+
+def encoder_dump(obj, fp):
+    for chunk in YAMLEncoder().iterencode(obj):
+        fp.write(chunk)
+
+
+def main(size=8 << 20):
+    obj = {'name': 'bundle', 'blob': os.urandom(size)}
+    text = pureyaml.dumps(obj)
+    rows = []
+    with open(os.devnull, 'w') as fp:
+        for label, dump in [('dump, YAMLEncoder', encoder_dump), ('dump, YAMLEmitter', YAMLEmitter().dump)]:
+            seconds = best_of(lambda: dump(obj, fp), repeat=3)
+            peak = peak_memory(lambda: dump(obj, fp))
+            rows.append((label, '%.1f' % (seconds * 1e3), '%.1f' % (peak / float(1 << 20))))
+
+    seconds = best_of(lambda: pureyaml.loads(text), repeat=3)
+    peak = peak_memory(lambda: pureyaml.loads(text))
+    rows.append(('loads', '%.1f' % (seconds * 1e3), '%.1f' % (peak / float(1 << 20))))
+
+    report('%d MiB !!binary blob' % (size >> 20), rows, headers=('operation', 'ms', 'peak MiB'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Cold-start time of the first ``loads()`` in a fresh interpreter.
+
+Compares shipped tables (as written by ``setup.py build_py`` or ``make
+tables``) with a process that cannot import them and rebuilds them in
+memory, as on a read-only install without generated tables.  Run with
+``python -m benchmarks.bench_cold_start``.
+"""
+from __future__ import absolute_import, print_function
+
+import subprocess
+import sys
+from timeit import default_timer
+
+from pureyaml.parser import LEXTAB, PARSETAB, tables_are_current, write_tables
+
+from .utils import report
+
+RUNS = 5
+
+FIRST_LOADS = 'import pureyaml; pureyaml.loads("a: [1, 2]\\n")'
+HIDE_TABLES = 'import sys; sys.modules.update({%r: None, %r: None}); ' % (LEXTAB, PARSETAB)
+
+
+def cold_start(code, runs=RUNS):
+    timings = []
+    for _ in range(runs):
+        start = default_timer()
+        subprocess.check_call([sys.executable, '-c', code])
+        timings.append(default_timer() - start)
+    return min(timings)
+
+
+def main(runs=RUNS):
+    if not tables_are_current():
+        write_tables()
+
+    baseline = cold_start('pass', runs)
+    rows = []
+    for label, code in [('shipped tables', FIRST_LOADS), ('tables rebuilt in memory', HIDE_TABLES + FIRST_LOADS)]:
+        seconds = cold_start(code, runs) - baseline
+        rows.append((label, '%.1f' % (seconds * 1e3)))
+
+    report('import + first loads(), interpreter startup excluded', rows, headers=('mode', 'ms'))
+
+
+if __name__ == '__main__':
+    main()
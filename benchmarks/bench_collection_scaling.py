@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Parse time of large block/flow mappings and sequences as they grow.
+
+Linear construction keeps ``us/item`` flat as ``items`` grows; quadratic
+construction makes it grow with ``items``.  Run with
+``python -m benchmarks.bench_collection_scaling [max_items]``.
+"""
+from __future__ import absolute_import, print_function
+
+import sys
+
+from pureyaml.parser import get_parser
+
+from .utils import best_of, report
+
+SIZES = (1000, 10000, 100000)
+
+SHAPES = [  # :off
+    ('block map', lambda n: ''.join('key_%d: %d\n' % (i, i) for i in range(n))),
+    ('block sequence', lambda n: ''.join('- item_%d\n' % i for i in range(n))),
+    ('flow sequence', lambda n: '[%s]\n' % ', '.join('item_%d' % i for i in range(n))),
+    ('flow map', lambda n: '{%s}\n' % ', '.join('key_%d: %d' % (i, i) for i in range(n))),
+    ('documents', lambda n: ''.join('--- doc_%d\n' % i for i in range(n))),
+]  # :on
+
+
+def main(sizes=SIZES):
+    parser = get_parser()
+    rows = []
+    for label, make_text in SHAPES:
+        for items in sizes:
+            text = make_text(items)
+            seconds = best_of(lambda: parser.parse(text), repeat=1)
+            rows.append((label, items, '%.2f' % seconds, '%.1f' % (seconds / items * 1e6)))
+
+    report('parse time by collection size', rows, headers=('shape', 'items', 'seconds', 'us/item'))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(tuple(size for size in SIZES if size <= int(sys.argv[1])))
+    else:
+        main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Time and allocations of ``loads`` through the node tree vs direct construction.
+
+Run with ``python -m benchmarks.bench_direct_construction``.
+"""
+from __future__ import absolute_import, print_function
+
+import tracemalloc
+
+from pureyaml.decoder import YAMLDecoder
+
+from .utils import best_of, report, sample_yaml
+
+
+def peak_memory(func):
+    """Peak bytes allocated during one call to ``func``."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main(docs=200):
+    text = sample_yaml(docs)
+    rows = []
+    for label, decoder in [('node tree', YAMLDecoder(direct=False)), ('direct', YAMLDecoder(direct=True))]:
+        decoder.decode(text)  # warm up the parser and lexer pool
+        seconds = best_of(lambda: decoder.decode(text))
+        peak = peak_memory(lambda: decoder.decode(text))
+        rows.append((label, '%.1f' % (seconds * 1e3), '%.1f' % (peak / 1024.0)))
+
+    report('loads, %d docs' % docs, rows, headers=('mode', 'ms', 'peak KiB'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+``dump`` to a file through the single pass ``YAMLEmitter``, against the node
+tree ``YAMLEncoder`` it replaces: time, and peak memory on top of the object.
+
+Run with ``python -m benchmarks.bench_emitter``.
+"""
+from __future__ import absolute_import, print_function
+
+import os
+
+from pureyaml.emitter import YAMLEmitter
+from pureyaml.encoder import YAMLEncoder
+
+from .bench_direct_construction import peak_memory
+from .utils import best_of, report
+
+
+def build(items):
+    return {
+        'kind': 'List',
+        'items': [{
+            'name': 'service-%d' % i,
+            'replicas': i,
+            'enabled': True,
+            'ratio': 0.5,
+            'labels': {'app': 'web', 'tier': 'backend'},
+            'ports': [80, 443],
+            'script': 'run\n--port %d\n' % i,
+        } for i in range(items)],
+    }
+
+
+def encoder_dump(obj, fp):
+    for chunk in YAMLEncoder().iterencode(obj):
+        fp.write(chunk)
+
+
+def main(items=5000):
+    obj = build(items)
+    rows = []
+    with open(os.devnull, 'w') as fp:
+        for label, dump in [('YAMLEncoder', encoder_dump), ('YAMLEmitter', YAMLEmitter().dump)]:
+            seconds = best_of(lambda: dump(obj, fp), repeat=3)
+            peak = peak_memory(lambda: dump(obj, fp))
+            rows.append((label, '%.1f' % (seconds * 1e3), '%.1f' % (peak / 1024.0)))
+
+    report('dump to a file, %d items' % items, rows, headers=('writer', 'ms', 'peak KiB'))
+
+
+if __name__ == '__main__':
+    main()
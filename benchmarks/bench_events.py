@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Peak memory of pulling one field out of a large manifest, via the node tree vs events.
+
+Run with ``python -m benchmarks.bench_events [docs]``.
+"""
+from __future__ import absolute_import, print_function
+
+import sys
+
+from pureyaml import events
+from pureyaml.nodes import Str
+from pureyaml.parser import get_parser
+
+from .bench_direct_construction import peak_memory
+from .utils import best_of, report, sample_yaml
+
+
+def names_via_nodes(text):
+    return [doc[0][Str('name')].value for doc in get_parser().parse(text)]
+
+
+def names_via_events(text):
+    names = []
+    state = {'key': None}
+
+    def callback(event):
+        if event.kind == events.KEY:
+            state['key'] = event.value
+        elif event.kind == events.SCALAR and state['key'] == 'name':
+            names.append(event.value)
+            state['key'] = None
+
+    events.parse(text, callback)
+    return names
+
+
+def main(docs=500):
+    text = sample_yaml(docs)
+    rows = []
+    for label, func in [('node tree', names_via_nodes), ('events', names_via_events)]:
+        func(text)  # warm up the parser and lexer pool
+        seconds = best_of(lambda: func(text), repeat=3)
+        peak = peak_memory(lambda: func(text))
+        rows.append((label, '%.1f' % (seconds * 1e3), '%.1f' % (peak / 1024.0)))
+
+    report('pluck one field from %d docs' % docs, rows, headers=('api', 'ms', 'peak KiB'))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
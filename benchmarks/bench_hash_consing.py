@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Memory held by the node tree of a stream that repeats the same blocks, with and
+without a ``NodePool``, and the cost of comparing two of its documents.
+
+Run with ``python -m benchmarks.bench_hash_consing``.
+"""
+from __future__ import absolute_import, print_function
+
+import tracemalloc
+
+from pureyaml.grammar.constructors import NodeConstructor
+from pureyaml.nodes import NodePool, Str
+from pureyaml.parser import get_parser
+
+from .utils import best_of, report
+
+DOC_TEMPLATE = """\
+---
+name: service-{i}
+labels:
+  app: web
+  tier: backend
+  team: platform
+resources:
+  limits:
+    cpu: 500m
+    memory: 512Mi
+  requests:
+    cpu: 250m
+    memory: 256Mi
+ports: [80, 443]
+"""
+
+
+def held_memory(func):
+    """Bytes still allocated by the result of ``func``, while it is alive."""
+    tracemalloc.start()
+    try:
+        result = func()
+        held, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return held
+
+
+def main(docs=500):
+    text = ''.join(DOC_TEMPLATE.format(i=i) for i in range(docs))
+    parser = get_parser()
+    parser.parse(text, constructor=NodeConstructor())  # warm up the parser and lexer pool
+
+    rows = []
+    for label, pool in [('no pool', None), ('NodePool', NodePool)]:
+        def parse():
+            return parser.parse(text, constructor=NodeConstructor(pool=pool and pool()))
+
+        first, second = [doc.value[0][Str('resources')] for doc in parse().value[:2]]
+        seconds = best_of(parse, repeat=3)
+        compare = best_of(lambda: first == second, number=1000)
+        rows.append((label, '%.1f' % (seconds * 1e3), '%.1f' % (held_memory(parse) / 1024.0),
+                     '%.2f' % (compare * 1e3)))
+
+    report('%d docs, node tree' % docs, rows, headers=('mode', 'parse ms', 'held KiB', '1000 x == ms'))
+
+
+if __name__ == '__main__':
+    main()
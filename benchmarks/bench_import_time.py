@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Import time of ``pureyaml``, measured with ``python -X importtime``.
+
+"eager" forces every submodule the package used to import up front, which is
+what ``import pureyaml`` cost before the parser became lazy.
+Run with ``python -m benchmarks.bench_import_time``.
+"""
+from __future__ import absolute_import, print_function
+
+import subprocess
+import sys
+
+from .utils import report
+
+RUNS = 5
+
+SCENARIOS = [  # :off
+    ('import pureyaml (eager)', 'import pureyaml; import pureyaml.parser; import future.utils'),
+    ('import pureyaml', 'import pureyaml'),
+    ('import + dumps()', 'import pureyaml; pureyaml.dumps({"a": [1, 2]})'),
+    ('import + loads()', 'import pureyaml; pureyaml.loads("a: [1, 2]\\n")'),
+]  # :on
+
+HEAVY = ('pureyaml.parser', 'pureyaml.ply', 'future')
+
+
+def import_profile(code):
+    """Total import time in microseconds, and the heavy modules that were imported."""
+    stderr = subprocess.check_output([sys.executable, '-X', 'importtime', '-c', code], stderr=subprocess.STDOUT)
+    total, heavy = 0, set()
+    for line in stderr.decode('utf-8').splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        total += int(self_us)
+        heavy.update(module for module in HEAVY if name.strip().startswith(module))
+    return total, heavy
+
+
+def main(runs=RUNS):
+    rows = []
+    for label, code in SCENARIOS:
+        profiles = [import_profile(code) for _ in range(runs)]
+        total = min(total for total, _ in profiles)
+        rows.append((label, '%.1f' % (total / 1e3), ', '.join(sorted(profiles[0][1])) or '-'))
+
+    report('python -X importtime, best of %d' % runs, rows, headers=('scenario', 'ms', 'heavy modules'))
+
+
+if __name__ == '__main__':
+    main()
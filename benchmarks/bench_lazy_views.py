@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Time and peak memory to load a large config bundle and read a few keys of it.
+
+Eager decoding converts every scalar; lazy views convert only what is read.
+Run with ``python -m benchmarks.bench_lazy_views``.
+"""
+from __future__ import absolute_import, print_function
+
+from pureyaml.decoder import YAMLDecoder
+
+from .bench_direct_construction import peak_memory
+from .utils import best_of, report
+
+SECTION_TEMPLATE = """\
+service-{i}:
+  name: service-{i}
+  replicas: {i}
+  enabled: true
+  ratio: 0.{i}
+  labels:
+    app: web
+    tier: backend
+  ports:
+    - 80
+    - 443
+"""
+
+
+def bundle(sections):
+    """Build one document with ``sections`` service configs."""
+    return ''.join(SECTION_TEMPLATE.format(i=i) for i in range(sections))
+
+
+def read_few(config):
+    service = config['service-7']
+    return service['replicas'], service['ports'][1], config['service-3']['labels']['tier']
+
+
+def main(sections=500):
+    text = bundle(sections)
+    decoders = [  # :off
+        ('node tree', YAMLDecoder(direct=False)),
+        ('direct', YAMLDecoder(direct=True)),
+        ('lazy views', YAMLDecoder(lazy=True)),
+    ]  # :on
+
+    rows = []
+    for label, decoder in decoders:
+        read_few(decoder.decode(text))  # warm up the parser and lexer pool
+        seconds = best_of(lambda: read_few(decoder.decode(text)))
+        peak = peak_memory(lambda: read_few(decoder.decode(text)))
+        rows.append((label, '%.1f' % (seconds * 1e3), '%.1f' % (peak / 1024.0)))
+
+    report('load %d sections, read 3 keys' % sections, rows, headers=('mode', 'ms', 'peak KiB'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Cost of building a lexer per call versus recycling one from a ``LexerPool``.
+
+Run with ``python -m benchmarks.bench_lexer_pool``.
+"""
+from __future__ import absolute_import, print_function
+
+from pureyaml.parser import YAMLLexer, get_parser
+
+from .utils import best_of, report, sample_yaml
+
+CALLS = 200
+
+
+def tokenize_fresh(text):
+    lexer = YAMLLexer.build()
+    lexer.input(text)
+    return list(iter(lexer.token, None))
+
+
+def tokenize_pooled(text):
+    return list(YAMLLexer.tokenize(text))
+
+
+def parse_fresh(text):
+    return get_parser().parse(text, lexer=YAMLLexer.build())
+
+
+def parse_pooled(text):
+    return get_parser().parse(text)
+
+
+def main(calls=CALLS):
+    text = sample_yaml(docs=1)
+
+    rows = []
+    for label, func in [  # :off
+        ('tokenize, build per call', tokenize_fresh),
+        ('tokenize, pooled', tokenize_pooled),
+        ('parse, build per call', parse_fresh),
+        ('parse, pooled', parse_pooled),
+    ]:  # :on
+        seconds = best_of(lambda: func(text), repeat=3, number=calls)
+        rows.append((label, '%.1f' % (seconds / calls * 1e6)))
+
+    report('lexer reuse on a %d byte doc' % len(text), rows, headers=('mode', 'us/call'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Peak memory of ``load_all`` over a file as the number of documents grows.
+
+Streaming keeps peak memory flat; ``loads`` of the whole stream grows with it.
+Run with ``python -m benchmarks.bench_load_all``.
+"""
+from __future__ import absolute_import, print_function
+
+import os
+import tempfile
+
+import pureyaml
+from pureyaml.grammar.constructors import PythonConstructor
+from pureyaml.parser import get_parser
+
+from .bench_direct_construction import peak_memory
+from .utils import report, sample_yaml
+
+SIZES = (100, 1000, 5000)
+
+
+def stream(path):
+    with open(path) as fp:
+        for _ in pureyaml.load_all(fp):
+            pass
+
+
+def whole(path):
+    with open(path) as fp:
+        get_parser().parse(fp.read(), constructor=PythonConstructor())
+
+
+def main(sizes=SIZES):
+    rows = []
+    for docs in sizes:
+        fd, path = tempfile.mkstemp(suffix='.yml')
+        try:
+            with os.fdopen(fd, 'w') as fp:
+                fp.write(sample_yaml(docs))
+            stream(path)  # warm up the parser and lexer pool
+            rows.append((docs, '%.1f' % (peak_memory(lambda: stream(path)) / 1024.0),
+                         '%.1f' % (peak_memory(lambda: whole(path)) / 1024.0)))
+        finally:
+            os.remove(path)
+
+    report('peak KiB by document count', rows, headers=('docs', 'load_all', 'whole stream'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Per-call overhead of ``pureyaml.loads`` on small configs.
+
+Compares building a fresh ``YAMLParser`` for every call, which re-runs
+``yacc()``, with the process-wide parser ``loads`` uses by default.  Run with
+``python -m benchmarks.bench_loads_overhead``.
+"""
+from __future__ import absolute_import, print_function
+
+import pureyaml
+from pureyaml.decoder import YAMLDecoder
+from pureyaml.parser import YAMLParser
+
+from .utils import best_of, report, sample_yaml
+
+CALLS = 200
+
+
+def fresh_parser_loads(text):
+    return YAMLDecoder(parser=YAMLParser()).decode(text)
+
+
+def main(calls=CALLS):
+    text = sample_yaml(docs=1)
+    assert fresh_parser_loads(text) == pureyaml.loads(text)
+
+    rows = []
+    for label, func in [('yacc() per call', fresh_parser_loads), ('shared parser', pureyaml.loads)]:
+        seconds = best_of(lambda: func(text), repeat=3, number=calls)
+        rows.append((label, '%.1f' % (seconds / calls * 1e6)))
+
+    report('loads() on a %d byte doc' % len(text), rows, headers=('mode', 'us/call'))
+
+
+if __name__ == '__main__':
+    main()
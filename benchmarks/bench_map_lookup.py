@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Looking up every key of a ``Map`` node, by linear scan and through its hash index.
+
+``dumps(sort_keys=True)`` looks up each sorted key.  Run with ``python -m benchmarks.bench_map_lookup``.
+"""
+from __future__ import absolute_import, print_function
+
+import pureyaml
+from pureyaml.nodes import Map, Str, Int
+
+from .utils import best_of, report
+
+SIZES = (100, 1000, 5000)
+
+
+def scan(node, key):
+    """``Map`` lookup as it was before the index: compare against every key."""
+    for k, v in node.value:
+        if k == key:
+            return v
+    raise KeyError(key)
+
+
+def indexed(node, keys):
+    """Look up ``keys``, building the index first, as on a freshly parsed node."""
+    try:
+        del node._index
+    except AttributeError:
+        pass
+    return [node[key] for key in keys]
+
+
+def main(sizes=SIZES):
+    rows = []
+    for size in sizes:
+        node = Map(*[(Str('key-%d' % i), Int(i)) for i in range(size)])
+        keys = [k for k, _ in node.value]
+        obj = {'key-%d' % i: i for i in range(size)}
+
+        scanned = best_of(lambda: [scan(node, key) for key in keys], repeat=3)
+        index = best_of(lambda: indexed(node, keys), repeat=3)
+        dumped = best_of(lambda: pureyaml.dumps(obj, sort_keys=True), repeat=3)
+        rows.append((size, '%.2f' % (scanned * 1e3), '%.2f' % (index * 1e3), '%.2f' % (dumped * 1e3)))
+
+    report('look up every key of a Map node', rows, headers=('keys', 'scan ms', 'index ms', 'dumps sorted ms'))
+
+
+if __name__ == '__main__':
+    main()
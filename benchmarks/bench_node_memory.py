@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Memory held per node by the node tree of large documents.
+
+Run with ``python -m benchmarks.bench_node_memory``.
+"""
+from __future__ import absolute_import, print_function
+
+from pureyaml.grammar.constructors import NodeConstructor
+from pureyaml.nodes import Collection, Map
+from pureyaml.parser import get_parser
+
+from .bench_hash_consing import held_memory
+from .bench_lazy_views import bundle
+from .utils import report
+
+SIZES = (100, 1000, 5000)
+
+
+def count_nodes(node):
+    count, stack = 0, [node]
+    while stack:
+        node = stack.pop()
+        count += 1
+        if isinstance(node, Map):
+            for key, value in node.value:
+                stack.append(key)
+                stack.append(value)
+        elif isinstance(node, Collection):
+            stack.extend(node.value)
+    return count
+
+
+def main(sizes=SIZES):
+    parser = get_parser()
+    rows = []
+    for sections in sizes:
+        text = bundle(sections)
+        nodes = count_nodes(parser.parse(text, constructor=NodeConstructor()))
+        held = held_memory(lambda: parser.parse(text, constructor=NodeConstructor()))
+        rows.append((sections, nodes, '%.1f' % (held / 1024.0), '%.1f' % (held / float(nodes))))
+
+    report('node tree memory', rows, headers=('sections', 'nodes', 'held KiB', 'bytes/node'))
+
+
+if __name__ == '__main__':
+    main()
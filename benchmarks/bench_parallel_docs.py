@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Throughput of ``load_all`` on a multi-document stream, by process count.
+
+Run with ``python -m benchmarks.bench_parallel_docs [docs]``.  Scaling stops at
+``os.cpu_count()``; on a single core the pool only adds overhead.
+"""
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+
+import pureyaml
+
+from .utils import best_of, report, sample_yaml
+
+CHUNKSIZE = 25
+
+
+def process_counts():
+    counts, count = [], 1
+    while count <= (os.cpu_count() or 1):
+        counts.append(count)
+        count *= 2
+    return counts
+
+
+def main(docs=2000):
+    text = sample_yaml(docs)
+
+    def load(**kwargs):
+        return lambda: sum(1 for _ in pureyaml.load_all(text, **kwargs))
+
+    serial = best_of(load(), repeat=3)
+    rows = [('serial', '%.2f' % serial, '%.0f' % (docs / serial), '1.00')]
+    for processes in process_counts():
+        seconds = best_of(load(processes=processes, chunksize=CHUNKSIZE), repeat=3)
+        rows.append((processes, '%.2f' % seconds, '%.0f' % (docs / seconds), '%.2f' % (serial / seconds)))
+
+    report('load_all, %d docs, %d cores' % (docs, os.cpu_count() or 1), rows,
+           headers=('processes', 'seconds', 'docs/s', 'speedup'))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Time to load one huge top-level block sequence, serially and by process count.
+
+Run with ``python -m benchmarks.bench_parallel_sequence [records]``, default a
+million records.  Scaling stops at ``os.cpu_count()``.
+"""
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+import tempfile
+from timeit import default_timer
+
+import pureyaml
+
+from .bench_parallel_docs import process_counts
+from .utils import report
+
+RECORD = '- name: record-{i}\n  size: {i}\n  tags: [a, b]\n'
+
+
+def timed(func):
+    start = default_timer()
+    result = func()
+    return default_timer() - start, result
+
+
+def main(records=1000000):
+    fd, path = tempfile.mkstemp(suffix='.yml')
+    try:
+        with os.fdopen(fd, 'w') as fp:
+            for i in range(records):
+                fp.write(RECORD.format(i=i))
+
+        def load(**kwargs):
+            with open(path) as fp:
+                return pureyaml.load_sequence(fp, **kwargs)
+
+        serial, expected = timed(load)
+        rows = [('serial', '%.1f' % serial, '1.00')]
+        for processes in process_counts():
+            seconds, result = timed(lambda: load(processes=processes))
+            assert result == expected
+            rows.append((processes, '%.1f' % seconds, '%.2f' % (serial / seconds)))
+    finally:
+        os.remove(path)
+
+    report('load_sequence, %d records, %d cores' % (records, os.cpu_count() or 1), rows,
+           headers=('processes', 'seconds', 'speedup'))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
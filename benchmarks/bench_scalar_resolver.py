@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Resolve every plain scalar of the yaml.org spec examples, old regex dispatch vs ``pureyaml.resolver`` schemas.
+
+Run with ``python -m benchmarks.bench_scalar_resolver``.
+"""
+from __future__ import absolute_import, print_function
+
+import os
+import re
+from contextlib import redirect_stderr
+from textwrap import dedent
+
+from pureyaml.nodes import ScalarDispatch
+from pureyaml.parser import YAMLLexer
+from pureyaml.resolver import schemas
+
+from .utils import best_of, report
+
+EXAMPLES = 'tests/test_yaml_org_examples.py'
+
+# ``ScalarDispatch.re_dispatch`` as it was, with its inline ``(?i)`` as a flag.
+re_dispatch = re.compile(r"""
+    ^ (?P<null> null $| ~ $)
+    | (?P<bool> true $| false $| yes $| no $)
+    | (?P<int10> [-+]? [0-9]+ $)
+    | (?P<int8> 0o [0-7]+ $)
+    | (?P<int16> 0x [0-9a-fA-F]+ $)
+    | (?P<float>[-+]? (?:
+        (?: [0-9]* \. [0-9]+ |  [0-9]+ \. [0-9]* )
+            (?: [eE] [-+]? [0-9]+ )? $|
+        [0-9]* \.? [0-9]* [eE] [-+]? [0-9]+ ) $
+      )
+    | (?P<infinity> [-+]? (?: \.inf | \.Inf | \.INF) $)
+    | (?P<nan> [-+]? (?: \.nan | \.NaN | \.NAN) $)
+    | (?P<str> .+ $)
+""", re.X | re.I)
+
+
+def regex_dispatch(value):
+    inner_value = value.strip()
+    if inner_value == '':
+        return None
+    match = re_dispatch.match(inner_value)
+    if match is None:
+        return value
+    try:
+        return ScalarDispatch.python_map[match.lastgroup](value)
+    except ValueError:
+        return value
+
+
+def example_scalars():
+    with open(EXAMPLES) as fp:
+        source = fp.read()
+
+    scalars = []
+    with open(os.devnull, 'w') as devnull, redirect_stderr(devnull):
+        for block in re.findall(r'text = dedent\("""\n(.*?)"""\)', source, re.S):
+            try:
+                tokens = list(YAMLLexer.tokenize(dedent(block)))
+            except Exception:  # examples the lexer does not support yet
+                continue
+            scalars.extend(token.value.get_value() for token in tokens if token.type == 'SCALAR')
+    return scalars
+
+
+def main(number=200):
+    scalars = example_scalars()
+
+    def run(func):
+        return lambda: [func(scalar) for scalar in scalars]
+
+    default = schemas['default']
+    resolvers = [  # :off
+        ('regex dispatch', regex_dispatch),
+        ('default, no cache', default.compile()),
+        ('default', default.resolve),
+        ('core', schemas['core'].resolve),
+        ('failsafe', schemas['failsafe'].resolve),
+    ]  # :on
+
+    rows = []
+    for label, func in resolvers:
+        seconds = best_of(run(func), number=number)
+        rows.append((label, '%.3f' % (seconds / number / len(scalars) * 1e6)))
+
+    report('%d yaml.org example scalars' % len(scalars), rows, headers=('resolve', 'us/scalar'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Time to pull a few fields out of a large generated document, with and without ``select``.
+
+Run with ``python -m benchmarks.bench_select``.
+"""
+from __future__ import absolute_import, print_function
+
+import pureyaml
+from pureyaml.projection import project
+
+from .bench_lazy_views import bundle
+from .utils import best_of, report
+
+SELECT = ['service-7.replicas', 'service-3.labels']
+
+
+def main(sections=(100, 500, 2000)):
+    rows = []
+    for count in sections:
+        text = bundle(count)
+        pureyaml.loads(text, select=SELECT)  # warm up the parser and lexer pool
+        full = best_of(lambda: pureyaml.loads(text), repeat=3)
+        projected = best_of(lambda: project(text.splitlines(True), SELECT), repeat=3)
+        selected = best_of(lambda: pureyaml.loads(text, select=SELECT), repeat=3)
+        rows.append((count, '%.1f' % (full * 1e3), '%.1f' % (projected * 1e3), '%.1f' % (selected * 1e3)))
+
+    report('loads, select %d paths' % len(SELECT), rows, headers=('sections', 'full ms', 'project ms', 'select ms'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+``sort_keys=True`` on a wide map: ordering the items of a ``Map`` node by
+comparing key nodes and looking each value up again, against sorting the
+``(key, value)`` pairs on each key's text.
+
+Run with ``python -m benchmarks.bench_sort_keys``.
+"""
+from __future__ import absolute_import, print_function
+
+import random
+
+from pureyaml.emitter import YAMLEmitter
+from pureyaml.encoder import YAMLEncoder, node_encoder, sort_key
+
+from .utils import best_of, report
+
+SIZES = (1000, 10000, 50000)
+
+
+def compare_nodes(node):
+    """``iter_map_items`` as it was: sort the key nodes, then look up each value."""
+    return [(k, node[k]) for k in sorted(node)]
+
+
+def sort_pairs(node):
+    return sorted(node.value, key=sort_key)
+
+
+def main(sizes=SIZES):
+    rows = []
+    for size in sizes:
+        keys = ['resource-%06d' % i for i in range(size)]
+        random.Random(size).shuffle(keys)
+        obj = dict((key, i) for i, key in enumerate(keys))
+        node = node_encoder(obj)
+
+        compared = best_of(lambda: compare_nodes(node), repeat=3)
+        paired = best_of(lambda: sort_pairs(node), repeat=3)
+        encoded = best_of(lambda: YAMLEncoder(sort_keys=True).encode(obj), repeat=3)
+        emitted = best_of(lambda: YAMLEmitter(sort_keys=True).dumps(obj), repeat=3)
+        rows.append((size, '%.1f' % (compared * 1e3), '%.1f' % (paired * 1e3), '%.1f' % (encoded * 1e3),
+                     '%.1f' % (emitted * 1e3)))
+
+    report('sort_keys=True', rows, headers=('keys', 'node compare ms', 'key text ms', 'YAMLEncoder ms',
+                                            'YAMLEmitter ms'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Picking the style of each string in a dump: the checks ``YAMLEncoder.visit_Str``
+used to run on every string, against ``styles.analyze`` and its cache.
+
+Run with ``python -m benchmarks.bench_styles``.
+"""
+from __future__ import absolute_import, print_function
+
+import re
+
+import pureyaml
+from pureyaml.styles import analyze, choose_style
+
+from .utils import best_of, report
+
+re_float = re.compile(r'[+-]?(?:\d*\.\d+|\d+\.\d)')
+
+
+def old_style(value):
+    """The checks ``visit_Str`` ran before ``styles``, with ``repr`` as the quoter."""
+    if not value:
+        return '""'
+    use_repr = any([  # :off
+        value.lower() in ['yes', 'no', 'true', 'false'],
+        value.isnumeric(),
+        not not re_float.match(value)
+    ])  # :on
+    method = repr if use_repr else str
+    return method(value)
+
+
+def main(records=20000):
+    statuses = ['active', 'pending', 'yes', 'no', '1.5', 'error: timeout', 'disabled', '42']
+    values = [statuses[i % len(statuses)] for i in range(records * 5)]
+    obj = [{'id': 'item-%d' % i, 'status': statuses[i % len(statuses)], 'region': 'eu-west-1'} for i in range(records)]
+
+    rows = [
+        ('old visit_Str checks', '%.1f' % (best_of(lambda: [old_style(value) for value in values]) * 1e3)),
+        ('choose_style, uncached', '%.1f' % (best_of(lambda: [choose_style(value) for value in values]) * 1e3)),
+        ('analyze, cached', '%.1f' % (best_of(lambda: [analyze(value) for value in values]) * 1e3)),
+        ('dumps, %d records' % records, '%.1f' % (best_of(lambda: pureyaml.dumps(obj), repeat=3) * 1e3)),
+    ]
+    report('%d enum like strings' % len(values), rows, headers=('step', 'ms'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Throughput of one shared ``YAMLParser`` across a thread pool.
+
+Run with ``python -m benchmarks.bench_threads``.  On free-threaded CPython
+builds (``python3.13t -X gil=0``) the parses run in parallel; with the GIL
+the numbers mostly show that sharing the parser is safe and adds no overhead.
+"""
+from __future__ import absolute_import, print_function
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from pureyaml.parser import YAMLParser
+
+from .utils import best_of, gil_enabled, report, sample_yaml
+
+THREADS = (1, 2, 4, 8)
+PARSES = 64
+
+
+def main(parses=PARSES, threads=THREADS):
+    parser = YAMLParser()
+    text = sample_yaml(docs=10)
+    expected = parser.parse(text)
+
+    rows = []
+    baseline = None
+    for workers in threads:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            def run():
+                results = list(pool.map(parser.parse, [text] * parses))
+                assert all(result == expected for result in results)
+
+            seconds = best_of(run, repeat=3)
+
+        throughput = parses / seconds
+        baseline = baseline or throughput
+        rows.append((workers, '%.1f' % throughput, '%.2fx' % (throughput / baseline)))
+
+    title = 'shared YAMLParser, %d parses (python %s, gil %s)' % (  # :off
+        parses, sys.version.split()[0], 'on' if gil_enabled() else 'off')  # :on
+    report(title, rows, headers=('threads', 'parses/s', 'scaling'))
+
+
+if __name__ == '__main__':
+    main()
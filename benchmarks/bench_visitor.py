@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Time ``NodeVisitor`` traversal of large node trees, against the old generator
+trampoline, for the decoder and the encoder.
+
+Run with ``python -m benchmarks.bench_visitor``.
+"""
+from __future__ import absolute_import, print_function
+
+import types
+
+from pureyaml.decoder import YAMLDecoder
+from pureyaml.encoder import YAMLEncoder, node_encoder
+from pureyaml.grammar.constructors import NodeConstructor
+from pureyaml.nodes import Node
+from pureyaml.parser import get_parser
+
+from .bench_lazy_views import bundle
+from .utils import best_of, report
+
+SIZES = (1000, 5000)
+
+
+def trampoline(visitor, node):
+    """``NodeVisitor.visit`` as it was: every node goes through the generator stack and a ``getattr``."""
+    stack = [node]
+    last_result = None
+    while stack:
+        try:
+            last = stack[-1]
+            if isinstance(last, types.GeneratorType):
+                sent = last.send(last_result)
+                stack.append(sent)
+                last_result = None
+            elif isinstance(last, Node):
+                node = stack.pop()
+                method = getattr(visitor, 'visit_%s' % type(node).__name__, None) or visitor.generic_visit
+                stack.append(method(node))
+            else:
+                last_result = stack.pop()
+        except StopIteration:
+            stack.pop()
+    return last_result
+
+
+def main(sizes=SIZES):
+    rows = []
+    for sections in sizes:
+        text = bundle(sections)
+        tree = get_parser().parse(text, constructor=NodeConstructor())
+        decoder = YAMLDecoder(direct=False)
+        obj = decoder.visit(tree)
+        encoder = YAMLEncoder()
+        nodes = node_encoder(obj)
+
+        for label, visitor, node in [('decoder', decoder, tree), ('encoder', encoder, nodes)]:
+            old = best_of(lambda: trampoline(visitor, node), repeat=3)
+            new = best_of(lambda: visitor.visit(node), repeat=3)
+            rows.append((sections, label, '%.1f' % (old * 1e3), '%.1f' % (new * 1e3)))
+
+    report('visit a node tree', rows, headers=('sections', 'visitor', 'trampoline ms', 'NodeVisitor ms'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Shared helpers for benchmarks."""
+from __future__ import absolute_import, print_function
+
+import sys
+from timeit import default_timer
+
+DOC_TEMPLATE = """\
+---
+# service {i}
+name: service-{i}   # the name
+replicas: {i}
+enabled: true
+ratio: 0.{i}
+labels:
+  app: web
+  tier: backend
+ports:
+  - 80
+  - 443
+command: [run, --port, {i}]
+...
+"""
+
+
+def sample_yaml(docs=1):
+    """Build a multi-document stream of small, commented config docs."""
+    return ''.join(DOC_TEMPLATE.format(i=i) for i in range(docs))
+
+
+def best_of(func, repeat=5, number=1):
+    """Best wall-clock time, in seconds, of ``number`` calls to ``func``."""
+    timings = []
+    for _ in range(repeat):
+        start = default_timer()
+        for _ in range(number):
+            func()
+        timings.append(default_timer() - start)
+    return min(timings)
+
+
+def gil_enabled():
+    """False on free-threaded CPython builds with the GIL switched off."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def report(title, rows, headers):
+    """Print a small fixed-width table."""
+    print(title)
+    print('-' * len(title))
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows)]
+    for row in [headers] + list(rows):
+        print('  '.join(str(cell).rjust(width) for cell, width in zip(row, widths)))
+    print()
@@ -11,12 +11,12 @@ Yet another yaml parser, in pure python.
 from __future__ import absolute_import
 
 import logging
+from functools import partial
 
-from future.utils import string_types
-
-from ._compat import NullHandler
+from ._compat import NullHandler, string_types
 from .decoder import YAMLDecoder
-from .encoder import YAMLEncoder
+from .emitter import YAMLEmitter
+from .encoder import YAMLEncoder  # noqa
 
 logging.getLogger(__name__).addHandler(NullHandler())
 
@@ -29,6 +29,8 @@ def dump(obj, fp=None, indent=None, sort_keys=False, **kw):
     """
     Dump object to a file like object or string.
 
+    Writes to ``fp`` as it goes, through ``YAMLEmitter``, in buffered chunks.
+
     :param obj:
     :param fp: Open file like object
     :param int indent: Indent size, default 2
@@ -37,16 +39,14 @@ def dump(obj, fp=None, indent=None, sort_keys=False, **kw):
     """
 
     if fp:
-        iterable = YAMLEncoder(indent=indent, sort_keys=sort_keys, **kw).iterencode(obj)
-        for chunk in iterable:
-            fp.write(chunk)
+        YAMLEmitter(indent=indent, sort_keys=sort_keys).dump(obj, fp)
     else:
         return dumps(obj, indent=indent, sort_keys=sort_keys, **kw)
 
 
 def dumps(obj, indent=None, default=None, sort_keys=False, **kw):
     """Dump string."""
-    return YAMLEncoder(indent=indent, default=default, sort_keys=sort_keys, **kw).encode(obj)
+    return YAMLEmitter(indent=indent, sort_keys=sort_keys).dumps(obj)
 
 
 def load(s, **kwargs):
@@ -57,6 +57,61 @@ def load(s, **kwargs):
         return loads(s.read(), **kwargs)
 
 
+def load_all(fp, cls=None, processes=None, ordered=True, chunksize=1, **kwargs):
+    """
+    Load each document of a yaml stream, as it is parsed.
+
+    Reads ``fp`` one document at a time, so memory use does not grow with the
+    number of documents.
+
+    :param fp: Open file like object, or string.
+    :param int processes: Parse documents in a pool of this many processes.
+    :param bool ordered: With ``processes``, False yields documents as they are
+        parsed, instead of in stream order.
+    :param int chunksize: With ``processes``, documents sent to a process at a time.
+    :return: Generator of python objects, one per document.
+    """
+    if isinstance(fp, string_types):
+        fp = fp.splitlines(True)
+
+    from .stream import split_documents, iter_decode, parallel_decode
+
+    documents = (text for _, text in split_documents(fp))
+
+    if processes is None:
+        return iter_decode(documents, cls, **kwargs)
+    return parallel_decode(documents, processes, ordered, chunksize, cls, **kwargs)
+
+
+def load_sequence(fp, processes=None, chunksize=10000, schema=None):
+    """
+    Load a document whose root is a large block sequence, in parallel.
+
+    Items start at ``-`` lines in column 0.  Chunks of ``chunksize`` items are
+    parsed in a pool of ``processes`` processes and joined, in order.  Errors
+    report the same line numbers as a serial parse.  Documents whose root is
+    not a block sequence are parsed serially with ``loads``.
+
+    :param fp: Open file like object, or string.
+    :param int processes: Number of worker processes, default parse serially.
+    :param int chunksize: Items per chunk sent to a process.
+    :param schema: ``Schema``, or schema name, resolving plain scalars.
+    :return: list
+    """
+    text = fp if isinstance(fp, string_types) else fp.read()
+
+    from .stream import split_sequence, decode_sequence, parallel_map
+
+    chunks = split_sequence(text.splitlines(True), chunksize) if processes else None
+    if chunks is None:
+        return loads(text, schema=schema)
+
+    items = []
+    for chunk_items in parallel_map(partial(decode_sequence, schema=schema), chunks, processes):
+        items.extend(chunk_items)
+    return items
+
+
 def loads(s, cls=None, **kwargs):
     """Load string"""
     if not isinstance(s, string_types):
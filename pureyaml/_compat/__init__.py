@@ -2,6 +2,24 @@
 """Python 2to3 compatibility handling."""
 from __future__ import absolute_import
 
+import sys
+
+PY2 = sys.version_info[0] == 2
+
+if PY2:  # pragma: no cover
+    from future.utils import binary_type, implements_iterator, iteritems, string_types, text_type
+else:
+    # ``future`` is only a runtime dependency on Python 2.
+    string_types = (str,)
+    text_type = str
+    binary_type = bytes
+
+    def iteritems(obj, **kwargs):
+        return iter(obj.items(**kwargs))
+
+    def implements_iterator(cls):
+        return cls
+
 try:
     from logging import NullHandler
 except ImportError:  # pragma: no cover
@@ -46,4 +64,7 @@ try:
 except ImportError:
     from .singledispatch import singledispatch
 
-__all__ = ['NullHandler', 'collections_abc', 'total_ordering', 'singledispatch']
+__all__ = [  # :off
+    'PY2', 'string_types', 'text_type', 'binary_type', 'iteritems', 'implements_iterator',
+    'NullHandler', 'collections_abc', 'total_ordering', 'singledispatch',
+]  # :on
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Array backed node tree: parallel arrays of kinds, links and scalar spans, read through accessor nodes."""
+from __future__ import absolute_import
+
+from array import array
+from io import StringIO
+
+from .nodes import Docs, Doc, Map, Sequence, ScalarDispatch
+from .resolver import get_schema
+
+DOCS, DOC, MAP, SEQUENCE, SCALAR = range(5)
+SCALAR_TAGS = tuple(sorted(ScalarDispatch.map))
+SCALAR_KINDS = {tag: SCALAR + code for code, tag in enumerate(SCALAR_TAGS)}
+NONE = -1
+
+
+class Arena(object):
+    """
+    A parsed stream, one array slot per node.
+
+    ``kinds`` holds ``DOCS``, ``DOC``, ``MAP``, ``SEQUENCE``, or ``SCALAR`` plus
+    the index of the scalar's tag in ``SCALAR_TAGS``.  ``parents``,
+    ``first_children`` and ``next_siblings`` link the tree, ``NONE`` marking no
+    link.  A map's children alternate key, value.  A scalar's text is
+    ``text[starts[i]:ends[i]]``.
+    """
+
+    def __init__(self):
+        self.kinds = array('B')
+        self.parents = array('i')
+        self.first_children = array('i')
+        self.next_siblings = array('i')
+        self.starts = array('q')
+        self.ends = array('q')
+        self.text = ''
+        self.root = NONE
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def add(self, kind, children=(), start=0, end=0):
+        """Append a node, adopting ``children`` in order.  Get its index."""
+        index = len(self.kinds)
+        self.kinds.append(kind)
+        self.parents.append(NONE)
+        self.first_children.append(children[0] if children else NONE)
+        self.next_siblings.append(NONE)
+        self.starts.append(start)
+        self.ends.append(end)
+
+        parents, next_siblings = self.parents, self.next_siblings
+        for child, sibling in zip(children, children[1:]):
+            parents[child] = index
+            next_siblings[child] = sibling
+        if children:
+            parents[children[-1]] = index
+        return index
+
+    def children(self, index):
+        """Iterate the child indexes of a node."""
+        child, next_siblings = self.first_children[index], self.next_siblings
+        while child != NONE:
+            yield child
+            child = next_siblings[child]
+
+    def scalar_text(self, index):
+        return self.text[self.starts[index]:self.ends[index]]
+
+    def tag(self, index):
+        """Get the ``ScalarDispatch.map`` key of a scalar."""
+        return SCALAR_TAGS[self.kinds[index] - SCALAR]
+
+    def node(self, index):
+        """Get an accessor for a collection, or a new scalar node."""
+        kind = self.kinds[index]
+        if kind >= SCALAR:
+            return ScalarDispatch.map[SCALAR_TAGS[kind - SCALAR]](self.scalar_text(index))
+        return accessors[kind](self, index)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the arrays and the scalar text."""
+        columns = (self.kinds, self.parents, self.first_children, self.next_siblings, self.starts, self.ends)
+        return sum(column.itemsize * len(column) for column in columns) + len(self.text.encode('utf-8'))
+
+
+class ArenaCollection(object):
+    """Mixin for accessor nodes, reading their children from the arena on first use."""
+    __slots__ = ()
+
+    # noinspection PyMissingConstructor
+    def __init__(self, arena, index):
+        self.arena = arena
+        self.index = index
+
+    @property
+    def value(self):
+        try:
+            return self.children
+        except AttributeError:
+            self.children = self.read_children()
+            return self.children
+
+    def read_children(self):
+        arena = self.arena
+        return tuple(arena.node(child) for child in arena.children(self.index))
+
+
+class ArenaDocs(ArenaCollection, Docs):
+    __slots__ = ('arena', 'index', 'children')
+
+
+class ArenaDoc(ArenaCollection, Doc):
+    __slots__ = ('arena', 'index', 'children')
+
+    def __init__(self, arena, index):
+        super(ArenaDoc, self).__init__(arena, index)
+        self.comments = None
+
+
+class ArenaSequence(ArenaCollection, Sequence):
+    __slots__ = ('arena', 'index', 'children')
+
+
+class ArenaMap(ArenaCollection, Map):
+    __slots__ = ('arena', 'index', 'children')
+
+    def read_children(self):
+        children = super(ArenaMap, self).read_children()
+        return tuple(zip(children[::2], children[1::2]))
+
+
+accessors = {DOCS: ArenaDocs, DOC: ArenaDoc, MAP: ArenaMap, SEQUENCE: ArenaSequence}
+
+
+# noinspection PyMethodMayBeStatic
+class ArenaConstructor(object):
+    """
+    Build an ``Arena`` instead of a node tree.  Comments are dropped.
+
+    Rules get node indexes.  The parse returns an ``ArenaDocs`` accessor.
+
+    :param schema: ``Schema``, or schema name, resolving plain scalars.
+    """
+    strict = False
+    comments = False
+
+    def __init__(self, schema=None):
+        self.arena = Arena()
+        self.buffer = StringIO()
+        self.size = 0
+        self.resolve = get_schema(schema).resolve
+        self.last = None, None
+
+    def docs(self, docs):
+        arena = self.arena
+        arena.root = arena.add(DOCS, docs)
+        arena.text, self.buffer = self.buffer.getvalue(), None
+        return ArenaDocs(arena, arena.root)
+
+    def doc(self, value, comments=None):
+        return self.arena.add(DOC, [value])
+
+    def map(self, items):
+        return self.arena.add(MAP, [child for item in items for child in item])
+
+    def sequence(self, items):
+        return self.arena.add(SEQUENCE, items)
+
+    def str(self, token):
+        return self.add_scalar(token.get_value(), 'str')
+
+    def scalar(self, token):
+        text = token.get_value()
+        return self.add_scalar(text, self.resolve(text)[0])
+
+    def cast(self, value, cast, lineno=None):
+        return self.add_scalar(value, ScalarDispatch.tag(value, cast=cast))
+
+    def add_scalar(self, text, tag):
+        start = self.size
+        self.size += self.buffer.write(text)
+        index = self.arena.add(SCALAR_KINDS[tag], start=start, end=self.size)
+        self.last = index, text
+        return index
+
+    def raw(self, scalar):
+        # Casts and multi-line scalars are reduced straight after their
+        # operand, so it is almost always the last scalar added.
+        index, text = self.last
+        if index == scalar:
+            return text
+        return self.buffer.getvalue()[self.arena.starts[scalar]:self.arena.ends[scalar]]
+
+    value = raw
+
+
+def parse(s, parser=None, schema=None):
+    """
+    Parse yaml text into an ``Arena``.
+
+    :return: ``ArenaDocs`` accessor, whose ``arena`` holds the whole stream.
+    """
+    if parser is None:
+        from .parser import get_parser
+        parser = get_parser()
+
+    return parser.parse(s, constructor=ArenaConstructor(schema))
+
+
+__all__ = ['Arena', 'ArenaConstructor', 'ArenaDocs', 'ArenaDoc', 'ArenaMap', 'ArenaSequence', 'parse']
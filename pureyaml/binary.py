@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Base64 codec for ``!!binary`` scalars, encoding a chunk at a time."""
+from __future__ import absolute_import
+
+import re
+from binascii import a2b_base64, b2a_base64
+
+# A multiple of 3, so chunks encode without padding and join into one line.
+CHUNK_BYTES = 3 << 14
+
+re_non_ascii = re.compile(b'[\\x80-\\xff]')
+
+
+def is_ascii(data):
+    """True if ``data`` is ascii, found without decoding a copy of it."""
+    return not re_non_ascii.search(data)
+
+
+def decode(text):
+    """Decode base64 ``str`` or ``bytes`` in one pass, skipping line breaks and indentation."""
+    return a2b_base64(text)
+
+
+def iter_encode(data, chunk_bytes=CHUNK_BYTES):
+    """
+    Yield the base64 text of ``data`` in pieces of one unbroken line, encoding
+    each from a ``memoryview`` slice, so ``data`` is never copied.  Empty
+    ``data`` yields one empty piece.
+    """
+    view = memoryview(data)
+    if not len(view):
+        yield ''
+        return
+
+    for start in range(0, len(view), chunk_bytes):
+        yield b2a_base64(view[start:start + chunk_bytes])[:-1].decode('ascii')
+
+
+def encode(data):
+    """Encode ``data`` to one line of base64 text."""
+    return ''.join(iter_encode(data))
+
+
+__all__ = ['is_ascii', 'decode', 'encode', 'iter_encode']
@@ -3,16 +3,80 @@
 
 from __future__ import absolute_import
 
-from .nodes import NodeVisitor
-from .parser import YAMLParser
+from .arena import ArenaConstructor
+from .grammar.constructors import NodeConstructor, PythonConstructor
+from .nodes import NodePool, NodeVisitor
+from .projection import project
+from .resolver import get_schema
+from .stream import is_content
+from .views import view
 
 
 # noinspection PyMethodMayBeStatic
 class YAMLDecoder(NodeVisitor):
     """Convert node tree into python object."""
 
+    def __init__(self, parser=None, direct=None, schema=None, lazy=False, select=None, pool=None, arena=False,
+                 **kwargs):
+        """
+        :param parser: Parser to use, default the process-wide parser.
+        :param bool direct: Build python objects while parsing, skipping the
+            node tree.  Default on, unless a subclass overrides ``visit_*``,
+            or ``pool`` is given.
+        :param schema: Resolve plain scalars with this ``Schema``, or schema
+            name: ``'failsafe'``, ``'json'``, ``'core'`` or ``'default'``.
+        :param bool lazy: Return read-only ``Mapping``/``Sequence`` views over
+            the node tree, converting values as they are read.
+        :param select: Only load these key paths, e.g. ``['spec.template']``.
+            Other blocks are cut from the text before it is tokenized.
+        :param pool: ``NodePool`` sharing equal subtrees of the node tree, or
+            True for a new pool per document.  ``ValueError`` with ``direct``
+            or ``arena``, which build no node tree.
+        :param bool arena: Parse into a compact ``Arena`` and decode through its
+            accessors, instead of a node tree.
+        """
+        super(YAMLDecoder, self).__init__(**kwargs)
+        if parser is None:
+            # The parser and ply load on first decoder, not on ``import pureyaml``.
+            from .parser import get_parser
+            parser = get_parser()
+
+        self.parser = parser
+        self.direct = type(self) is YAMLDecoder and pool is None if direct is None else direct
+        self.schema = get_schema(schema)
+        self.lazy = lazy
+        self.select = select
+        self.pool = pool
+        self.arena = arena
+
+        # Guard, a pool needs a node tree to share
+        if pool is not None and (arena or self.direct and not lazy):
+            raise ValueError('pool cannot be used with direct or arena, which build no node tree')
+
     def decode(self, s):
-        return self.visit(YAMLParser().parse(s))
+        if self.select is not None:
+            s = project(s.splitlines(True), self.select)
+            # Guard, nothing selected
+            if not any(is_content(line) for line in s.splitlines()):
+                return {}
+
+        if self.arena:
+            docs = self.parser.parse(s, constructor=ArenaConstructor(self.schema))
+            return view(docs.value[-1].value[-1]) if self.lazy else self.visit(docs)
+
+        if self.lazy:
+            docs = self.parser.parse(s, constructor=self.node_constructor())
+            return view(docs.value[-1].value[-1])
+
+        if self.direct:
+            docs = self.parser.parse(s, constructor=PythonConstructor(self.schema))
+            return docs[-1]
+
+        return self.visit(self.parser.parse(s, constructor=self.node_constructor()))
+
+    def node_constructor(self):
+        pool = NodePool() if self.pool is True else self.pool
+        return NodeConstructor(self.schema, pool=pool)
 
     def visit_Docs(self, node):
         for doc in node.value:
@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Write python objects as yaml in one pass, straight to a file object."""
+from __future__ import absolute_import
+
+from io import StringIO
+from math import isinf, isnan
+
+from . import binary
+from ._compat import binary_type, iteritems, text_type
+from .styles import BLOCK_HEADERS, analyze
+
+# Pieces, about one per line, joined into each write.
+BUFFER_PIECES = 1 << 12
+
+# Block scalar pieces this long are written straight away.
+LARGE_PIECE = 1 << 14
+
+BINARY = '!!binary |'
+
+
+class Indents(dict):
+    """Indent strings by depth, built once per depth."""
+
+    def __init__(self, width):
+        super(Indents, self).__init__()
+        self.width = width
+
+    def __missing__(self, depth):
+        indent = self[depth] = ' ' * (depth * self.width)
+        return indent
+
+
+def format_text(value):
+    """Format text: a one line string, or ``(header, lines)`` for a block scalar.  See ``styles.analyze``."""
+    style, text = analyze(value)
+    if style in BLOCK_HEADERS:
+        return BLOCK_HEADERS[style], text
+    return text
+
+
+def format_binary(data):
+    return BINARY, binary.iter_encode(data)
+
+
+def format_bytes(obj):
+    if binary.is_ascii(obj):
+        return format_text(obj.decode('ascii'))
+    return format_binary(obj)
+
+
+def format_float(obj):
+    if isnan(obj):
+        return '.nan'
+    if isinf(obj):
+        return repr(obj).replace('inf', '.inf')
+    return repr(obj)
+
+
+# Checked in order, so ``bool`` wins over ``int``.
+formatters = [  # :off
+    (bool, lambda obj: 'true' if obj else 'false'),
+    (int, repr),
+    (float, format_float),
+    (text_type, format_text),
+    (binary_type, format_bytes),
+    (type(None), lambda obj: 'null'),
+]  # :on
+
+
+def sort_key(item):
+    """Order of a ``(key, value)`` pair in sorted output, as ``YAMLEncoder`` sorts the key's node."""
+    key = item[0]
+    if isinstance(key, binary_type) and binary.is_ascii(key):
+        return key.decode('ascii')
+    return str(key)
+
+
+class YAMLEmitter(object):
+    """
+    Write python objects as yaml, walking them once.
+
+    Unlike ``YAMLEncoder`` there is no node tree and no list of fragments to
+    re-indent: each line is appended with its indent, from a table of indent
+    strings, and every ``buffer_pieces`` lines are joined into one write.  The
+    layout is ``YAMLEncoder``'s.
+
+    :param int indent: Indent size, default 2.
+    :param bool sort_keys: Sort mapping keys.
+    :param int buffer_pieces: Pieces, about one per line, buffered before each write.
+    """
+
+    def __init__(self, indent=None, sort_keys=False, buffer_pieces=BUFFER_PIECES):
+        self.indent = indent or 2
+        self.sort_keys = sort_keys or False
+        self.buffer_pieces = buffer_pieces
+        self.indents = Indents(self.indent)
+        self.dash = '-'.ljust(self.indent)
+        self.formatters = {}
+        self.write = None
+
+    def dump(self, obj, fp):
+        """Write ``obj`` to the file like object ``fp``."""
+        self.write = fp.write
+        try:
+            out = []
+            self.emit(obj, out)
+            self.flush(out)
+        finally:
+            self.write = None
+
+    def dumps(self, obj):
+        fp = StringIO()
+        self.dump(obj, fp)
+        return fp.getvalue()
+
+    def flush(self, out):
+        if out:
+            self.write(''.join(out))
+            del out[:]
+
+    def emit(self, obj, out):
+        """Append the pieces of ``obj`` to ``out``, flushing as it fills."""
+        if isinstance(obj, dict) and obj:
+            self.emit_map(obj, 0, False, out)
+        elif isinstance(obj, list) and obj:
+            self.emit_sequence(obj, 0, False, out)
+        elif isinstance(obj, (dict, list)):
+            out.append('{}\n' if isinstance(obj, dict) else '[]\n')
+        else:
+            text = self.format(obj)
+            if isinstance(text, tuple):
+                self.emit_block(text, 0, out)
+            else:
+                out.append(text + '\n')
+
+            # Anything but a text scalar ends the document explicitly.
+            if not isinstance(obj, (text_type, binary_type)) or isinstance(text, tuple) and text[0] == BINARY:
+                out.append('...\n')
+
+    def format(self, obj):
+        """Format a scalar: a one line string, or ``(header, lines)`` for a block scalar."""
+        try:
+            formatter = self.formatters[type(obj)]
+        except KeyError:
+            formatter = self.formatters[type(obj)] = self.find_formatter(type(obj))
+        return formatter(obj)
+
+    @staticmethod
+    def find_formatter(cls):
+        for base, formatter in formatters:
+            if issubclass(cls, base):
+                return formatter
+        raise RuntimeError('Type %s not supported' % cls)
+
+    def emit_block(self, block, depth, out):
+        """
+        Write a block scalar's lines, one level in, after its header.  ``lines``
+        may be an iterator, and a line may come in pieces: only pieces after a
+        newline are indented.
+        """
+        header, lines = block
+        indent, buffer_pieces = self.indents[depth + 1], self.buffer_pieces
+        out.append(header + '\n')
+        line = '\n'
+        for piece in lines:
+            out.append(indent + piece if line.endswith('\n') else piece)
+            line = piece
+            if len(out) >= buffer_pieces or len(piece) >= LARGE_PIECE:
+                self.flush(out)
+
+        # A trailing newline leaves a blank line, indented to the parent.
+        out.append(self.indents[depth] + '\n' if line.endswith('\n') else '\n')
+
+    def items(self, obj):
+        if self.sort_keys:
+            return sorted(iteritems(obj), key=sort_key)
+        return iteritems(obj)
+
+    def emit_map(self, obj, depth, inline, out):
+        """Write a map, at ``depth``.  If ``inline``, the first key follows a ``-`` already written."""
+        indent = self.indents[depth]
+        prefix = '' if inline else indent
+        for key, value in self.items(obj):
+            key = self.format_key(key)
+            if key is None:
+                continue
+
+            if isinstance(value, (dict, list)):
+                self.emit_nested(prefix + key + ':\n', value, depth, out)
+            else:
+                text = self.format(value)
+                if isinstance(text, tuple):
+                    out.append(prefix + key + ': ')
+                    self.emit_block(text, depth, out)
+                else:
+                    out.append(prefix + key + ': ' + text.replace('\n', '\n' + indent).rstrip(' ') + '\n')
+
+            prefix = indent
+            if len(out) >= self.buffer_pieces:
+                self.flush(out)
+
+    def format_key(self, key):
+        """Format a map key.  None for collections and block scalars, which are skipped."""
+        if isinstance(key, (dict, list)):
+            return None
+
+        key = self.format(key)
+        return None if isinstance(key, tuple) else key
+
+    def emit_nested(self, line, value, depth, out):
+        """Write the key ``line`` of a collection value, then the collection.  Sequences in a map are not indented."""
+        out.append(line)
+        if isinstance(value, dict) and value:
+            self.emit_map(value, depth + 1, False, out)
+        elif value:
+            self.emit_sequence(value, depth, False, out)
+
+    def emit_sequence(self, obj, depth, inline, out):
+        """Write a sequence, at ``depth``.  If ``inline``, the first item follows a ``-`` already written."""
+        indent, dash = self.indents[depth], self.dash
+        prefix = '' if inline else indent
+        for item in obj:
+            if isinstance(item, (dict, list)):
+                self.emit_nested_item(prefix, item, depth, out)
+            else:
+                text = self.format(item)
+                if isinstance(text, tuple):
+                    out.append(prefix + dash)
+                    self.emit_block(text, depth, out)
+                else:
+                    out.append(prefix + dash + text.replace('\n', '\n' + indent).rstrip(' ') + '\n')
+
+            prefix = indent
+            if len(out) >= self.buffer_pieces:
+                self.flush(out)
+
+    def emit_nested_item(self, prefix, item, depth, out):
+        """Write a collection item of a sequence, after ``prefix``: inline after its ``-``, or as ``{}`` or ``[]``."""
+        if not item:
+            out.append(prefix + ('- {}\n' if isinstance(item, dict) else '- []\n'))
+            return
+
+        out.append(prefix + self.dash)
+        if isinstance(item, dict):
+            self.emit_map(item, depth + 1, True, out)
+        else:
+            self.emit_sequence(item, depth + 1, True, out)
+
+
+__all__ = ['YAMLEmitter']
@@ -3,13 +3,12 @@
 
 from __future__ import absolute_import
 
-import re
 from math import isinf, isnan
 
-from future.utils import text_type, binary_type, iteritems
-
-from ._compat import singledispatch
+from . import binary
+from ._compat import singledispatch, text_type, binary_type, iteritems
 from .nodes import *  # noqa
+from .styles import BLOCK_HEADERS, analyze
 
 
 @singledispatch
@@ -36,21 +35,14 @@ def _(obj):
 
 @node_encoder.register(binary_type)  # noqa
 def _(obj):
-    try:
-        obj = text_type(obj, 'ascii')
-        return Str(obj)
-    except UnicodeDecodeError:
-        return Binary.from_decoded(obj)
+    if binary.is_ascii(obj):
+        return Str(text_type(obj, 'ascii'))
+    return Binary.from_decoded(obj)
 
 
 @node_encoder.register(text_type)  # noqa
 def _(obj):
-    try:
-        obj.encode('ascii')
-        return Str(obj)
-    except UnicodeEncodeError:
-        obj = binary_type(obj, encoding='utf-8')
-        return Binary.from_decoded(obj)
+    return Str(obj)
 
 
 @node_encoder.register(bool)  # noqa
@@ -173,11 +165,10 @@ class YAMLEncoder(NodeVisitor):
         if not isinstance(node, Map):
             raise TypeError('Expecting %r, got %r' % (Map, type(node)))
         if self.sort_keys is False:
-            for k, v in iteritems(node):
-                yield k, v
-        else:
-            for k in iter(sorted(node)):
-                yield k, node[k]
+            return iter(node.value)
+
+        # Each key's text is computed once, and stays paired with its value.
+        return iter(sorted(node.value, key=sort_key))
 
     def visit_Map(self, node):
         stack = []
@@ -214,25 +205,13 @@ class YAMLEncoder(NodeVisitor):
         return repr(node.value)
 
     def visit_Str(self, node):
-        value = text_type(node.value)
-        if not value:
-            return '""'
-        use_repr = any([  # :off
-            value.lower() in ['yes', 'no', 'true', 'false'],
-            value.isnumeric(),
-            is_float(value)
-        ])  # :on
-
-        method = repr if use_repr else str
-        if value.endswith('\n') and '\n' in value[:-1]:
-            stack = ['|\n', INDENT]
-            stack.extend(method(node.value).splitlines(True))
+        style, text = analyze(text_type(node.value))
+        if style in BLOCK_HEADERS:
+            stack = [BLOCK_HEADERS[style] + '\n', INDENT]
+            stack.extend(text)
             stack.append(DEDENT)
             return stack
-
-        if value.endswith('\n'):
-            return ['>\n', INDENT, method(node.value), DEDENT]
-        return method(node.value)
+        return text
 
     def visit_Bool(self, node):
         return self.visit_Scalar(node).lower()
@@ -258,8 +237,6 @@ class YAMLEncoder(NodeVisitor):
         return stack
 
 
-re_float = re.compile(r'[+-]?(?:\d*\.\d+|\d+\.\d)')
-
-
-def is_float(string):
-    return not not re_float.match(string)
+def sort_key(item):
+    """Order of a ``(key, value)`` pair in sorted output: the key's text, as ``Scalar`` compares it."""
+    return str(item[0].value)
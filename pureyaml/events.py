@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Event based parsing, without building a node tree.
+
+Events are reported in document order, as ``Event(kind, value, lineno)``:
+``start_doc``, ``start_map``, ``key``, ``scalar``, ``end_map``, ``start_seq``,
+``end_seq`` and ``end_doc``.  ``key`` and ``scalar`` events carry the python
+value, as ``loads`` would decode it.
+
+The parser reduces bottom-up, so a doc's events are only known, in order, once
+the whole doc is reduced.  Until then they are held, as ``Event`` tuples: memory
+grows with the largest doc, not with the stream.
+"""
+from __future__ import absolute_import
+
+from .grammar.constructors import (  # noqa
+    Event, EventConstructor, START_DOC, END_DOC, START_MAP, END_MAP, START_SEQ, END_SEQ, KEY, SCALAR
+)
+from .parser import get_parser
+from .stream import split_documents
+
+
+def parse(s, callback, parser=None, schema=None):
+    """
+    Parse yaml text, calling ``callback(event)`` for each event.
+
+    Each doc's events are reported as soon as the doc is parsed, then dropped.
+    The whole doc's events are held until then.
+
+    :param str s: Yaml text.
+    :param callback: Called with each ``Event``.
+    :param parser: Parser to use, default the process-wide parser.
+    :param schema: ``Schema``, or schema name, resolving plain scalars.
+    """
+    parser = parser or get_parser()
+    parser.parse(s, constructor=EventConstructor(callback, schema))
+
+
+def iterparse(s, parser=None, schema=None):
+    """
+    Generate the events of yaml text.  See ``parse``.
+
+    The text is split into docs, and each doc is parsed only once the events
+    of the docs before it are consumed, so only one doc's events, all of them,
+    are held at a time.  Docs with no content have no events.
+    """
+    parser = parser or get_parser()
+    for lineno, text in split_documents(s.splitlines(True)):
+        events = []
+        parser.parse(text, constructor=EventConstructor(events.append, schema), lineno=lineno)
+        for event in events:
+            yield event
+
+
+__all__ = [  # :off
+    'Event',
+    'parse',
+    'iterparse',
+    'START_DOC',
+    'END_DOC',
+    'START_MAP',
+    'END_MAP',
+    'START_SEQ',
+    'END_SEQ',
+    'KEY',
+    'SCALAR',
+]  # :on
@@ -2,6 +2,7 @@
 # coding=utf-8
 from __future__ import absolute_import
 
+from copy import copy
 from textwrap import dedent
 
 
@@ -47,6 +48,15 @@ class YAMLSyntaxError(SyntaxError, YAMLException):
     def __str__(self):
         return '\n'.join(self.msg_lines())
 
+    def __reduce__(self):
+        # The token holds its lexer, which does not pickle, e.g. back from a worker process.
+        token = copy(self.token)
+        token.lexer = None
+        return self.__class__.__new__, (self.__class__,), (token, self.value, self.offset, self.input)
+
+    def __setstate__(self, state):
+        self.token, self.value, self.offset, self.input = state
+
 
 class YAMLStrictTypeError(TypeError, YAMLException):
     def __init__(self, token, types, func):
@@ -72,3 +82,8 @@ class YAMLStrictTypeError(TypeError, YAMLException):
 class YAMLCastTypeError(TypeError, YAMLException):
     def __init__(self, message=None, cast=None):
         self.message = message or 'Unexpected cast type: {cast}.  Type not defined'.format(cast=cast)
+
+
+class YAMLEscapeError(ValueError, YAMLException):
+    def __init__(self, escape):
+        self.message = 'Escape {escape} is not a unicode code point'.format(escape=escape)
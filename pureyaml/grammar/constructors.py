@@ -0,0 +1,207 @@
+# coding=utf-8
+"""Build parse results, either as a node tree or as plain python objects."""
+from __future__ import absolute_import
+
+from collections import namedtuple
+
+from ..nodes import Docs, Doc, Map, Sequence, Str, ScalarDispatch
+from ..resolver import get_schema
+
+START_DOC = 'start_doc'
+END_DOC = 'end_doc'
+START_MAP = 'start_map'
+END_MAP = 'end_map'
+START_SEQ = 'start_seq'
+END_SEQ = 'end_seq'
+KEY = 'key'
+SCALAR = 'scalar'
+
+
+class Event(namedtuple('Event', ['kind', 'value', 'lineno'])):
+    """A parse event: ``kind``, python ``value`` for keys and scalars, source line."""
+    __slots__ = ()
+
+
+# noinspection PyMethodMayBeStatic
+class NodeConstructor(object):
+    """
+    Build the intermediate node tree, keeping comments and node metadata.
+
+    :param schema: ``Schema``, or schema name, resolving plain scalars.
+    :param NodePool pool: Share equal scalars and collections through this
+        pool.  Comments are dropped, as a shared node has no one source line.
+    """
+    strict = True
+    comments = True
+
+    def __init__(self, schema=None, pool=None):
+        self.schema = get_schema(schema)
+        if pool is not None:
+            self.intern = pool.intern
+            self.comments = False
+
+    def intern(self, node):
+        return node
+
+    def docs(self, docs):
+        return Docs(*docs)
+
+    def doc(self, value, comments=None):
+        doc = Doc(value)
+        if comments:
+            doc.set_comments(comments)
+        return doc
+
+    def map(self, items):
+        return self.intern(Map(*items))
+
+    def sequence(self, items):
+        return self.intern(Sequence(*items))
+
+    def str(self, token):
+        return self.intern(Str(token))
+
+    def scalar(self, token):
+        return self.intern(ScalarDispatch(token, schema=self.schema))
+
+    def cast(self, value, cast, lineno=None):
+        return self.intern(ScalarDispatch(value, cast=cast))
+
+    def raw(self, scalar):
+        """Get the text a scalar was built from."""
+        return scalar.raw_value
+
+    def value(self, scalar):
+        return scalar.value
+
+
+# noinspection PyMethodMayBeStatic
+class PythonConstructor(NodeConstructor):
+    """
+    Build ``dict``, ``list`` and python scalars directly, skipping the node tree.
+
+    Comments and node metadata are dropped.  Holds the text of the last scalar
+    it built, so use one instance per parse.
+    """
+    strict = False
+    comments = False
+
+    def __init__(self, schema=None):
+        super(PythonConstructor, self).__init__(schema)
+        self.resolve = self.schema.resolve
+        self.last_raw = None
+
+    def docs(self, docs):
+        return docs
+
+    def doc(self, value, comments=None):
+        return value
+
+    def map(self, items):
+        return dict(items)
+
+    def sequence(self, items):
+        return items
+
+    def str(self, token):
+        return self.cast(token.get_value(), 'str')
+
+    def scalar(self, token):
+        value = token.get_value()
+        self.last_raw = value
+        return self.resolve(value)[1]
+
+    def cast(self, value, cast, lineno=None):
+        self.last_raw = value
+        return ScalarDispatch.resolve(value, cast=cast)
+
+    def raw(self, scalar):
+        # ``CAST_TYPE scalar`` is reduced straight after its operand, so the
+        # last scalar built is always the one being cast.
+        return self.last_raw
+
+    def value(self, scalar):
+        return scalar
+
+
+# noinspection PyMethodMayBeStatic
+class EventConstructor(PythonConstructor):
+    """
+    Report parse events to ``callback`` instead of building collections.
+
+    Each rule returns a chunk: one ``Event``, or a list of events and nested
+    chunks.  Chunks are flattened once their doc is reduced, and dropped once
+    ``callback`` has seen them, so a whole doc's events are held at a time.
+    """
+
+    def __init__(self, callback, schema=None):
+        super(EventConstructor, self).__init__(schema)
+        self.callback = callback
+
+    def docs(self, docs):
+        return None
+
+    def doc(self, value, comments=None):
+        self.callback(Event(START_DOC, None, first_lineno(value)))
+        for event in flatten(value):
+            self.callback(event)
+        self.callback(Event(END_DOC, None, last_lineno(value)))
+
+    def map(self, items):
+        first, last = items[0][0], items[-1][1]
+        chunk = [Event(START_MAP, None, first_lineno(first))]
+        for key, value in items:
+            if isinstance(key, Event) and key.kind == SCALAR:
+                key = Event(KEY, key.value, key.lineno)
+            chunk.append(key)
+            chunk.append(value)
+        chunk.append(Event(END_MAP, None, last_lineno(last)))
+        return chunk
+
+    def sequence(self, items):
+        chunk = [Event(START_SEQ, None, first_lineno(items[0]))]
+        chunk.extend(items)
+        chunk.append(Event(END_SEQ, None, last_lineno(items[-1])))
+        return chunk
+
+    def str(self, token):
+        return self.cast(token.get_value(), 'str', token.lineno)
+
+    def scalar(self, token):
+        value = super(EventConstructor, self).scalar(token)
+        return Event(SCALAR, value, token.lineno)
+
+    def cast(self, value, cast, lineno=None):
+        value = super(EventConstructor, self).cast(value, cast, lineno)
+        return Event(SCALAR, value, lineno)
+
+    def value(self, scalar):
+        return scalar.value
+
+
+def flatten(chunk):
+    """Iterate the events of a chunk, in document order."""
+    stack = [iter([chunk])]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, list):
+                stack.append(iter(item))
+                break
+            yield item
+        else:
+            stack.pop()
+
+
+def first_lineno(chunk):
+    while isinstance(chunk, list):
+        chunk = chunk[0]
+    return chunk.lineno
+
+
+def last_lineno(chunk):
+    while isinstance(chunk, list):
+        chunk = chunk[-1]
+    return chunk.lineno
+
+
+default_constructor = NodeConstructor()
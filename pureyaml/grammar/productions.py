@@ -4,34 +4,50 @@ from __future__ import absolute_import
 
 import sys
 
-import re
 from textwrap import dedent
 
 from .tokens import YAMLTokens, YAMLCommentedScalarToken
-from .utils import strict, fold
+from .utils import strict, fold, get_context, get_constructor
 from ..nodes import *  # noqa
+from ..styles import unescape
 
 WITHCOMMENTS_PRODUCTIONS_DEBUG=False
 #WITHCOMMENTS_PRODUCTIONS_DEBUG=True
 
 # noinspection PyIncorrectDocstring,PyMethodMayBeStatic
 class YAMLProductions(YAMLTokens):
+    start = 'stream'
+
     # PARSER
     # ===================================================================
+    # Collections are accumulated in a list, appending each item in place, and
+    # built once their last item is reduced.  ``collection + Collection(item)``
+    # copied every item on each append.
+    #
+    # Results are built by the parse's constructor: a node tree by default, or
+    # plain python objects (see ``constructors.PythonConstructor``).
     @strict(Docs)
+    def p_stream(self, p):
+        """
+        stream  : docs
+        """
+        p[0] = get_constructor(p).docs(p[1])
+
+    @strict(list)
     def p_docs__last(self, p):
         """
         docs    : doc
                 | doc DOC_END
         """
-        p[0] = Docs(p[1])
+        p[0] = [p[1]]
 
-    @strict(Docs)
+    @strict(list)
     def p_docs__init(self, p):
         """
         docs    : docs doc
         """
-        p[0] = p[1] + Docs(p[2])
+        p[1].append(p[2])
+        p[0] = p[1]
 
     @strict(Doc)
     def p_doc__indent(self, p):
@@ -49,15 +65,8 @@ class YAMLProductions(YAMLTokens):
             | scalar
         """
         # ****
-        doc_node = Doc(p[1])
-        if YAMLTokens.StartOfDocComments:
-            doc_node.set_comments(YAMLTokens.StartOfDocComments)
-
-        YAMLTokens.StartOfDocComments = None
-        YAMLTokens.MostRecentScalarNode = None
-        YAMLTokens.MostRecentScalarToken = None
-            
-        p[0] = doc_node
+        doc_comments = get_context(p).pop_doc_comments()
+        p[0] = get_constructor(p).doc(p[1], doc_comments)
             
 
     def p_doc_scalar_collection_ignore(self, p):
@@ -67,28 +76,41 @@ class YAMLProductions(YAMLTokens):
 
         p[0] = p[2]
 
-    @strict(Sequence, Map)
-    def p_collection(self, p):
+    @strict(Sequence)
+    def p_collection__sequence(self, p):
         """
         collection  : sequence
-                    | map
-                    | flow_collection
         """
-        p[0] = p[1]
-        
+        p[0] = get_constructor(p).sequence(p[1])
+
     @strict(Map)
+    def p_collection__map(self, p):
+        """
+        collection  : map
+        """
+        p[0] = get_constructor(p).map(p[1])
+
+    @strict(Sequence, Map)
+    def p_collection__flow(self, p):
+        """
+        collection  : flow_collection
+        """
+        p[0] = p[1]
+
+    @strict(list)
     def p_map__last(self, p):
         """
         map : map_item
         """
-        p[0] = Map(p[1])
+        p[0] = [p[1]]
 
-    @strict(Map)
+    @strict(list)
     def p_map__init(self, p):
         """
         map : map map_item
         """
-        p[0] = p[1] + Map(p[2])
+        p[1].append(p[2])
+        p[0] = p[1]
 
     @strict(tuple)
     def p_map_item(self, p):
@@ -152,7 +174,7 @@ class YAMLProductions(YAMLTokens):
         """
         map_item_value  : B_MAP_VALUE sequence
         """
-        p[0] = p[2]
+        p[0] = get_constructor(p).sequence(p[2])
 
     # @strict(Null)
     # def p_map_item_value_empty(self, p):
@@ -161,19 +183,20 @@ class YAMLProductions(YAMLTokens):
     #     """
     #     p[0] = Null(None)
 
-    @strict(Sequence)
+    @strict(list)
     def p_sequence__last(self, p):
         """
         sequence    : sequence_item
         """
-        p[0] = Sequence(p[1])
+        p[0] = [p[1]]
 
-    @strict(Sequence)
+    @strict(list)
     def p_sequence__init(self, p):
         """
         sequence    : sequence sequence_item
         """
-        p[0] = p[1] + Sequence(p[2])
+        p[1].append(p[2])
+        p[0] = p[1]
 
     @strict(Scalar)
     def p_sequence_item__scalar(self, p):
@@ -225,10 +248,9 @@ class YAMLProductions(YAMLTokens):
         # ****
         wrapped_scalar_token2 = p[2]
         scalar2a = wrapped_scalar_token2.get_value()
-        scalar2b = re.sub('\n\s+', ' ', scalar2a)
-        scalar2c = scalar2b.replace('\\"', '"')
-        wrapped_scalar_token2c = YAMLCommentedScalarToken.WrapAsString(scalar2c,wrapped_scalar_token2.lineno)
-        p[0] = Str(wrapped_scalar_token2c)
+        scalar2b = unescape(scalar2a)
+        wrapped_scalar_token2b = YAMLCommentedScalarToken.WrapAsString(scalar2b,wrapped_scalar_token2.lineno)
+        p[0] = get_constructor(p).str(wrapped_scalar_token2b)
 
         if WITHCOMMENTS_PRODUCTIONS_DEBUG:
             print("----",file=sys.stderr)
@@ -247,7 +269,7 @@ class YAMLProductions(YAMLTokens):
         scalar2a = wrapped_scalar_token2.get_value()
         scalar2b = scalar2a.replace("''", "'")
         wrapped_scalar_token2b = YAMLCommentedScalarToken.WrapAsString(scalar2b,wrapped_scalar_token2.lineno)
-        p[0] = Str(wrapped_scalar_token2b)
+        p[0] = get_constructor(p).str(wrapped_scalar_token2b)
 
         if WITHCOMMENTS_PRODUCTIONS_DEBUG:
             print("----",file=sys.stderr)
@@ -266,7 +288,7 @@ class YAMLProductions(YAMLTokens):
         #p[0] = ScalarDispatch('', cast='str')
 
         wrapped_scalar = YAMLCommentedScalarToken.WrapAsString('',p.lexer.lineno)
-        p[0] = Str(wrapped_scalar)
+        p[0] = get_constructor(p).str(wrapped_scalar)
 
         if WITHCOMMENTS_PRODUCTIONS_DEBUG:
             print("----",file=sys.stderr)
@@ -279,7 +301,8 @@ class YAMLProductions(YAMLTokens):
         if WITHCOMMENTS_PRODUCTIONS_DEBUG:
             print(f"**** <p_scalar> (explicit cast p[1]) {p[2]}",file=sys.stderr)
 
-        p[0] = ScalarDispatch(p[2].raw_value, cast=p[1])
+        constructor = get_constructor(p)
+        p[0] = constructor.cast(constructor.raw(p[2]), p[1], p.lineno(1))
 
         if WITHCOMMENTS_PRODUCTIONS_DEBUG:
             print("----",file=sys.stderr)
@@ -294,9 +317,8 @@ class YAMLProductions(YAMLTokens):
             print(f"**** <p_scalar> (default rule) type = {p[1]}",file=sys.stderr)
 
         wrapped_scalar_token1 = p[1]
-        scalar_node1 = ScalarDispatch(wrapped_scalar_token1)
-        YAMLTokens.MostRecentScalarNode = scalar_node1
-        YAMLTokens.MostRecentScalarToken = None
+        scalar_node1 = get_constructor(p).scalar(wrapped_scalar_token1)
+        get_context(p).set_scalar_node(scalar_node1)
         p[0] = scalar_node1
 
         if WITHCOMMENTS_PRODUCTIONS_DEBUG:
@@ -308,7 +330,7 @@ class YAMLProductions(YAMLTokens):
         scalar  : B_LITERAL_START scalar_group B_LITERAL_END
         """
         scalar_group = ''.join(p[2])
-        p[0] = ScalarDispatch('%s\n' % dedent(scalar_group).replace('\n\n\n', '\n'), cast='str')
+        p[0] = get_constructor(p).cast('%s\n' % dedent(scalar_group).replace('\n\n\n', '\n'), 'str', p.lineno(1))
 
     @strict(Str)
     def p_scalar__folded(self, p):
@@ -317,7 +339,7 @@ class YAMLProductions(YAMLTokens):
         """
         scalar_group = ''.join(p[2])
         folded_scalar = fold(dedent(scalar_group)).rstrip()
-        p[0] = ScalarDispatch('%s\n' % folded_scalar, cast='str')
+        p[0] = get_constructor(p).cast('%s\n' % folded_scalar, 'str', p.lineno(1))
 
     @strict(Str)
     def p_scalar__indented_flow(self, p):
@@ -326,25 +348,25 @@ class YAMLProductions(YAMLTokens):
         """
         scalar_group = '\n'.join(p[2])
         folded_scalar = fold(dedent(scalar_group))
-        p[0] = ScalarDispatch(folded_scalar, cast='str')
+        p[0] = get_constructor(p).cast(folded_scalar, 'str', p.lineno(1) + 1)
 
     @strict(Str)
     def p_scalar__string_indented_multi_line(self, p):
         """
         scalar  : scalar INDENT SCALAR DEDENT
         """
-        scalar = '\n'.join([p[1].value, p[3]])
+        scalar = '\n'.join([get_constructor(p).raw(p[1]), p[3].get_value()])
 
         if WITHCOMMENTS_PRODUCTIONS_DEBUG:
             print(f"**** <p_scalar> (indended multi-line) {fold(scalar)}", file=sys.stderr)
 
-        p[0] = ScalarDispatch(fold(scalar), cast='str')
+        p[0] = get_constructor(p).cast(fold(scalar), 'str', p.lineno(2))
 
         if WITHCOMMENTS_PRODUCTIONS_DEBUG:
             print("----",file=sys.stderr)
         
 
-    @strict(tuple)
+    @strict(list)
     def p_scalar_group(self, p):
         """
         scalar_group    : SCALAR
@@ -356,7 +378,7 @@ class YAMLProductions(YAMLTokens):
             #p[0] = (str(p[1]),)
             wrapped_scalar_token1 = p[1]
             scalar_token1 = wrapped_scalar_token1.get_value()
-            p[0] = (str(scalar_token1),)
+            p[0] = [str(scalar_token1)]
 
         if len(p) == 3:
             if WITHCOMMENTS_PRODUCTIONS_DEBUG:
@@ -365,7 +387,8 @@ class YAMLProductions(YAMLTokens):
             #p[0] = p[1] + (str(p[2]),)
             wrapped_scalar_token2 = p[2]
             scalar_token2 = wrapped_scalar_token2.get_value()            
-            p[0] = p[1] + (str(scalar_token2),)
+            p[1].append(str(scalar_token2))
+            p[0] = p[1]
 
         if len(p) == 4:
             if WITHCOMMENTS_PRODUCTIONS_DEBUG:
@@ -373,7 +396,8 @@ class YAMLProductions(YAMLTokens):
             #p[0] = p[1] + (str(p[3]),)
             wrapped_scalar_token3 = p[3]
             scalar_token3 = wrapped_scalar_token3.get_value()            
-            p[0] = p[1] + (str(scalar_token3),)
+            p[1].append(str(scalar_token3))
+            p[0] = p[1]
 
         if WITHCOMMENTS_PRODUCTIONS_DEBUG:
             print("----",file=sys.stderr)
@@ -383,29 +407,36 @@ class YAMLProductions(YAMLTokens):
         ignore_indent_dedent    : INDENT DEDENT
         """
 
-    @strict(Sequence, Map)
-    def p_flow_collection(self, p):
+    @strict(Sequence)
+    def p_flow_collection__sequence(self, p):
         """
         flow_collection : F_SEQUENCE_START flow_sequence F_SEQUENCE_END
                         | F_SEQUENCE_START flow_sequence F_SEP F_SEQUENCE_END
-                        | F_MAP_START flow_map F_MAP_END
+        """
+        p[0] = get_constructor(p).sequence(p[2])
+
+    @strict(Map)
+    def p_flow_collection__map(self, p):
+        """
+        flow_collection : F_MAP_START flow_map F_MAP_END
                         | F_MAP_START flow_map F_SEP F_MAP_END
         """
-        p[0] = p[2]
+        p[0] = get_constructor(p).map(p[2])
 
-    @strict(Sequence)
+    @strict(list)
     def p_flow_sequence__last(self, p):
         """
         flow_sequence   : flow_sequence_item
         """
-        p[0] = Sequence(p[1])
+        p[0] = [p[1]]
 
-    @strict(Sequence)
+    @strict(list)
     def p_flow_sequence__init(self, p):
         """
         flow_sequence   : flow_sequence F_SEP flow_sequence_item
         """
-        p[0] = p[1] + Sequence(p[3])
+        p[1].append(p[3])
+        p[0] = p[1]
 
     @strict(Scalar)
     def p_flow_sequence_item(self, p):
@@ -414,19 +445,20 @@ class YAMLProductions(YAMLTokens):
         """
         p[0] = p[1]
 
-    @strict(Map)
+    @strict(list)
     def p_flow_map__last(self, p):
         """
         flow_map   : flow_map_item
         """
-        p[0] = Map(p[1])
+        p[0] = [p[1]]
 
-    @strict(Map)
+    @strict(list)
     def p_flow_map__init(self, p):
         """
         flow_map   : flow_map F_SEP flow_map_item
         """
-        p[0] = p[1] + Map(p[3])
+        p[1].append(p[3])
+        p[0] = p[1]
 
     @strict(tuple)
     def p_flow_map_item(self, p):
@@ -6,14 +6,15 @@ import sys
 
 from textwrap import dedent
 
+from .constructors import default_constructor
 from .utils import find_column, rollback_lexpos
 from ..exceptions import YAMLUnknownSyntaxError
 
 
 from ..nodes import *  # noqa
 
-#WITHCOMMENTS_TOKENS_DEBUG=False
-WITHCOMMENTS_TOKENS_DEBUG=True
+WITHCOMMENTS_TOKENS_DEBUG=False
+#WITHCOMMENTS_TOKENS_DEBUG=True
 
 class TokenList(object):
     tokens = [  # :off
@@ -92,14 +93,68 @@ class YAMLCommentedScalarToken():
         return YAMLCommentedScalarToken(str,lineno)
         
     
+class ParseContext(object):
+    """Comment attachment and construction state for a single parse.
+
+    Owned by one lexer instance, so concurrent parses never share it.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.constructor = default_constructor
+        self.clear_comments()
+
+    def clear_comments(self):
+        self.start_of_doc_comments = None
+        self.most_recent_scalar_node = None
+        self.most_recent_scalar_token = None
+
+    def set_scalar_token(self, t):
+        self.most_recent_scalar_node = None
+        self.most_recent_scalar_token = t
+
+    def set_scalar_node(self, node):
+        self.most_recent_scalar_node = node
+        self.most_recent_scalar_token = None
+
+    def append_comment(self, t):
+        # Guard, nothing to attach comments to
+        if not self.constructor.comments:
+            return
+
+        if self.most_recent_scalar_node:
+            if WITHCOMMENTS_TOKENS_DEBUG:
+                print(f"**** <append_comment> MRS.node = {self.most_recent_scalar_node}", file=sys.stderr)
+            self.most_recent_scalar_node.append_comment(t.value)
+        elif self.most_recent_scalar_token:
+            if WITHCOMMENTS_TOKENS_DEBUG:
+                print(f"**** <append_comment> MRS.token_value = {self.most_recent_scalar_token.value.get_value()}", file=sys.stderr)
+            self.most_recent_scalar_token.value.append_comment(t.lexer.lineno, t.value)
+        elif self.start_of_doc_comments:
+            # Start of Doc comment
+            if WITHCOMMENTS_TOKENS_DEBUG:
+                print(f"**** DocStart appending comment",file=sys.stderr)
+            self.start_of_doc_comments.append(t.value)
+        else:
+            if WITHCOMMENTS_TOKENS_DEBUG:
+                print(f"**** DocStart adding comment",file=sys.stderr)
+            self.start_of_doc_comments = [ t.value ]
+
+    def pop_doc_comments(self):
+        """Hand over comments collected for the current doc, then start afresh."""
+        comments = self.start_of_doc_comments
+        self.clear_comments()
+        return comments
+
+
 # noinspection PyMethodMayBeStatic,PyIncorrectDocstring,PySingleQuotedDocstring,PyPep8Naming
 class YAMLTokens(TokenList):
     def __init__(self):
         self.indent_stack = [1]
-        YAMLTokens.StartOfDocComments = None
-        YAMLTokens.MostRecentScalarNode = None        
-        YAMLTokens.MostRecentScalarToken = None
-        
+        self.context = ParseContext()
+
     def get_indent_status(self, t):        
         column = find_column(t)
         curr_depth, next_depth = self.indent_stack[-1], column
@@ -186,8 +241,7 @@ class YAMLTokens(TokenList):
         if WITHCOMMENTS_TOKENS_DEBUG:
             print(f"**** <t_doublequote_SCALAR>: {t}", file=sys.stderr)
         t.value = YAMLCommentedScalarToken(t.value,t.lineno)
-        YAMLTokens.MostRecentScalarNode = None
-        YAMLTokens.MostRecentScalarToken = t
+        self.context.set_scalar_token(t)
         return t
 
     def t_begin_doublequote(self, t):
@@ -210,25 +264,7 @@ class YAMLTokens(TokenList):
         r'[^\n]+'
         if WITHCOMMENTS_TOKENS_DEBUG:
             print(f"**** comment = {t.value}", file=sys.stderr)
-        if YAMLTokens.MostRecentScalarNode:
-            if WITHCOMMENTS_TOKENS_DEBUG:
-                print(f"**** <t_comment_ignore_COMMENT> MRS.node = {YAMLTokens.MostRecentScalarNode}", file=sys.stderr)
-            YAMLTokens.MostRecentScalarNode.append_comment(t.value)
-        else:
-            if YAMLTokens.MostRecentScalarToken:
-                if WITHCOMMENTS_TOKENS_DEBUG:
-                    print(f"**** <t_comment_ignore_COMMENT> MRS.token_value = {YAMLTokens.MostRecentScalarToken.value.get_value()}", file=sys.stderr)                    
-                YAMLTokens.MostRecentScalarToken.value.append_comment(t.lexer.lineno,t.value)
-            else:
-                # Start of Doc comment
-                if YAMLTokens.StartOfDocComments:
-                    if WITHCOMMENTS_TOKENS_DEBUG:
-                        print(f"**** DocStart appending comment",file=sys.stderr)
-                    YAMLTokens.StartOfDocComments.append(t.value)
-                else:
-                    if WITHCOMMENTS_TOKENS_DEBUG:
-                        print(f"**** DocStart adding comment",file=sys.stderr)
-                    YAMLTokens.StartOfDocComments = [ t.value ]
+        self.context.append_comment(t)
 
     
     def t_INITIAL_flowsequence_flowmap_begin_comment(self, t):
@@ -248,8 +284,7 @@ class YAMLTokens(TokenList):
         if WITHCOMMENTS_TOKENS_DEBUG:
             print(f"**** <t_singlequote_SCALAR>: {t}", file=sys.stderr)
         t.value = YAMLCommentedScalarToken(t.value,t.lineno)
-        YAMLTokens.MostRecentScalarNode = None        
-        YAMLTokens.MostRecentScalarToken = t        
+        self.context.set_scalar_token(t)
         return t
 
     def t_begin_singlequote(self, t):
@@ -273,8 +308,7 @@ class YAMLTokens(TokenList):
         if WITHCOMMENTS_TOKENS_DEBUG:
             print(f"**** <t_literal_SCALAR>: {t}", file=sys.stderr)
         t.value = YAMLCommentedScalarToken(t.value,t.lineno)
-        YAMLTokens.MostRecentScalarNode = None        
-        YAMLTokens.MostRecentScalarToken = t        
+        self.context.set_scalar_token(t)
         return t
 
     def t_begin_literal(self, t):
@@ -301,8 +335,7 @@ class YAMLTokens(TokenList):
             t.type = 'SCALAR'
             # print("**** !!!!! LITERAL END",file=sys.stderr)
             t.value = YAMLCommentedScalarToken(t.value,t.lineno)
-            YAMLTokens.MostRecentScalarNode = None        
-            YAMLTokens.MostRecentScalarToken = t        
+            self.context.set_scalar_token(t)
             
         return t
 
@@ -314,8 +347,7 @@ class YAMLTokens(TokenList):
         if WITHCOMMENTS_TOKENS_DEBUG:
             print(f"**** <t_fold_SCALAR>: {t}", file=sys.stderr)
         t.value = YAMLCommentedScalarToken(t.value,t.lineno)
-        YAMLTokens.MostRecentScalarNode = None
-        YAMLTokens.MostRecentScalarToken = t        
+        self.context.set_scalar_token(t)
         return t
 
     def t_begin_fold(self, t):
@@ -342,8 +374,7 @@ class YAMLTokens(TokenList):
             t.type = 'SCALAR'
             # print("**** !!!!! FOLD END",file=sys.stderr)
             t.value = YAMLCommentedScalarToken(t.value,t.lineno)
-            YAMLTokens.MostRecentScalarNode = None        
-            YAMLTokens.MostRecentScalarToken = t        
+            self.context.set_scalar_token(t)
             
         return t
 
@@ -364,8 +395,7 @@ class YAMLTokens(TokenList):
         if WITHCOMMENTS_TOKENS_DEBUG:
             print(f"**** <t_flowsequence_SCALAR>: {t}", file=sys.stderr)
         t.value = YAMLCommentedScalarToken(t.value,t.lineno)
-        YAMLTokens.MostRecentScalarNode = None        
-        YAMLTokens.MostRecentScalarToken = t        
+        self.context.set_scalar_token(t)
         return t
     
     def t_begin_flowsequence(self, t):
@@ -388,8 +418,7 @@ class YAMLTokens(TokenList):
         if WITHCOMMENTS_TOKENS_DEBUG:
             print(f"**** <t_flowmap_SCALAR>: {t}", file=sys.stderr)
         t.value = YAMLCommentedScalarToken(t.value,t.lineno)
-        YAMLTokens.MostRecentScalarNode = None        
-        YAMLTokens.MostRecentScalarToken = t        
+        self.context.set_scalar_token(t)
         return t
     
     def t_flowmap_F_MAP_KEY(self, t):
@@ -518,8 +547,7 @@ class YAMLTokens(TokenList):
         if WITHCOMMENTS_TOKENS_DEBUG:
             print(f"**** <t_SCALAR>: {t}", file=sys.stderr)
         t.value = YAMLCommentedScalarToken(t.value,t.lineno)
-        YAMLTokens.MostRecentScalarNode = None        
-        YAMLTokens.MostRecentScalarToken = t        
+        self.context.set_scalar_token(t)
         return t
 
 
@@ -9,13 +9,13 @@ from ..exceptions import YAMLStrictTypeError
 
 
 def strict(*types):
-    """Decorator, type check production rule output"""
+    """Decorator, type check production rule output, unless building python objects"""
 
     def decorate(func):
         @wraps(func)
         def wrapper(self, p):
             func(self, p)
-            if not isinstance(p[0], types):
+            if not isinstance(p[0], types) and get_constructor(p).strict:
                 raise YAMLStrictTypeError(p[0], types, func)
 
         wrapper.co_firstlineno = func.__code__.co_firstlineno
@@ -35,6 +35,16 @@ def find_column(t):
     return column
 
 
+def get_context(p):
+    """Get the per-parse state owned by the lexer driving this parse."""
+    return p.lexer.lexmodule.context
+
+
+def get_constructor(p):
+    """Get the constructor building this parse's output."""
+    return p.lexer.lexmodule.context.constructor
+
+
 def rollback_lexpos(t):
     t.lexer.lexpos -= len(t.value)
 
@@ -3,18 +3,16 @@
 """Node definitions for intermediary node tree."""
 from __future__ import absolute_import
 
-import re
 import sys
 import types
 
-from base64 import standard_b64decode, standard_b64encode
 from functools import partial
 from math import isnan
 
-from future.utils import implements_iterator, binary_type, text_type
-
+from . import binary
 from ._compat import collections_abc as abc, total_ordering
 from .exceptions import YAMLCastTypeError
+from .resolver import get_schema
 
 WITHCOMMENTS_NODES_DEBUG=False
 #WITHCOMMENTS_NODES_DEBUG=True
@@ -22,19 +20,42 @@ WITHCOMMENTS_NODES_DEBUG=False
 # noinspection PyMethodMayBeStatic
 @total_ordering
 class Node(object):
+    __slots__ = ('value', '_hash')
+
     def __init__(self, value, **kwargs):
-        self.raw_value = value
         self.value = self.init_value(self, value, **kwargs)
 
+    @property
+    def raw_value(self):
+        return self.value
+
     def init_value(self, *values, **kwargs):
         return values[0]
 
     def __eq__(self, other):
+        # Guard, shared by a ``NodePool``
+        if self is other:
+            return True
+
         try:
             return self.value == other.value and type(self) == type(other)
         except AttributeError:
             return False
 
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = self.hash_value()
+            return self._hash
+
+    def hash_value(self):
+        """
+        Structural hash, from the hashes of child nodes.  Cached by
+        ``__hash__``; nodes are not changed once built.
+        """
+        return hash((type(self), self.value))
+
     def __gt__(self, other):
         return self.value > other.value
 
@@ -55,14 +76,8 @@ class Node(object):
         return '<%s:%s>' % (cls_name, value)
 
 
-@implements_iterator
 class SequenceMixin(abc.Sequence):
-    value = NotImplemented
-
-    def __init__(self, *args, **kwargs):
-        # noinspection PyArgumentList
-        super(SequenceMixin, self).__init__(*args, **kwargs)
-        self._iter = iter(self.value)
+    __slots__ = ()
 
     def __getitem__(self, index):
         return self.value[index]
@@ -73,19 +88,17 @@ class SequenceMixin(abc.Sequence):
     def __contains__(self, x):
         return x in self.value
 
-    def __next__(self):
-        return next(self._iter)
-
     def __iter__(self):
-        return self
+        return iter(self.value)
 
 
 class Collection(SequenceMixin, Node):
+    """Node holding a tuple of child nodes, which is both its ``value`` and its ``raw_value``."""
+    __slots__ = ()
+
     # noinspection PyMissingConstructor
     def __init__(self, *values, **kwargs):
-        self.raw_value = values
         self.value = self.init_value(*values, **kwargs)
-        self._iter = iter(self.value)
 
     def init_value(self, *value, **kwargs):
         return value
@@ -102,55 +115,84 @@ class Collection(SequenceMixin, Node):
 
 
 class Docs(Collection):
-    pass
+    __slots__ = ()
 
 
 class Doc(Collection):
+    __slots__ = ('comments',)
+
+    def __init__(self, *values, **kwargs):
+        super(Doc, self).__init__(*values, **kwargs)
+        self.comments = None
 
     def has_comments(self):
-        return hasattr(self,'comments')
-    
-    def set_comments(self,comments):
+        return self.comments is not None
+
+    def set_comments(self, comments):
         self.comments = comments.copy()
 
     def get_comments(self):
-        if self.has_comments():
-            return self.comments
-        else:
-            return None
-        
+        return self.comments
+
 
 class Sequence(Collection):
-    pass
+    __slots__ = ()
 
-@implements_iterator
-class MappingMixin(abc.Mapping):
-    value = NotImplemented
 
-    def __init__(self, *args, **kwargs):
-        # noinspection PyArgumentList
-        super(MappingMixin, self).__init__(*args, **kwargs)
-        self._iter = iter(self.value)
+def index_key(node):
+    """Hashable stand-in for a scalar node, equal exactly when ``Scalar.__eq__`` is.  None for other keys."""
+    if isinstance(node, Scalar):
+        return type(node), str(node.value)
+    return None
+
+
+class MappingMixin(abc.Mapping):
+    __slots__ = ()
 
     def __getitem__(self, key):
-        for k, v in self.value:
-            if k == key:
-                return v
+        value = self._lookup_index(key)
+
+        # Guard, not a scalar key, compared with every key
+        if value is None and not isinstance(key, Scalar):
+            value = next((v for k, v in self.value if k == key), None)
+
+        if value is None:
+            raise KeyError('key %s not found in %r' % (key, self))
+        return value
+
+    def _lookup_index(self, key):
+        """Get the value of a scalar ``key`` from the index, built on first use.  None if not found, or not a scalar."""
+        lookup = index_key(key)
+        if lookup is None:
+            return None
 
-        raise KeyError('key %s not found in %r' % (key, self))
+        try:
+            index = self._index
+        except AttributeError:
+            index = self._index = self.build_index()
+        return index.get(lookup)
+
+    def build_index(self):
+        """Map ``index_key`` of each scalar key to its value, the first of any duplicates winning."""
+        index = {}
+        for k, v in self.value:
+            lookup = index_key(k)
+            if lookup is not None and lookup not in index:
+                index[lookup] = v
+        return index
 
     def __len__(self):
         return len(self.value)
 
-    def __next__(self):
-        _next = next(self._iter)[0]
-        return _next
-
     def __iter__(self):
-        return self
+        for k, _ in self.value:
+            yield k
 
 
 class Map(MappingMixin, Collection):
+    """Node holding a tuple of ``(key, value)`` node pairs.  Keys are indexed on the first lookup."""
+    __slots__ = ('_index',)
+
     def init_value(self, *values, **kwargs):
         for value in values:
             k, v = value
@@ -173,6 +215,12 @@ class Map(MappingMixin, Collection):
         if type(self) != type(other):
             return False
 
+        # Guard, shared by a ``NodePool``, or different content
+        if self is other:
+            return True
+        if hash(self) != hash(other):
+            return False
+
         for (self_key, self_value), (other_key, other_value) in zip(sorted(self.value), sorted(other.value)):
             if self_key != other_key:
                 return False
@@ -184,40 +232,55 @@ class Map(MappingMixin, Collection):
 
         return True
 
+    __hash__ = Node.__hash__
+
+    def hash_value(self):
+        # Key order does not matter to ``__eq__``.
+        return hash((type(self), frozenset(self.value)))
+
 
 class Scalar(Node):
+    """Node holding a python scalar, the source text it came from, and any comments on it."""
+    __slots__ = ('raw_value', 'comments', 'lineno')
     type = NotImplemented
 
     # noinspection PyMissingConstructor
     def __init__(self, value, *args, **kwargs):
-        has_comments = False
+        comments = lineno = None
 
         value_classname = type(value).__name__
         if WITHCOMMENTS_NODES_DEBUG:
             print(f"****## Scalar(): value_classname = {value_classname}",file=sys.stderr)
         
         if (value_classname == "YAMLCommentedScalarToken"):
-            if value.has_comments():                
-                has_comments = True
-                wrapped_commented_token = value
-            lineno = value.lineno
+            if value.has_comments():
+                if WITHCOMMENTS_NODES_DEBUG:
+                    print(f"****## Copying across comment: {value.comments}",file=sys.stderr)
+                comments = value.get_comments().copy()
+                lineno = value.lineno
             value = value.get_value()
             
         self.raw_value = value
         self.value = self.init_value(value, *args, **kwargs)
+        self.comments = comments
+        self.lineno = lineno
 
-        if has_comments:
-            if WITHCOMMENTS_NODES_DEBUG:            
-                print(f"****## Copying across comment: {wrapped_commented_token.comments}",file=sys.stderr)
-            self.lineno = lineno
-            self.comments = wrapped_commented_token.get_comments().copy()
-            
     def init_value(self, value, *args, **kwargs):
-        return self.type(value)
+        return self.to_python(value, *args, **kwargs)
+
+    @classmethod
+    def to_python(cls, value, *args, **kwargs):
+        """Convert scalar text to its python value, without building a node."""
+        return cls.type(value)
 
     def __eq__(self, other):
         return str(self.value) == str(other.value) and type(self) == type(other)
 
+    __hash__ = Node.__hash__
+
+    def hash_value(self):
+        return hash(index_key(self))
+
     def __gt__(self, other):
         return str(self.value) > str(other.value)
 
@@ -226,7 +289,7 @@ class Scalar(Node):
 
     # ****
     def has_comments(self):
-        return hasattr(self,'comments')
+        return self.comments is not None
 
     def append_comment(self, comment):
         if self.has_comments():
@@ -239,53 +302,56 @@ class Scalar(Node):
 
             
     def get_comments(self):
-        returned_comments = None
-        
-        if self.has_comments():
-            returned_comments = self.comments
-
-        return returned_comments
+        return self.comments
     
             
 class Null(Scalar):
+    __slots__ = ()
     type = None
 
-    def init_value(self, *values, **kwargs):
+    @classmethod
+    def to_python(cls, *values, **kwargs):
         return None
 
 
 class Str(Scalar):
+    __slots__ = ()
     type = str
 
-    def init_value(self, value, *args, **kwargs):
+    @classmethod
+    def to_python(cls, value, *args, **kwargs):
         if value is None:
             return ''
-        return super(Str, self).init_value(value, *args, **kwargs)
+        return super(Str, cls).to_python(value, *args, **kwargs)
 
 
 class Int(Scalar):
+    __slots__ = ()
     type = int
 
-    def init_value(self, value, base=None, *args, **kwargs):
+    @classmethod
+    def to_python(cls, value, base=None, *args, **kwargs):
         if base is not None:
-            return self.type(value, base=base)
+            return cls.type(value, base=base)
 
-        return self.type(value)
+        return cls.type(value)
 
 
 class Float(Scalar):
+    __slots__ = ()
     type = float
 
-    def init_value(self, value, *args, **kwargs):
+    @classmethod
+    def to_python(cls, value, *args, **kwargs):
         # Guard, inf and nan
         if isinstance(value, str):
             value_lower = value.lower().replace('.', '')
             if value_lower.endswith('inf'):
-                return self.type(value_lower)
+                return cls.type(value_lower)
             if value_lower.endswith('nan'):
-                return self.type(value_lower)
+                return cls.type(value_lower)
 
-        return self.type(value)
+        return cls.type(value)
 
     def __eq__(self, other):
         # Guard, we're not doing math.
@@ -294,36 +360,68 @@ class Float(Scalar):
 
         return super(Float, self).__eq__(other)
 
+    __hash__ = Scalar.__hash__
+
 
 class Bool(Scalar):
+    __slots__ = ()
     type = bool
     TRUE_VALUES = ['TRUE', 'YES', '1']
     FALSE_VALUES = ['FALSE', 'NO', '0']
+    VALUES = dict([(value, True) for value in TRUE_VALUES] + [(value, False) for value in FALSE_VALUES])
 
-    def init_value(self, value, *args, **kwargs):
-        str_value = str(value).upper()
-        possible_values = self.TRUE_VALUES + self.FALSE_VALUES
-        if str_value not in possible_values:
-            cls_name = self.__class__.__name__
+    @classmethod
+    def to_python(cls, value, *args, **kwargs):
+        try:
+            return cls.VALUES[str(value).strip().upper()]
+        except KeyError:
+            cls_name = cls.__name__
             msg = 'Unknown %s value: %r not in %s'
-            raise ValueError(msg % (cls_name, value, possible_values))
-        return str_value in self.TRUE_VALUES
+            raise ValueError(msg % (cls_name, value, cls.TRUE_VALUES + cls.FALSE_VALUES))
 
 
 class Binary(Scalar):
+    """
+    ``!!binary`` scalar.  Holds the base64 text or the bytes, converting one to
+    the other on first use: parsed text is decoded when ``value`` is read,
+    and ``from_decoded`` bytes are encoded when ``raw_value`` is.
+    """
+    __slots__ = ('_data', '_text')
     type = 'binary'
 
     def init_value(self, value, *args, **kwargs):
-        if isinstance(value, text_type):
-            value = binary_type(value, 'ascii')
-        return standard_b64decode(value)
+        # Decoded on first access.
+        return None
+
+    @property
+    def value(self):
+        if self._data is None:
+            self._data = self.to_python(self._text)
+        return self._data
+
+    @value.setter
+    def value(self, value):
+        self._data = value
+
+    @property
+    def raw_value(self):
+        if self._text is None:
+            self._text = binary.encode(self._data)
+        return self._text
+
+    @raw_value.setter
+    def raw_value(self, value):
+        self._text = value
+
+    @classmethod
+    def to_python(cls, value, *args, **kwargs):
+        return binary.decode(value)
 
     @classmethod
     def from_decoded(cls, data):
         self = cls.__new__(cls)
-        self.raw_value = data
-        self.raw_value = standard_b64encode(data).decode('ascii')
-        self.value = standard_b64decode(self.raw_value)
+        self._data, self._text = data, None
+        self.comments = self.lineno = None
         return self
 
 
@@ -342,24 +440,44 @@ class ScalarDispatch(object):
         'binary': Binary,
     }  # :on
 
-    re_dispatch = re.compile(r"""
-        ^ (?P<null> (?i) null $| ~ $)
-        | (?P<bool> (?i) true $| false $| yes $| no $)
-        | (?P<int10> [-+]? [0-9]+ $)
-        | (?P<int8> 0o [0-7]+ $)
-        | (?P<int16> 0x [0-9a-fA-F]+ $)
-        | (?P<float>[-+]? (?:
-            (?: [0-9]* \. [0-9]+ |  [0-9]+ \. [0-9]* )
-                (?: [eE] [-+]? [0-9]+ )? $|
-            [0-9]* \.? [0-9]* [eE] [-+]? [0-9]+ ) $
-          )
-        | (?P<infinity> [-+]? (?: \.inf | \.Inf | \.INF) $)
-        | (?P<nan> [-+]? (?: \.nan | \.NaN | \.NAN) $)
-        | (?P<str> .+ $)
-    """, re.X)
-
-    def __new__(cls, value, cast=None):  # noqa
-        
+    python_map = {  # :off
+        'null': Null.to_python,
+        'bool': Bool.to_python,
+        'int': Int.to_python,
+        'int10': partial(Int.to_python, base=10),
+        'int8': partial(Int.to_python, base=8),
+        'int16': partial(Int.to_python, base=16),
+        'float': Float.to_python,
+        'infinity': Float.to_python,
+        'nan': Float.to_python,
+        'str': Str.to_python,
+        'binary': Binary.to_python,
+    }  # :on
+
+    def __new__(cls, value, cast=None, schema=None):  # noqa
+        return cls.classify(value, cast=cast, schema=schema)(value)
+
+    @classmethod
+    def resolve(cls, value, cast=None, schema=None):
+        """Convert scalar text straight to its python value, skipping the node."""
+        # Guard, plain scalar text, resolved in one pass
+        if cast is None and isinstance(value, str):
+            return get_schema(schema).resolve(value)[1]
+
+        return cls.python_map[cls.tag(value, cast=cast, schema=schema)](value)
+
+    @classmethod
+    def classify(cls, value, cast=None, schema=None):
+        """Get the node class for scalar text."""
+        return cls.map[cls.tag(value, cast=cast, schema=schema)]
+
+    @classmethod
+    def tag(cls, value, cast=None, schema=None):
+        """
+        Get the ``map`` key for scalar text, or an explicit ``cast``.
+
+        :param schema: ``Schema``, or schema name, resolving plain scalars.
+        """
         value_classname = type(value).__name__
         if (value_classname == "YAMLCommentedScalarToken"):
             inner_value = value.get_value()
@@ -367,70 +485,156 @@ class ScalarDispatch(object):
             # Not in a wrapped up Scalar situation
             # => set 'inner_value' to be the same as 'value'
             inner_value = value
-            
+
         # Guard, explicit casting
         if cast is not None:
-            try:
-                if WITHCOMMENTS_NODES_DEBUG:
-                    print("****## <DispatchScalar>__new__: Explicit cast",file=sys.stderr)
-                return cls.map[cast](value)
-            except KeyError:
-                raise YAMLCastTypeError(cast=cast)
+            return cls.cast_tag(cast)
 
         # Guard, already casted
         inner_type_name = type(inner_value).__name__
         if not isinstance(inner_value, str) and inner_type_name in cls.map:
             if WITHCOMMENTS_NODES_DEBUG:
                 print("****## <DispatchScalar>__new__: Already cast????",file=sys.stderr)
-            return cls.map[type_name](value)
+            return inner_type_name
 
-        # Guard, empty value
-        inner_value = inner_value.strip()
-        if inner_value == '':
-            if WITHCOMMENTS_NODES_DEBUG:
-                print("****## <DispatchScalar>__new__: NULL value given",file=sys.stderr)
-            return Null(value)
+        tag, _ = get_schema(schema).resolve(inner_value)
+        if WITHCOMMENTS_NODES_DEBUG:
+            print(f"****## <DispatchScalar>__new__: Dynamic cast: <{tag}>",file=sys.stderr)
+        return tag
 
-        match = cls.re_dispatch.match(inner_value)
-        try:
-            if WITHCOMMENTS_NODES_DEBUG:
-                print(f"****## <DispatchScalar>__new__: Dynamic cast: <{match.lastgroup}>",file=sys.stderr)
-            return cls.map[match.lastgroup](value)
-        except AttributeError:
-            message = 'Cannot cast data: {value}'.format(value=value)
-            raise YAMLCastTypeError(message=message)
+    @classmethod
+    def cast_tag(cls, cast):
+        """Check an explicit ``cast`` is a ``map`` key."""
+        if cast not in cls.map:
+            raise YAMLCastTypeError(cast=cast)
+        if WITHCOMMENTS_NODES_DEBUG:
+            print("****## <DispatchScalar>__new__: Explicit cast",file=sys.stderr)
+        return cast
+
+
+def pool_key(node):
+    """
+    Key a node is shared by in a ``NodePool``.  Collections are keyed by their
+    children's identity, in order: the children are pooled first, and a key
+    order that ``Map`` equality ignores must still be kept.
+    """
+    if isinstance(node, Map):
+        return type(node), tuple((id(key), id(value)) for key, value in node.value)
+    if isinstance(node, Collection):
+        return type(node), tuple(id(item) for item in node.value)
+    return node
+
+
+class NodePool(object):
+    """
+    Hash-consing pool: equal scalars, and collections of the same pooled
+    children in the same order, share one node.
+
+    Pass to ``NodeConstructor`` so repeated blocks are built once per pool.
+    Nodes carrying comments are never shared.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+
+    def intern(self, node):
+        """Get the pooled node equal to ``node``, adding ``node`` if there is none.  See ``pool_key``."""
+        # Guard, comments belong to one place in the source
+        if getattr(node, 'comments', None):
+            return node
+
+        return self.nodes.setdefault(pool_key(node), node)
+
+    def __len__(self):
+        return len(self.nodes)
+
+
+class DispatchTable(dict):
+    """
+    ``{class: visit function}`` of a visitor class, filled as classes are met.
+    Classes other than nodes, of results passed back up, map to None.
+    """
+
+    def __init__(self, visitor_class):
+        super(DispatchTable, self).__init__()
+        self.visitor_class = visitor_class
+
+    def __missing__(self, cls):
+        func = self[cls] = self.visitor_class.find_visit(cls) if issubclass(cls, Node) else None
+        return func
 
 
 # noinspection PyMethodMayBeStatic
 class NodeVisitor(object):
+    """
+    Walk a node tree without recursion, calling ``visit_<NodeClass>`` for each node.
+
+    A method either returns the node's result, or is a generator that yields
+    child nodes, is sent each child's result, and yields its own result last.
+    Methods are looked up once per node class, along its MRO, and leaves that
+    return a result never touch the generator stack.
+    """
+
     def __init__(self, *args, **kwargs):
         pass
 
+    @classmethod
+    def dispatch_table(cls):
+        """``DispatchTable`` of this visitor class."""
+        try:
+            return cls.__dict__['_dispatch_table']
+        except KeyError:
+            cls._dispatch_table = DispatchTable(cls)
+            return cls._dispatch_table
+
+    @classmethod
+    def find_visit(cls, node_class):
+        """Find the visit function for a node class, along its MRO."""
+        for base in node_class.__mro__:
+            func = getattr(cls, 'visit_%s' % base.__name__, None)
+            if func is not None:
+                return func
+        return cls.generic_visit
+
     def visit(self, node):
-        stack = [node]
-        last_result = None
+        # Guard, nothing to visit
+        if not isinstance(node, Node):
+            return node
+
+        result = self.call_visit(node)
+        if type(result) is not types.GeneratorType:
+            return result
+
+        return self.run(result)
+
+    def call_visit(self, node):
+        """Call the visit function of ``node``: its result, or a generator for ``run`` to drive."""
+        return self.dispatch_table()[type(node)](self, node)
+
+    def run(self, generator):
+        """Drive a visit generator, and the generators of the children it yields, on one stack."""
+        table, generator_type = self.dispatch_table(), types.GeneratorType
+
+        stack, value = [generator], None
         while stack:
             try:
-                last = stack[-1]
-                if isinstance(last, types.GeneratorType):
-                    sent = last.send(last_result)
-                    stack.append(sent)
-                    last_result = None
-                elif isinstance(last, Node):
-                    stack.append(self._visit(stack.pop()))
-                else:
-                    last_result = stack.pop()
+                item = stack[-1].send(value)
             except StopIteration:
                 stack.pop()
-        return last_result
+                continue
+
+            func = table[type(item)]
+            # Guard, a result passed back up, not a child node
+            if func is None:
+                value = item
+                continue
 
-    def _visit(self, node):
-        method_name = 'visit_%s' % type(node).__name__
-        method = getattr(self, method_name, None)
+            value = func(self, item)
+            if type(value) is generator_type:
+                stack.append(value)
+                value = None
 
-        if method is None:
-            method = self.generic_visit
-        return method(node)
+        return value
 
     def generic_visit(self, node):
         raise RuntimeError('No visit_%s method' % type(node).__name__)
@@ -439,4 +643,4 @@ class NodeVisitor(object):
 __all__ = ['Node', 'Collection', 'Docs', 'Doc',
            'Sequence', 'Map',
            'Scalar', 'Null', 'Str', 'Int', 'Float', 'Bool', 'Binary',
-           'ScalarDispatch', 'NodeVisitor', ]
+           'ScalarDispatch', 'NodePool', 'NodeVisitor', ]
@@ -3,21 +3,35 @@
 from __future__ import absolute_import
 
 import logging
+import os
+import sys
+from contextlib import contextmanager
+from hashlib import sha1
+from importlib import import_module
 from os import environ
+from threading import Lock
 
 from .exceptions import YAMLSyntaxError, YAMLUnknownSyntaxError
 from .grammar.productions import YAMLProductions
 from .grammar.tokens import YAMLTokens
+from .ply import lex as ply_lex, yacc as ply_yacc
 from .ply.lex import lex
 from .ply.yacc import yacc
 
 OPTIMIZE = environ.get('PUREYAML_OPTIMIZE', 'true').lower() == 'true'
 
+LEXTAB = 'pureyaml.grammar._lextab'
+PARSETAB = 'pureyaml.grammar._parsetab'
+
 logger = logging.getLogger(__name__)
 
 lex_logger = logging.getLogger('pureyaml.ply.lex')
 yacc_logger = logging.getLogger('pureyaml.ply.yacc')
 
+_shared_parser = None
+_shared_parser_lock = Lock()
+_tables_current = None
+
 
 # noinspection PyMethodMayBeStatic
 class YAMLLexer(YAMLTokens):
@@ -27,25 +41,88 @@ class YAMLLexer(YAMLTokens):
         kwargs.setdefault('module', self)
         kwargs.setdefault('debuglog', lex_logger)
         kwargs.setdefault('errorlog', lex_logger)
-        if OPTIMIZE or kwargs.get('optimize', False):
-            kwargs.setdefault('lextab', 'pureyaml.grammar._lextab')
-            kwargs.setdefault('optimize', True)
-        return lex(**kwargs)
+        # ply writes lextab whenever it optimizes without one; tables are only written by write_tables()
+        kwargs['optimize'] = (OPTIMIZE or kwargs.get('optimize', False)) and tables_are_current()
+        if kwargs['optimize']:
+            kwargs.setdefault('lextab', LEXTAB)
+        lexer = lex(**kwargs)
+        # productions reach per-parse state through ``p.lexer.lexmodule``
+        lexer.lexmodule = self
+        return lexer
+
+    @classmethod
+    def pool(cls):
+        """Default :class:`LexerPool` for this lexer class."""
+        pool = cls.__dict__.get('_pool')
+        if pool is None:
+            pool = cls._pool = LexerPool(cls)
+        return pool
 
     @classmethod
-    def tokenize(cls, data):
-        lexer = cls.build()
-        lexer.input(data)
-        while True:
-            token = lexer.token()
-            if not token:
-                break
-            yield token
+    def tokenize(cls, data, lexers=None):
+        lexers = lexers or cls.pool()
+        with lexers.lexer() as lexer:
+            lexer.input(data)
+            while True:
+                token = lexer.token()
+                if not token:
+                    break
+                yield token
+
+    def reset(self, lexer):
+        """Rewind ``lexer``, driven by this instance, to a fresh start."""
+        self.indent_stack = [1]
+        self.context.reset()
+        lexer.lexstatestack = []
+        lexer.begin('INITIAL')
+        lexer.lineno = 1
+        lexer.lexdata = None
+        return lexer
 
     def t_ANY_error(self, t):
         raise YAMLSyntaxError(t, t.value[0])
 
 
+class LexerPool(object):
+    """
+    Recycle lexers between parses.
+
+    Building a lexer re-reads the lex tables and rebinds every rule, so idle
+    lexers are reset and handed out again instead.  New ones are built rather
+    than ``clone()``-d: ply's ``clone(object)`` keeps only the last master
+    regex of each state, which loses rules in states like ``tag``.
+    """
+
+    def __init__(self, lexer_class=None, maxsize=16, **kwargs):
+        self.lexer_class = lexer_class or YAMLLexer
+        self.maxsize = maxsize
+        self.build_kwargs = kwargs
+        self._idle = []
+        self._lock = Lock()
+
+    def acquire(self):
+        with self._lock:
+            lexer = self._idle.pop() if self._idle else None
+
+        if lexer is None:
+            return self.lexer_class.build(**self.build_kwargs)
+        return lexer.lexmodule.reset(lexer)
+
+    def release(self, lexer):
+        lexer.lexmodule.reset(lexer)
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(lexer)
+
+    @contextmanager
+    def lexer(self):
+        lexer = self.acquire()
+        try:
+            yield lexer
+        finally:
+            self.release(lexer)
+
+
 # noinspection PyMethodMayBeStatic
 class YAMLParser(YAMLProductions):
     # noinspection PyMissingConstructor
@@ -55,26 +132,50 @@ class YAMLParser(YAMLProductions):
         self.optimize = OPTIMIZE or kwargs.get('optimize')
 
         kwargs.setdefault('module', self)
-        kwargs.setdefault('tabmodule', 'pureyaml.grammar._parsetab')
+        kwargs.setdefault('tabmodule', PARSETAB)
+        kwargs.setdefault('write_tables', False)
+        if self.optimize and tables_are_current():
+            # grammar_hash() already vouches for the tables, skip ply's signature check
+            kwargs.setdefault('optimize', True)
         kwargs.setdefault('debugfile', '_parser.out')
         kwargs.setdefault('debuglog', yacc_logger)
         kwargs.setdefault('errorlog', yacc_logger)
         self.parser = yacc(**kwargs)
+        self.lexers = LexerPool(YAMLLexer, optimize=self.optimize)
 
-    def parse(self, data, **kwargs):
+    def parse(self, data, constructor=None, lineno=None, **kwargs):
+        """
+        Parse yaml text.
+
+        :param constructor: Build the output with this, e.g. a
+            ``PythonConstructor``, instead of the node tree.
+        :param int lineno: Line number of the first line of ``data``, when it
+            was cut from a larger text.
+        """
         kwargs.setdefault('debug', False)
-        kwargs.setdefault('lexer', YAMLLexer.build(optimize=self.optimize))
-        return self.parser.parse(data, **kwargs)
+        if 'lexer' in kwargs:
+            return self._parse(data, constructor, lineno, **kwargs)
+
+        with self.lexers.lexer() as lexer:
+            return self._parse(data, constructor, lineno, lexer=lexer, **kwargs)
+
+    def _parse(self, data, constructor, lineno, lexer, **kwargs):
+        if constructor is not None:
+            lexer.lexmodule.context.constructor = constructor
+        if lineno is not None:
+            lexer.lineno = lineno
+        return self.parser.parse(data, lexer=lexer, **kwargs)
 
     def parsedebug(self, data, **kwargs):
         logger.info('\n'.join(repr(token) for token in self.tokenize(data)))
-        kwargs.setdefault('lexer', YAMLLexer.build(debug=True, optimize=False))
+        if 'lexer' not in kwargs:
+            kwargs['lexer'] = YAMLLexer.build(debug=True, optimize=False)
         kwargs.setdefault('debug', True)
 
         return self.parser.parse(data, **kwargs)
 
     def tokenize(self, data):
-        tokens = YAMLLexer.tokenize(data)
+        tokens = YAMLLexer.tokenize(data, lexers=self.lexers)
         return list(tokens)
 
     def p_error(self, p):
@@ -83,3 +184,85 @@ class YAMLParser(YAMLProductions):
             raise YAMLUnknownSyntaxError('Unknown origin %r' % p)
 
         raise YAMLSyntaxError(p)
+
+
+def get_parser():
+    """
+    Get the process-wide parser, building it on first use.
+
+    Running ``yacc()`` reloads the parse tables and re-checks the grammar
+    signature, so it is done once.  Per-parse state lives on the lexer, which
+    makes the returned parser safe to share between calls and threads.
+    """
+    global _shared_parser
+
+    if _shared_parser is None:
+        with _shared_parser_lock:
+            if _shared_parser is None:
+                _shared_parser = YAMLParser()
+    return _shared_parser
+
+
+def grammar_hash():
+    """Fingerprint of the token rules and productions the tables are built from."""
+    digest = sha1()
+    parts = [ply_lex.__tabversion__, ply_yacc.__tabversion__]
+    parts.extend(repr(getattr(YAMLParser, name, None)) for name in ('tokens', 'states', 'literals', 'start'))
+    for name in sorted(set(dir(YAMLLexer)) | set(dir(YAMLParser))):
+        if not name.startswith(('t_', 'p_')):
+            continue
+        rule = getattr(YAMLLexer, name, None) or getattr(YAMLParser, name)
+        parts.append('%s=%s' % (name, rule.__doc__ if callable(rule) else rule))
+
+    digest.update('\n'.join(parts).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def tables_are_current():
+    """
+    Check the shipped ``_lextab`` and ``_parsetab`` against :func:`grammar_hash`.
+
+    The answer is cached for the life of the process.  When it is ``False`` the
+    tables are rebuilt in memory, and never written, so read-only installs work.
+    """
+    global _tables_current
+
+    if _tables_current is None:
+        expected = grammar_hash()
+        try:
+            hashes = [getattr(import_module(name), '_grammar_hash', None) for name in (LEXTAB, PARSETAB)]
+        except ImportError:
+            hashes = []
+        _tables_current = hashes == [expected, expected]
+    return _tables_current
+
+
+def write_tables():
+    """
+    Regenerate ``_lextab`` and ``_parsetab`` in the package, stamped with :func:`grammar_hash`.
+
+    Run at build time, from ``setup.py build_py`` or ``make tables``.
+    """
+    global _tables_current
+
+    outputdir = os.path.dirname(import_module('pureyaml.grammar').__file__)
+    for name in (LEXTAB, PARSETAB):
+        sys.modules.pop(name, None)
+        filename = os.path.join(outputdir, name.rsplit('.', 1)[-1] + '.py')
+        if os.path.exists(filename):
+            os.remove(filename)
+
+    stamp = '_grammar_hash = %r\n' % grammar_hash()
+
+    lexer = lex(module=YAMLLexer(), optimize=False, debuglog=lex_logger, errorlog=lex_logger)
+    lexer.writetab(LEXTAB, outputdir)
+    # an unbuilt parser, yacc only needs its bound p_* rules
+    yacc(module=YAMLParser.__new__(YAMLParser), tabmodule=PARSETAB, outputdir=outputdir, debug=False,
+         write_tables=True, debuglog=yacc_logger, errorlog=yacc_logger)
+
+    for name in (LEXTAB, PARSETAB):
+        with open(os.path.join(outputdir, name.rsplit('.', 1)[-1] + '.py'), 'a') as tabfile:
+            tabfile.write(stamp)
+
+    _tables_current = None
+    return tables_are_current()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Cut a yaml document down to selected key paths before it is parsed."""
+from __future__ import absolute_import
+
+import re
+
+from ._compat import string_types
+from .stream import DOC_END, DOC_START, is_marker
+
+KEEP = True
+
+# :off
+KEY_LINE = re.compile(r"""
+    (?P<indent> \ * )
+    (?:
+        " (?P<double> (?: [^"\\] | \\. )* ) "
+      | ' (?P<single> (?: [^'] | '' )* ) '
+      | (?P<plain>
+            [^\s\#'"\-?:\[\]{},|>!&*%@`] (?: [^\#:\n] | :(?=\S) | (?<=\S)\# )*?
+          | -(?=\S) (?: [^\#:\n] | :(?=\S) )*?
+        )
+    )
+    \ * : (?: [\ \t]+ (?P<rest> .*? ) )? [\ \t]* \r?\n? \Z
+""", re.X)
+# :on
+
+
+def parse_paths(select):
+    """
+    Build a selection tree from key paths.
+
+    Each path is a dotted string, ``'spec.template'``, or a sequence of keys.
+    Branches map keys to sub-trees, and a selected key maps to ``KEEP``.
+    """
+    tree = {}
+    for path in select:
+        keys = path.split('.') if isinstance(path, string_types) else [str(key) for key in path]
+        branch = tree
+        for key in keys[:-1]:
+            child = branch.setdefault(key, {})
+            if child is KEEP:
+                break
+            branch = child
+        else:
+            branch[keys[-1]] = KEEP
+    return tree
+
+
+def match_key(line):
+    """Get ``(indent, key, rest)`` for a ``key: value`` line, else None.  ``rest`` is the text after ``:``."""
+    match = KEY_LINE.match(line)
+    if match is None:
+        return None
+
+    double, single, plain = match.group('double', 'single', 'plain')
+    if double is not None:
+        key = double.encode('latin-1', 'backslashreplace').decode('unicode_escape')
+    elif single is not None:
+        key = single.replace("''", "'")
+    else:
+        key = plain.strip()
+
+    rest = match.group('rest') or ''
+    return len(match.group('indent')), key, '' if rest.startswith('#') else rest
+
+
+def indent_of(line):
+    return len(line) - len(line.lstrip(' '))
+
+
+def is_blank(line):
+    stripped = line.strip()
+    return not stripped or stripped.startswith('#')
+
+
+def owns(indent, line, column):
+    """True if ``line`` belongs to the value of a key at ``column``, ``-`` items included."""
+    return indent > column or (indent == column and line.lstrip(' ')[:1] == '-' and line.lstrip(' ')[1:2] in ' \r\n')
+
+
+class Projector(object):
+    """
+    State of ``project``, fed one line at a time.
+
+    ``stack`` holds a frame per key a selected path runs through:
+    ``(column of its key, selection branch, index of its key line)``.
+    ``region`` is ``'keep'`` or ``'skip'`` while lines belong to a value kept
+    or blanked whole, the value of a key at ``region_column``.
+    """
+
+    def __init__(self, lines, tree):
+        self.out = list(lines)
+        self.stack = [(-1, tree, None)]
+        self.kept = []
+        self.region, self.region_column = None, None
+
+    def feed(self, index, line):
+        if is_marker(line, DOC_START) or is_marker(line, DOC_END) or line.startswith('%'):
+            return self.marker(index, line)
+
+        indent = indent_of(line)
+        if self.in_region(index, line, indent):
+            return
+
+        if is_blank(line):
+            return self.blank(index)
+
+        self.close_to(indent, line)
+        self.key_line(index, line, indent)
+
+    def marker(self, index, line):
+        """Close every frame at a document marker or directive.  A ``--- value`` line keeps its document whole."""
+        self.close_all()
+        self.region = None
+        if is_marker(line, DOC_START) and not is_blank(line[3:]):
+            self.region, self.region_column = 'keep', -1
+        self.kept.append(index)
+
+    def in_region(self, index, line, indent):
+        """Keep or blank a line of the current region.  False, ending the region, if ``line`` is not part of it."""
+        if self.region is None or not (is_blank(line) or owns(indent, line, self.region_column)):
+            self.region = None
+            return False
+
+        self.mark(self.region, index)
+        return True
+
+    def key_line(self, index, line, indent):
+        """Select a line of the innermost frame's block map: keep it, blank it, or open a frame under it."""
+        column, branch, _ = self.stack[-1]
+        matched = match_key(line)
+        if matched is None:
+            # Not a block map: keep the whole value of the enclosing key.
+            return self.start_region('keep', column, index)
+
+        _, key, rest = matched
+        selected = branch.get(key)
+        if selected is None:
+            self.start_region('skip', indent, index)
+        elif selected is KEEP or rest:
+            self.start_region('keep', indent, index)
+        else:
+            self.stack.append((indent, selected, index))
+            self.kept.append(index)
+
+    def start_region(self, region, column, index):
+        self.region, self.region_column = region, column
+        self.mark(region, index)
+
+    def mark(self, region, index):
+        if region == 'skip':
+            self.blank(index)
+        else:
+            self.kept.append(index)
+
+    def blank(self, index):
+        line = self.out[index]
+        self.out[index] = line[len(line.rstrip('\r\n')):]
+
+    def close_to(self, indent, line):
+        """Close the frames ``line`` is not part of."""
+        while self.stack[-1][0] >= indent and not owns(indent, line, self.stack[-1][0]):
+            self.close(self.stack.pop())
+
+    def close_all(self):
+        while len(self.stack) > 1:
+            self.close(self.stack.pop())
+
+    def close(self, frame):
+        # A branch key with nothing selected below it would be an empty value.
+        if frame[2] is not None and self.kept[-1] == frame[2]:
+            self.blank(frame[2])
+            self.kept.pop()
+
+
+def project(lines, select):
+    """
+    Blank every line outside the selected key paths.
+
+    Works on block maps by indentation, column by column, like the lexer's
+    indent stack: an unselected key and everything indented under it is
+    blanked, so it is never tokenized.  A selected key keeps its whole value.
+    Keys are kept while a path runs through a nested block map; any other value
+    on the way is kept whole.  Blanked lines keep their line ending, so line
+    numbers do not change.
+
+    :param list lines: Lines of the document, with their line endings.
+    :param select: Key paths, see ``parse_paths``.
+    :return: Projected text.
+    """
+    projector = Projector(lines, parse_paths(select))
+    for index, line in enumerate(lines):
+        projector.feed(index, line)
+    projector.close_all()
+
+    return ''.join(projector.out)
+
+
+__all__ = ['parse_paths', 'project']
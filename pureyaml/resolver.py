@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Resolve plain scalar text to a type tag and python value, per schema."""
+from __future__ import absolute_import
+
+import re
+from functools import lru_cache
+from itertools import product
+
+from .exceptions import YAMLCastTypeError
+
+CACHE_SIZE = 4096
+
+DIGITS = '0123456789'
+
+
+def any_case(*words):
+    """Every upper/lower case spelling of ``words``."""
+    for word in words:
+        for chars in product(*[set(char.lower() + char.upper()) for char in word]):
+            yield ''.join(chars)
+
+
+def signed(*words):
+    for word in words:
+        for sign in ('', '+', '-'):
+            yield sign + word
+
+
+class Schema(object):
+    """
+    Resolve plain scalar text to ``(tag, value)``, ``tag`` being a ``ScalarDispatch.map`` key.
+
+    ``words`` maps exact text to its result.  ``patterns`` are
+    ``(first characters, regex, tag, convert)``, compiled into a table keyed by
+    first character, so text only meets the regexes it could match.  Results
+    are cached, scalar values being immutable.
+    """
+    name = NotImplemented
+    words = {}
+    patterns = ()
+    empty = ('null', None)
+    strict = False
+
+    def __init__(self, cache_size=CACHE_SIZE):
+        resolve = self.compile()
+        if self.strict:
+            resolve = self.strict_resolver(resolve)
+        self.resolve = lru_cache(maxsize=cache_size)(resolve)
+
+    def compile(self):
+        """Build an uncached ``resolve`` function, with this schema's tables bound as locals."""
+        empty = self.empty
+        get_word, get_entries = self.words.get, self.build_table().get
+
+        def resolve(text):
+            stripped = text.strip()
+
+            # Guard, empty value
+            if not stripped:
+                return empty
+
+            word = get_word(stripped)
+            if word is not None:
+                return word
+
+            for match, tag, convert in get_entries(stripped[0], ()):
+                if match(stripped):
+                    return tag, convert(stripped)
+
+            return 'str', text
+
+        return resolve
+
+    def build_table(self):
+        """Compile ``patterns`` into lists of ``(match, tag, convert)``, keyed by first character."""
+        table = {}
+        for chars, pattern, tag, convert in self.patterns:
+            entry = re.compile(pattern + r'\Z', re.X).match, tag, convert
+            for char in chars:
+                table.setdefault(char, []).append(entry)
+        return table
+
+    def strict_resolver(self, resolve):
+        """Wrap ``resolve`` to raise on text no word or pattern matches, instead of returning a ``str``."""
+        name = self.name
+
+        def strict_resolve(text):
+            result = resolve(text)
+            if result[0] == 'str':
+                message = 'Cannot resolve plain scalar {0!r} in the {1} schema, quote strings'.format(text, name)
+                raise YAMLCastTypeError(message=message)
+            return result
+
+        return strict_resolve
+
+    def __reduce__(self):
+        # The cache does not pickle, e.g. on the way to a worker process.
+        return self.__class__, ()
+
+    def __repr__(self):
+        return '<%s:%s>' % (self.__class__.__name__, self.name)
+
+
+class FailsafeSchema(Schema):
+    """Every plain scalar is a ``str``."""
+    name = 'failsafe'
+
+    # noinspection PyMissingConstructor
+    def __init__(self, cache_size=None):
+        pass
+
+    def compile(self):
+        return self.resolve
+
+    @staticmethod
+    def resolve(text):
+        return 'str', text
+
+
+class JSONSchema(Schema):
+    """YAML 1.2 JSON schema: ``null``, ``true``/``false`` and JSON numbers.  Anything else is an error."""
+    name = 'json'
+    words = {'null': ('null', None), 'true': ('bool', True), 'false': ('bool', False)}
+    patterns = (  # :off
+        ('-' + DIGITS, r'-? (?: 0 | [1-9] [0-9]* )', 'int10', int),
+        ('-' + DIGITS, r'-? (?: 0 | [1-9] [0-9]* ) (?: \. [0-9]* )? (?: [eE] [-+]? [0-9]+ )?', 'float', float),
+    )  # :on
+    strict = True
+
+
+class CoreSchema(Schema):
+    """YAML 1.2 core schema."""
+    name = 'core'
+    words = dict(  # :off
+        [(word, ('null', None)) for word in ('null', 'Null', 'NULL', '~')] +
+        [(word, ('bool', True)) for word in ('true', 'True', 'TRUE')] +
+        [(word, ('bool', False)) for word in ('false', 'False', 'FALSE')] +
+        [(word, ('infinity', float(word.replace('.', '')))) for word in signed('.inf', '.Inf', '.INF')] +
+        [(word, ('nan', float('nan'))) for word in ('.nan', '.NaN', '.NAN')]
+    )  # :on
+    patterns = (  # :off
+        ('+-' + DIGITS, r'[-+]? [0-9]+', 'int10', int),
+        ('0', r'0o [0-7]+', 'int8', lambda text: int(text, 8)),
+        ('0', r'0x [0-9a-fA-F]+', 'int16', lambda text: int(text, 16)),
+        ('+-.' + DIGITS, r'[-+]? (?: \. [0-9]+ | [0-9]+ (?: \. [0-9]* )? ) (?: [eE] [-+]? [0-9]+ )?', 'float', float),
+    )  # :on
+
+
+class DefaultSchema(Schema):
+    """
+    pureyaml's own schema: the core schema, plus ``yes``/``no`` booleans, with
+    keywords, ``0O``/``0X`` prefixes and ``.inf``/``.nan`` in any case.
+    """
+    name = 'default'
+    words = dict(  # :off
+        [(word, ('null', None)) for word in list(any_case('null')) + ['~']] +
+        [(word, ('bool', True)) for word in any_case('true', 'yes')] +
+        [(word, ('bool', False)) for word in any_case('false', 'no')] +
+        [(word, ('infinity', float(word.replace('.', '')))) for word in signed(*any_case('.inf'))] +
+        [(word, ('nan', float(word.replace('.', '')))) for word in signed(*any_case('.nan'))]
+    )  # :on
+    patterns = (  # :off
+        ('+-' + DIGITS, r'[-+]? [0-9]+', 'int10', int),
+        ('0', r'0 [oO] [0-7]+', 'int8', lambda text: int(text, 8)),
+        ('0', r'0 [xX] [0-9a-fA-F]+', 'int16', lambda text: int(text, 16)),
+        ('+-.' + DIGITS, r'[-+]? (?: \. [0-9]+ | [0-9]+ (?: \. [0-9]* )? ) (?: [eE] [-+]? [0-9]+ )?', 'float', float),
+    )  # :on
+
+
+schemas = {schema.name: schema for schema in (FailsafeSchema(), JSONSchema(), CoreSchema(), DefaultSchema())}
+default_schema = schemas['default']
+
+
+def get_schema(schema=None):
+    """Get a schema by name, or pass a ``Schema`` instance through.  Default ``default``."""
+    if schema is None:
+        return default_schema
+    if isinstance(schema, Schema):
+        return schema
+
+    try:
+        return schemas[schema]
+    except KeyError:
+        raise ValueError('Unknown schema {0!r}, expected one of {1}'.format(schema, sorted(schemas)))
+
+
+def resolve(text):
+    """Resolve plain scalar text with the default schema.  See ``Schema``."""
+    return default_schema.resolve(text)
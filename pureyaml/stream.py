@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Split yaml streams into documents, and parse them one at a time or in parallel."""
+from __future__ import absolute_import
+
+from collections import deque
+from functools import partial
+
+DOC_START = '---'
+DOC_END = '...'
+
+
+def is_marker(line, marker):
+    """True if ``line`` starts with the document ``marker`` at column 0."""
+    return line.startswith(marker) and line[3:4] in ('', ' ', '\t', '\r', '\n')
+
+
+def is_content(line):
+    """True if ``line`` holds more than whitespace, a comment or a directive."""
+    if is_marker(line, DOC_START):
+        line = line[3:]
+    stripped = line.strip()
+    return bool(stripped) and stripped[0] not in '#%'
+
+
+def cut_at_markers(lines):
+    """Generate ``(lineno, lines)`` pieces of a stream, cut before each ``---`` line and after each ``...`` line."""
+    buffer, lineno = [], 1
+    for index, line in enumerate(lines, 1):
+        if is_marker(line, DOC_START) and buffer:
+            yield lineno, buffer
+            buffer, lineno = [], index
+
+        buffer.append(line)
+
+        if is_marker(line, DOC_END):
+            yield lineno, buffer
+            buffer, lineno = [], index + 1
+
+    if buffer:
+        yield lineno, buffer
+
+
+def holds_content(lines):
+    return any(is_content(line) and not is_marker(line, DOC_END) for line in lines)
+
+
+def split_documents(lines):
+    """
+    Generate ``(lineno, text)`` for each document in an iterable of lines.
+
+    Documents end at a ``---`` or ``...`` line in column 0.  Comments and
+    directives before a document stay with it, and documents with no content
+    are skipped.  Only one document is held in memory at a time.
+
+    :param lines: Iterable of lines, with their line endings, e.g. an open file.
+    """
+    buffer, lineno = [], 1
+    for start, piece in cut_at_markers(lines):
+        if not buffer:
+            lineno = start
+        buffer.extend(piece)
+
+        if holds_content(piece):
+            yield lineno, ''.join(buffer)
+            buffer = []
+        elif is_marker(piece[-1], DOC_END):
+            buffer = []
+
+
+def chunked(iterable, size):
+    """Generate lists of up to ``size`` items."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def iter_decode(texts, cls=None, **kwargs):
+    """Generate each document of ``texts`` decoded, with one decoder."""
+    if cls is None:
+        from .decoder import YAMLDecoder as cls
+
+    decoder = cls(**kwargs)
+    for text in texts:
+        yield decoder.decode(text)
+
+
+def decode_documents(texts, cls=None, **kwargs):
+    """Decode a batch of documents.  Runs in pool workers, so it stays importable."""
+    return list(iter_decode(texts, cls, **kwargs))
+
+
+def parallel_decode(texts, processes, ordered=True, chunksize=1, cls=None, **kwargs):
+    """Generate each document of ``texts`` decoded, in pooled batches of ``chunksize``.  See ``parallel_map``."""
+    task = partial(decode_documents, cls=cls, **kwargs)
+    for docs in parallel_map(task, chunked(texts, chunksize), processes, ordered=ordered):
+        for doc in docs:
+            yield doc
+
+
+def parallel_map(func, iterable, processes, ordered=True):
+    """
+    Generate ``func(item)`` for each item, computed in a pool of processes.
+
+    Only a few tasks per process are in flight at once, so ``iterable`` is read
+    as results are consumed.
+
+    :param int processes: Number of worker processes.
+    :param bool ordered: Yield in ``iterable`` order, else as tasks finish.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    backlog = processes * 2
+    pending = deque() if ordered else set()
+    add = pending.append if ordered else pending.add
+
+    with ProcessPoolExecutor(processes) as executor:
+        for item in iterable:
+            add(executor.submit(func, item))
+            while len(pending) >= backlog:
+                for result in collect(pending, ordered):
+                    yield result
+
+        while pending:
+            for result in collect(pending, ordered):
+                yield result
+
+
+def collect(pending, ordered):
+    """Pop finished results: the oldest task's if ``ordered``, else every finished task's."""
+    if ordered:
+        return [pending.popleft().result()]
+
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    pending.difference_update(done)
+    return [future.result() for future in done]
+
+
+def is_item(line):
+    """True if ``line`` starts a block sequence item at column 0."""
+    return line[:1] == '-' and line[1:2] in ('', ' ', '\r', '\n') and not is_marker(line, DOC_START)
+
+
+def strip_document_end(lines):
+    """Drop a closing ``...`` line, and the comments and blank lines after it."""
+    end = len(lines)
+    while end and not is_content(lines[end - 1]):
+        end -= 1
+
+    if end and is_marker(lines[end - 1], DOC_END):
+        return lines[:end - 1]
+    return lines
+
+
+def split_sequence(lines, size):
+    """
+    Cut a document whose root is a block sequence into chunks of ``size`` items.
+
+    Items start at ``-`` lines in column 0, so each chunk is itself a valid
+    block sequence.  Leading comments, directives and ``---``, and a closing
+    ``...``, are dropped.
+
+    :param list lines: Lines of the document, with their line endings.
+    :return: List of ``(lineno, text)``, or None if the root is not a block
+        sequence, or the text holds more than one document.
+    """
+    lines, starts = strip_document_end(lines), []
+    for index, line in enumerate(lines):
+        if is_item(line):
+            starts.append(index)
+        elif starts and (is_marker(line, DOC_START) or is_marker(line, DOC_END)):
+            # Guard, another document follows
+            return None
+        elif is_content(line) and (not starts or line[:1] not in (' ', '\t')):
+            # Guard, content outside of the items
+            return None
+
+    if not starts:
+        return None
+
+    bounds = starts[::size] + [len(lines)]
+    return [(start + 1, ''.join(lines[start:end])) for start, end in zip(bounds, bounds[1:])]
+
+
+def decode_sequence(chunk, schema=None):
+    """Decode one ``(lineno, text)`` chunk from ``split_sequence``.  Runs in pool workers."""
+    from .grammar.constructors import PythonConstructor
+    from .parser import get_parser
+
+    lineno, text = chunk
+    return get_parser().parse(text, constructor=PythonConstructor(schema), lineno=lineno)[-1]
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Pick the scalar style for a string, and write it: plain, quoted, literal or folded."""
+from __future__ import absolute_import
+
+import re
+from functools import lru_cache
+
+from .exceptions import YAMLEscapeError
+from .resolver import resolve
+
+PLAIN, SINGLE, DOUBLE, LITERAL, FOLDED = 'plain', 'single', 'double', 'literal', 'folded'
+BLOCK_HEADERS = {LITERAL: '|', FOLDED: '>'}
+
+CACHE_SIZE = 4096
+
+# Longer strings are analyzed every time; caching them would keep them alive.
+CACHE_LENGTH = 128
+
+# Characters only written escaped: C0 controls other than tab, newline included,
+# DEL, C1 controls, the unicode line breaks, lone surrogates and non-characters.
+UNPRINTABLE = u'\\x00-\\x08\\x0a-\\x1f\\x7f-\\x9f\\u2028\\u2029\\ud800-\\udfff\\ufffe\\uffff'
+
+# The lexer reads neither a plain scalar ending in ``-``, nor a key ending in a backslash.
+# :off
+re_plain = re.compile(u"""
+    (?: [^\\s\\-?:,\\[\\]{{}}\\#&*!|>'"%@`{0}] | [-?:] (?=[^\\s{0}]) )
+    (?: [^\\s\\#%:{0}] | : (?=[^\\s:{0}]) | [\\ \\t]+ (?=[^\\s{0}]) )*
+    (?<! [-\\\\] ) \\Z
+""".format(UNPRINTABLE), re.X)
+# :on
+
+# The lexer reads a backslash ahead of a quote as an escape, and a colon and
+# blank as a key, even in quotes.
+re_single = re.compile(u"(?:[^'\\\\:{0}]|'|\\\\(?!')|:(?![ \\t]))*(?<!\\\\)\\Z".format(UNPRINTABLE))
+
+# Multi-line text with one trailing newline, its first line not indented, and
+# no characters a block scalar cannot hold.  The lexer has no chomping or
+# indentation indicators.
+re_literal = re.compile(u'[^\\s{0}](?:[^{0}]|\\n)*(?<!\\n)\\n\\Z'.format(UNPRINTABLE))
+
+# One line and its newline, without leading or trailing blanks, which folding drops.
+re_folded = re.compile(u'[^\\s{0}][^{0}]*(?<![\\s])\\n\\Z'.format(UNPRINTABLE))
+
+re_escape = re.compile(u'[\\\\"{0}]|:(?=[ \\t])'.format(UNPRINTABLE))
+
+ESCAPES = {  # :off
+    u'\0': u'\\0', u'\a': u'\\a', u'\b': u'\\b', u'\t': u'\\t', u'\n': u'\\n', u'\v': u'\\v', u'\f': u'\\f',
+    u'\r': u'\\r', u'\x1b': u'\\e', u'"': u'\\"', u'\\': u'\\\\', u'\x85': u'\\N', u'\u2028': u'\\L',
+    u'\u2029': u'\\P',
+}  # :on
+
+UNESCAPES = {  # :off
+    u'0': u'\0', u'a': u'\a', u'b': u'\b', u't': u'\t', u'\t': u'\t', u'n': u'\n', u'v': u'\v', u'f': u'\f',
+    u'r': u'\r', u'e': u'\x1b', u' ': u' ', u'"': u'"', u'/': u'/', u'\\': u'\\', u'N': u'\x85', u'_': u'\xa0',
+    u'L': u'\u2028', u'P': u'\u2029',
+}  # :on
+
+# An escape, or a line break and the indentation after it, which fold to a space.
+# ``\x``, ``\u`` and ``\U`` without all their hex digits match as unknown escapes.
+re_unescape = re.compile(u'\\\\(?:x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|\n\\s*|.)|\n\\s+', re.S)
+
+MAX_CODE = 0x10FFFF
+
+DOC_MARKERS = ('---', '...')
+
+
+def escape_char(match):
+    char = match.group()
+    try:
+        return ESCAPES[char]
+    except KeyError:
+        code = ord(char)
+        return u'\\x%02X' % code if code < 0x100 else u'\\u%04X' % code
+
+
+def escape(text):
+    """Escape text for a double-quoted scalar."""
+    escaped = re_escape.sub(escape_char, text)
+
+    # The lexer reads ``\"`` as an escaped quote, so a closing quote must not follow a backslash.
+    if escaped.endswith('\\'):
+        escaped = escaped[:-2] + u'\\x5C'
+    return escaped
+
+
+def unescape_match(match):
+    text = match.group()
+    if text[0] != '\\':
+        return u' '
+    if len(text) > 2 and text[1] in 'xuU':
+        return unescape_code(text)
+    if text[1] == '\n':
+        # An escaped line break joins the lines.
+        return u''
+    return UNESCAPES.get(text[1], text)
+
+
+def unescape_code(text):
+    """Decode a ``\\xNN``, ``\\uNNNN`` or ``\\UNNNNNNNN`` escape."""
+    code = int(text[2:], 16)
+    if code > MAX_CODE:
+        raise YAMLEscapeError(text)
+    return chr(code)
+
+
+def unescape(text):
+    """Read the text of a double-quoted scalar: decode escapes, and fold line breaks.  Unknown escapes are kept."""
+    return re_unescape.sub(unescape_match, text)
+
+
+def choose_style(text):
+    """Get the style ``text`` is written in.  Uncached, see ``analyze``."""
+    if not text:
+        return DOUBLE
+
+    if '\n' in text:
+        return choose_block_style(text)
+
+    # Plain, unless it would read back as another type, or as a document marker.
+    if re_plain.match(text) and text[:3] not in DOC_MARKERS and resolve(text)[0] == 'str':
+        return PLAIN
+    if re_single.match(text):
+        return SINGLE
+    return DOUBLE
+
+
+def choose_block_style(text):
+    """Get the style multi-line ``text`` is written in: a block scalar if it reads back, else double-quoted."""
+    if re_literal.match(text) and text.index('\n') < len(text) - 1:
+        return LITERAL
+    if re_folded.match(text):
+        return FOLDED
+    return DOUBLE
+
+
+def write(text):
+    """
+    Write ``text`` as a scalar, in the style ``choose_style`` picks.
+
+    :return: ``(style, scalar)``, ``scalar`` being the one line scalar, or for
+        ``LITERAL`` and ``FOLDED`` a tuple of the block's lines.
+    """
+    style = choose_style(text)
+    if style is PLAIN:
+        return style, text
+    if style is SINGLE:
+        return style, u"'%s'" % text.replace("'", "''")
+    if style is DOUBLE:
+        return style, u'"%s"' % escape(text)
+    return style, tuple(text.splitlines(True))
+
+
+_cached_write = lru_cache(maxsize=CACHE_SIZE)(write)
+
+
+def analyze(text):
+    """``write``, with a bounded cache of short strings, such as enum like values repeated across a document."""
+    if len(text) > CACHE_LENGTH:
+        return write(text)
+    return _cached_write(text)
+
+
+__all__ = [
+    'PLAIN', 'SINGLE', 'DOUBLE', 'LITERAL', 'FOLDED', 'BLOCK_HEADERS', 'analyze', 'choose_style', 'escape', 'unescape'
+]
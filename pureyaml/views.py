@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Read-only views over the node tree, converting nodes to python values as they are read."""
+from __future__ import absolute_import
+
+from ._compat import collections_abc as abc, string_types
+from .nodes import Map, Sequence
+
+_missing = object()
+
+
+def view(node):
+    """Get the python value of a node: a view for collections, the value for scalars."""
+    if isinstance(node, Map):
+        return MapView(node)
+    if isinstance(node, Sequence):
+        return SequenceView(node)
+    return node.value
+
+
+class MapView(abc.Mapping):
+    """
+    Read-only ``Mapping`` over a ``Map`` node.
+
+    Keys are converted on the first lookup, each value on its first access, and
+    both are cached.
+    """
+
+    def __init__(self, node):
+        self._node = node
+        self._index = None
+        self._cache = {}
+
+    @property
+    def index(self):
+        """Python key to value node, built on first use."""
+        if self._index is None:
+            self._index = {view(key): value for key, value in self._node.value}
+        return self._index
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        value = self._cache[key] = view(self.index[key])
+        return value
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __repr__(self):
+        return '<%s:%r>' % (self.__class__.__name__, dict(self))
+
+
+class SequenceView(abc.Sequence):
+    """Read-only ``Sequence`` over a ``Sequence`` node.  Each item is converted on first access, and cached."""
+
+    def __init__(self, node):
+        self._nodes = node.value
+        self._cache = [_missing] * len(self._nodes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        value = self._cache[index]
+        if value is _missing:
+            value = self._cache[index] = view(self._nodes[index])
+        return value
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __eq__(self, other):
+        if isinstance(other, string_types) or not isinstance(other, abc.Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<%s:%r>' % (self.__class__.__name__, list(self))
+
+
+__all__ = ['view', 'MapView', 'SequenceView']
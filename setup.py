@@ -6,9 +6,20 @@ try:
     from setuptools import setup
 except ImportError:
     from distutils.core import setup
+from setuptools.command.build_py import build_py
 from setuptools.command.test import test as TestCommand
 
 
+class BuildPy(build_py):
+    """Generate the lex and parse tables, so installs never write them at runtime."""
+
+    def run(self):
+        from pureyaml.parser import write_tables
+
+        write_tables()
+        build_py.run(self)
+
+
 class PyTest(TestCommand):
     user_options = [('pytest-args=', 'a', 'Arguments to pass to py.test')]
 
@@ -34,7 +45,7 @@ with open('README-orig.rst') as readme_file:
 with open('HISTORY.rst') as history_file:
     history = history_file.read()
 
-requirements = ['future']
+requirements = ['future; python_version < "3"']
 test_requirements = ['pytest', 'pytest-cov', 'pytest-xdist', 'future', 'pyyaml']
 setup_requirements = ['flake8', 'future']
 
@@ -82,7 +93,7 @@ setup(  # :off
         'Topic :: Utilities',
     ],
     test_suite='tests',
-    cmdclass={'test': PyTest},
+    cmdclass={'build_py': BuildPy, 'test': PyTest},
     install_requires=requirements,
     tests_require=test_requirements,
     setup_requires=setup_requirements,
@@ -11,9 +11,9 @@ from tests.utils import get_node_diff, init_logger
 
 @fixture(scope='session', autouse=True)
 def create_tabs():
-    from pureyaml.parser import YAMLLexer
+    from pureyaml.parser import write_tables
 
-    YAMLLexer.build(debug=False, optimize=True)
+    write_tables()
 
 
 @fixture(scope='session', autouse=True)
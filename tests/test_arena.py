@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from pytest import mark
+
+import pureyaml
+from pureyaml.arena import parse, ArenaDocs, ArenaMap, ArenaSequence, DOCS, DOC, MAP, SEQUENCE, NONE
+from pureyaml.nodes import *  # noqa
+
+TEXT = """\
+a: 1
+b: [x, y]
+c:
+  - d: 0x1F
+    e: |
+      literal
+      block
+  - ~
+f: !!str 12
+g: multi
+  line
+"""
+
+
+@mark.parametrize('text', [  # :off
+    TEXT,
+    '- 1\n- two\n- 3.5\n',
+    '--- 1\n--- 2\n',
+    'key: value  # comment\n',
+])  # :on
+def test_arena_decodes_like_node_tree(text):
+    assert pureyaml.loads(text, arena=True) == pureyaml.loads(text, direct=False)
+
+
+def test_arena_arrays():
+    docs = parse('a: [1, 2]\nb: 3\n')
+    arena = docs.arena
+
+    assert isinstance(docs, ArenaDocs) and docs.index == arena.root
+    assert arena.kinds[arena.root] == DOCS and arena.parents[arena.root] == NONE
+
+    doc = arena.first_children[arena.root]
+    root_map = arena.first_children[doc]
+    assert arena.kinds[doc] == DOC and arena.kinds[root_map] == MAP
+
+    a, sequence, b, three = arena.children(root_map)
+    assert [arena.scalar_text(a), arena.scalar_text(b), arena.scalar_text(three)] == ['a', 'b', '3']
+    assert arena.kinds[sequence] == SEQUENCE and arena.parents[sequence] == root_map
+    assert [arena.tag(item) for item in arena.children(sequence)] == ['int10', 'int10']
+    assert arena.next_siblings[three] == NONE
+
+
+def test_arena_accessors_look_like_nodes():
+    root = parse(TEXT).value[0].value[0]
+
+    assert isinstance(root, Map) and isinstance(root, ArenaMap)
+    assert root[Str('a')] == Int(1)
+    assert root[Str('f')] == Str('12')
+    assert isinstance(root[Str('c')], ArenaSequence) and len(root[Str('c')]) == 2
+    assert list(root) == [Str(key) for key in 'abcdefg' if key not in 'de']
+    assert root == parse(TEXT).value[0].value[0]
+
+
+def test_arena_node_visitor_dispatch():
+    class Counter(NodeVisitor):
+        def visit_Map(self, node):
+            return 'map %d' % len(node)
+
+    assert Counter().visit(parse('a: 1\n').value[0].value[0]) == 'map 1'
+
+
+def test_arena_lazy_and_schema():
+    config = pureyaml.loads(TEXT, arena=True, lazy=True, schema='failsafe')
+
+    assert config['a'] == '1'
+    assert config['c'][0]['d'] == '0x1F'
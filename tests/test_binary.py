@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from base64 import standard_b64encode
+from io import StringIO
+from os import urandom
+
+from pytest import mark
+
+import pureyaml
+from pureyaml import binary
+from pureyaml.emitter import YAMLEmitter
+from pureyaml.nodes import Binary
+
+
+@mark.parametrize('size', [0, 1, 2, 3, 47, 48, 49, 1000])
+def test_iter_encode_round_trip(size):
+    data = urandom(size)
+    pieces = list(binary.iter_encode(data, chunk_bytes=48))
+
+    assert len(pieces) == max(1, -(-size // 48))
+    assert ''.join(pieces) == standard_b64encode(data).decode('ascii')
+    assert binary.decode(binary.encode(data)) == data
+
+
+def test_binary_node_decodes_on_first_access():
+    node = Binary('aGVs\nbG8=\n')
+
+    assert node._data is None
+    assert node.value == b'hello'
+    assert node == Binary.from_decoded(b'hello')
+
+
+def test_binary_node_from_decoded_encodes_on_first_access():
+    data = b'\xff' * 100
+    node = Binary.from_decoded(data)
+
+    assert node.value is data
+    assert node._text is None
+    assert node.raw_value == binary.encode(data)
+
+
+def test_dump_writes_binary_incrementally():
+    data = urandom(binary.CHUNK_BYTES * 10)
+    fp = StringIO()
+    writes = []
+    fp.write = writes.append
+
+    YAMLEmitter(buffer_pieces=2).dump({'blob': data}, fp)
+
+    assert len(writes) >= 5
+    assert len(''.join(writes).splitlines()) == 2
+    assert pureyaml.loads(''.join(writes)) == {'blob': data}
@@ -1752,3 +1752,55 @@ def test_sanity_sorted(case):
     obj2 = pureyaml.load(_text)
     # print(obj2)
     assert obj1 == obj2
+
+
+def test_decoder_reuses_process_wide_parser():
+    from pureyaml.decoder import YAMLDecoder
+    from pureyaml.parser import get_parser
+
+    assert YAMLDecoder().parser is get_parser()
+    assert YAMLDecoder().parser is YAMLDecoder().parser
+    assert YAMLDecoder(parser=pureyaml_parser).parser is pureyaml_parser
+    assert pureyaml.loads('a: 1\n') == pureyaml.loads('a: 1\n') == {'a': 1}
+
+
+@mark.parametrize('case', DecoderTestCase.keys('sanity'))
+def test_direct_construction_matches_node_tree(case):
+    from pureyaml.decoder import YAMLDecoder
+
+    def decode(direct):
+        try:
+            return YAMLDecoder(direct=direct).decode(text)
+        except Exception as error:
+            return type(error)
+
+    text, _ = DecoderTestCase.get('sanity', case)
+    assert decode(direct=True) == decode(direct=False)
+
+
+def test_direct_construction_builds_no_nodes():
+    from pureyaml.decoder import YAMLDecoder
+    from pureyaml.grammar.constructors import PythonConstructor
+    from pureyaml.parser import get_parser
+
+    text = dedent("""
+        --- 1
+        ---
+        a: [1, 2.5, ~]
+        b: {x: true}
+        c: !!binary aGVsbG8=
+        s: !!str 2
+        d: |
+            literal
+        e: 'quoted'
+    """)[1:]
+    docs = get_parser().parse(text, constructor=PythonConstructor())
+    expected = {'a': [1, 2.5, None], 'b': {'x': True}, 'c': b'hello', 's': '2', 'd': 'literal\n', 'e': 'quoted'}
+    assert docs == [1, expected]
+    assert pureyaml.loads(text) == docs[-1]
+
+    class CustomDecoder(YAMLDecoder):
+        pass
+
+    assert CustomDecoder().direct is False
+    assert isinstance(get_parser().parse(text), Docs)
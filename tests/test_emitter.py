@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from io import StringIO
+
+from pytest import mark, raises
+
+import pureyaml
+from pureyaml.emitter import YAMLEmitter
+from pureyaml.encoder import YAMLEncoder
+
+OBJ = {
+    'name': 'web',
+    'replicas': 3,
+    'ratio': 0.5,
+    'enabled': True,
+    'missing': None,
+    'quoted': ['yes', '1', '1.5', ''],
+    'labels': {'app': 'web', 'tier': {'level': 2}},
+    'ports': [80, 443],
+    'men': [{'name': 'John', 'age': 33}, {'name': 'Mary', 'age': 27}],
+    'nested': [[1, [2, 3]], [4]],
+    'script': 'one\ntwo\n',
+    'empty': {},
+    'raw': b'\x00\xff',
+}
+
+
+@mark.parametrize('obj', [OBJ, [OBJ, 1, 'a'], 1, None, 1.5, float('inf'), 'text', 'top\nlevel\n', b'\xff'])
+@mark.parametrize('indent', [None, 4])
+@mark.parametrize('sort_keys', [False, True])
+def test_emitter_matches_encoder(obj, indent, sort_keys):
+    expected = YAMLEncoder(indent=indent, sort_keys=sort_keys).encode(obj)
+
+    assert YAMLEmitter(indent=indent, sort_keys=sort_keys).dumps(obj) == expected
+
+
+def test_emitter_sorts_keys_like_encoder():
+    obj = {'b': 1, 10: 2, 9: 3, b'a': 4, True: 5, None: 6}
+
+    assert YAMLEmitter(sort_keys=True).dumps(obj) == YAMLEncoder(sort_keys=True).encode(obj)
+
+
+def test_dump_writes_chunks_to_fp():
+    obj = [OBJ] * 50
+    fp = StringIO()
+    writes = []
+    fp.write = writes.append
+
+    YAMLEmitter(buffer_pieces=64).dump(obj, fp)
+
+    assert len(writes) > 1
+    assert ''.join(writes) == pureyaml.dumps(obj)
+
+
+def test_dump_round_trip():
+    # The parser does not read empty values.
+    obj = {key: value for key, value in OBJ.items() if value != {}}
+    fp = StringIO()
+    pureyaml.dump(obj, fp)
+
+    assert pureyaml.loads(fp.getvalue()) == obj
+
+
+def test_block_scalars_in_sequences_round_trip():
+    obj = ['one\ntwo\n', 1, [{'a': 'l\nm\n', 'b': 2}]]
+
+    assert pureyaml.loads(pureyaml.dumps(obj)) == obj
+
+
+def test_unicode_text_is_written_as_is():
+    assert pureyaml.dumps({u'clé': u'日本語'}) == u'clé: 日本語\n'
+    assert pureyaml.dumps(u'\u2028') == '"\\L"\n'
+
+
+def test_empty_collections():
+    assert pureyaml.dumps({}) == '{}\n'
+    assert pureyaml.dumps([[], {}]) == '- []\n- {}\n'
+
+
+def test_unsupported_type():
+    with raises(RuntimeError):
+        pureyaml.dumps({'a': object()})
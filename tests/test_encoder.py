@@ -276,6 +276,24 @@ class EncoderTestCase(MultiTestCaseBase):
         )
     )  # :on
 
+    # TEST CASE
+    # ------------------------------------------------------------------------
+    it_handles_unicode__data = {u'clé': u'valeur', u'greeting': u'こんにちは', u'lines': u'première\nligne\n'}
+    it_handles_unicode__test_pureyaml = dedent(u"""
+        clé: valeur
+        greeting: こんにちは
+        lines: |
+          première
+          ligne
+
+    """)[1:]
+    it_handles_unicode__test_sanity = None
+    it_handles_unicode__test_encode = Map(  # :off
+        (Str(u'clé'), Str(u'valeur')),
+        (Str(u'greeting'), Str(u'こんにちは')),
+        (Str(u'lines'), Str(u'première\nligne\n')),
+    )  # :on
+
     # TEST CASE
     # ------------------------------------------------------------------------
     it_handles_dict__data = {'name': 'John Smith', 'age': 33}
@@ -1100,3 +1118,10 @@ def test_sorted():
     assert obj1 == obj2
     text2 = pureyaml.dump(obj2, sort_keys=True)
     assert text1 == text2 == expected
+
+
+def test_sorted_keeps_each_value_with_its_key():
+    node = Map((Str('b'), Int(1)), (Int(10), Int(2)), (Str('a'), Int(3)), (Str('a'), Int(4)))
+    items = list(pureyaml.YAMLEncoder(sort_keys=True).iter_map_items(node))
+
+    assert items == [(Int(10), Int(2)), (Str('a'), Int(3)), (Str('a'), Int(4)), (Str('b'), Int(1))]
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from textwrap import dedent
+
+import pureyaml
+from pureyaml import events
+from pureyaml.events import Event
+from pureyaml.parser import get_parser
+
+
+def test_events_in_document_order():
+    text = dedent("""
+        ---
+        name: web   # the name
+        ports:
+          - 80
+          - !!str 443
+        tags: [a, b]
+        meta: {x: 1}
+        ...
+        --- 2
+    """)[1:]
+
+    assert list(events.iterparse(text)) == [  # :off
+        Event('start_doc', None, 2),
+        Event('start_map', None, 2),
+        Event('key', 'name', 2),
+        Event('scalar', 'web   ', 2),
+        Event('key', 'ports', 3),
+        Event('start_seq', None, 4),
+        Event('scalar', 80, 4),
+        Event('scalar', '443', 5),
+        Event('end_seq', None, 5),
+        Event('key', 'tags', 6),
+        Event('start_seq', None, 6),
+        Event('scalar', 'a', 6),
+        Event('scalar', 'b', 6),
+        Event('end_seq', None, 6),
+        Event('key', 'meta', 7),
+        Event('start_map', None, 7),
+        Event('key', 'x', 7),
+        Event('scalar', 1, 7),
+        Event('end_map', None, 7),
+        Event('end_map', None, 7),
+        Event('end_doc', None, 7),
+        Event('start_doc', None, 9),
+        Event('scalar', 2, 9),
+        Event('end_doc', None, 9),
+    ]  # :on
+
+
+def test_callback_receives_every_doc():
+    text = ''.join('---\nid: %d\n' % i for i in range(3))
+    seen = []
+
+    def callback(event):
+        if event.kind == events.SCALAR:
+            seen.append(event.value)
+
+    assert events.parse(text, callback) is None
+    assert seen == [0, 1, 2]
+
+
+def add_value(stack, result, value):
+    """Add ``value`` to the innermost open collection, or to ``result`` at the root."""
+    if not stack:
+        result.append(value)
+    elif isinstance(stack[-1][0], dict):
+        stack[-1][0][stack[-1][1].pop()] = value
+    else:
+        stack[-1][0].append(value)
+
+
+def rebuild(iterable):
+    """Rebuild the python value of each doc from its events."""
+    stack, result = [], []
+    for event in iterable:
+        if event.kind in (events.START_MAP, events.START_SEQ):
+            stack.append(({} if event.kind == events.START_MAP else [], []))
+        elif event.kind == events.KEY:
+            stack[-1][1].append(event.value)
+        elif event.kind in (events.SCALAR, events.END_MAP, events.END_SEQ):
+            add_value(stack, result, event.value if event.kind == events.SCALAR else stack.pop()[0])
+    return result
+
+
+def test_events_rebuild_loads_output():
+    text = dedent("""
+        a:
+          - 1
+          - b: [x, y]
+            c: |
+              literal
+        d: ~
+    """)[1:]
+
+    assert rebuild(events.iterparse(text)) == [pureyaml.loads(text)]
+
+
+def test_iterparse_parses_one_doc_at_a_time():
+    parsed = []
+
+    class RecordingParser(object):
+        def parse(self, text, **kwargs):
+            parsed.append(text)
+            return get_parser().parse(text, **kwargs)
+
+    iterable = events.iterparse('--- 1\n--- 2\n', parser=RecordingParser())
+
+    assert next(iterable) == Event('start_doc', None, 1)
+    assert parsed == ['--- 1\n']
+    assert [event.value for event in iterable] == [1, None, None, 2, None]
+    assert parsed == ['--- 1\n', '--- 2\n']
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+import subprocess
+import sys
+
+from pytest import raises
+
+import pureyaml
+
+
+def imported_after(code):
+    code += '; import sys; print(" ".join(sorted(sys.modules)))'
+    return set(subprocess.check_output([sys.executable, '-c', code]).decode('utf-8').split())
+
+
+def test_import_skips_parser_machinery():
+    modules = imported_after('import pureyaml')
+    assert 'pureyaml.parser' not in modules
+    assert 'pureyaml.grammar.productions' not in modules
+    assert not any(module.startswith('pureyaml.ply') for module in modules)
+
+
+def test_dumps_skips_parser_machinery():
+    modules = imported_after('import pureyaml; pureyaml.dumps({"a": 1})')
+    assert 'pureyaml.emitter' in modules
+    assert 'pureyaml.parser' not in modules
+    assert not any(module.startswith('pureyaml.ply') for module in modules)
+
+
+def test_decoder_loads_parser_on_first_use():
+    modules = imported_after('import pureyaml; pureyaml.YAMLDecoder()')
+    assert 'pureyaml.parser' in modules
+
+
+def test_classes_are_package_attributes():
+    from pureyaml.decoder import YAMLDecoder
+    from pureyaml.emitter import YAMLEmitter
+    from pureyaml.encoder import YAMLEncoder
+
+    assert pureyaml.YAMLDecoder is YAMLDecoder
+    assert pureyaml.YAMLEncoder is YAMLEncoder
+    assert pureyaml.YAMLEmitter is YAMLEmitter
+    with raises(AttributeError):
+        pureyaml.YAMLNothing
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from textwrap import dedent
+
+from pytest import raises
+
+from pureyaml.nodes import *  # noqa
+from pureyaml.parser import LexerPool, YAMLLexer, YAMLParser
+
+text = dedent("""
+    ---
+    # about
+    key: value  # a comment
+    block: |
+      literal text
+    seq:
+      - 1
+      - [2, 3]
+    ...
+""")[1:]
+
+
+def token_summary(tokens):
+    return [(token.type, str(getattr(token.value, 'value', token.value)), token.lineno) for token in tokens]
+
+
+def test_pool_recycles_lexers():
+    pool = LexerPool()
+    with pool.lexer() as first:
+        pass
+    with pool.lexer() as second:
+        assert second is first
+        with pool.lexer() as third:
+            assert third is not first
+            assert third.lexmodule is not first.lexmodule
+
+
+def test_pooled_tokens_match_a_freshly_built_lexer():
+    fresh = YAMLLexer.build()
+    fresh.input(text)
+    expected = token_summary(iter(fresh.token, None))
+
+    parser = YAMLParser()
+    assert token_summary(parser.tokenize(text)) == expected
+    assert token_summary(parser.tokenize(text)) == expected
+    assert token_summary(YAMLLexer.tokenize(text)) == expected
+
+
+def test_lexer_is_reset_after_a_failed_parse():
+    parser = YAMLParser()
+    expected = parser.parse(text)
+
+    with raises(SyntaxError):
+        parser.parse('key: "unterminated\n  - ]\n')
+
+    with parser.lexers.lexer() as lexer:
+        assert lexer.lexstate == 'INITIAL'
+        assert lexer.lexstatestack == []
+        assert lexer.lineno == 1
+        assert lexer.lexmodule.indent_stack == [1]
+        assert lexer.lexmodule.context.most_recent_scalar_token is None
+
+    nodes = parser.parse(text)
+    assert nodes == expected
+    assert nodes.value[0].get_comments() == ['about']
+
+
+def test_explicit_lexer_is_used_as_given():
+    lexer = YAMLLexer.build()
+    assert YAMLParser().parse('a: 1\n', lexer=lexer) == Docs(Doc(Map((Str('a'), Int(1)))))
+    assert lexer.lexdata == 'a: 1\n'
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from io import StringIO
+from textwrap import dedent
+
+import pureyaml
+from pureyaml.grammar.constructors import PythonConstructor
+from pureyaml.parser import get_parser
+from pureyaml.stream import split_documents
+
+TEXT = dedent("""
+    # leading comment
+    ---
+    a: 1
+    b: [x, y]
+    ...
+    --- 2
+    ---
+    - |
+      literal
+    - 3
+    ...
+    # trailing comment
+""")[1:]
+
+
+def test_load_all_matches_parsing_the_whole_stream():
+    expected = get_parser().parse(TEXT, constructor=PythonConstructor())
+
+    assert list(pureyaml.load_all(TEXT)) == expected
+    assert list(pureyaml.load_all(StringIO(TEXT))) == expected
+
+
+def test_load_all_yields_before_reading_the_rest():
+    consumed = []
+
+    def lines():
+        for line in StringIO(''.join('---\nid: %d\n' % i for i in range(100))):
+            consumed.append(line)
+            yield line
+
+    docs = pureyaml.load_all(lines())
+    assert next(docs) == {'id': 0}
+    assert len(consumed) == 3
+    assert next(docs) == {'id': 1}
+    assert len(consumed) == 5
+
+
+def test_split_documents():
+    assert list(split_documents(StringIO(TEXT))) == [  # :off
+        (1, '# leading comment\n---\na: 1\nb: [x, y]\n...\n'),
+        (6, '--- 2\n'),
+        (7, '---\n- |\n  literal\n- 3\n...\n'),
+    ]  # :on
+    assert list(split_documents(['---\n', '---\n', '# only a comment\n'])) == []
+
+
+def test_load_all_in_a_process_pool():
+    text = ''.join('---\nid: %d\nname: doc %d\n' % (i, i) for i in range(40))
+    expected = list(pureyaml.load_all(text))
+
+    assert list(pureyaml.load_all(text, processes=2)) == expected
+    assert list(pureyaml.load_all(StringIO(text), processes=2, chunksize=3)) == expected
+
+    unordered = list(pureyaml.load_all(text, processes=2, ordered=False, chunksize=3))
+    assert sorted(unordered, key=lambda doc: doc['id']) == expected
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from io import StringIO
+from textwrap import dedent
+
+from pytest import mark, raises
+
+import pureyaml
+from pureyaml.exceptions import YAMLSyntaxError
+from pureyaml.stream import split_sequence
+
+TEXT = dedent("""
+    # records
+    ---
+    - name: a
+      size: 1
+    - b
+    -
+      x: |
+        literal
+
+    # between items
+    - [1, 2]
+    ...
+""")[1:]
+
+
+def test_load_sequence_matches_loads():
+    expected = pureyaml.loads(TEXT)
+
+    assert pureyaml.load_sequence(TEXT, processes=2, chunksize=1) == expected
+    assert pureyaml.load_sequence(StringIO(TEXT), processes=2, chunksize=3) == expected
+    assert pureyaml.load_sequence(TEXT) == expected
+
+
+def test_load_sequence_reports_serial_line_numbers():
+    text = ''.join('- item %d\n' % i for i in range(20)) + '- a\n  - :\n   {x\n'
+
+    with raises(YAMLSyntaxError) as serial:
+        pureyaml.loads(text)
+    with raises(YAMLSyntaxError) as parallel:
+        pureyaml.load_sequence(text, processes=2, chunksize=4)
+
+    assert parallel.value.token.lineno == serial.value.token.lineno == 22
+
+
+def test_load_sequence_falls_back_to_loads():
+    assert pureyaml.load_sequence('a: 1\nb:\n- 2\n', processes=2) == {'a': 1, 'b': [2]}
+
+
+@mark.parametrize('chunksize', [1, 2, 3, 4])
+def test_load_sequence_falls_back_to_loads_on_multiple_documents(chunksize):
+    text = '- a\n- b\n---\n- c\n- d\n'
+
+    assert pureyaml.load_sequence(text, processes=2, chunksize=chunksize) == pureyaml.loads(text) == ['c', 'd']
+
+
+def test_split_sequence():
+    assert split_sequence(StringIO(TEXT).readlines(), 2) == [  # :off
+        (3, '- name: a\n  size: 1\n- b\n'),
+        (6, '-\n  x: |\n    literal\n\n# between items\n- [1, 2]\n'),
+    ]  # :on
+    assert split_sequence(['a: 1\n', '- 2\n'], 2) is None
+    assert split_sequence(['  a\n', '- 2\n'], 2) is None
+    assert split_sequence(['- 1\n', '...\n', '--- 2\n'], 2) is None
+    assert split_sequence(['- 1\n', '---\n', '- 2\n'], 2) is None
+    assert split_sequence(['- 1\n', '...\n', '# end\n'], 2) == [(1, '- 1\n')]
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from pytest import mark, raises
+
+import pureyaml
+from pureyaml.decoder import YAMLDecoder
+from pureyaml.grammar.constructors import NodeConstructor
+from pureyaml.nodes import *  # noqa
+from pureyaml.parser import get_parser
+
+
+def test_map_lookup_matches_scalar_equality():
+    node = Map((Str('1'), Str('str')), (Int(1), Str('int')), (Float('nan'), Str('nan')), (Null(None), Str('null')))
+
+    assert node[Str('1')] == Str('str')
+    assert node[Int(1)] == Str('int')
+    assert node[Float('nan')] == Str('nan')
+    assert node[Null(None)] == Str('null')
+    assert Bool(True) not in node
+    with raises(KeyError):
+        node[Str('2')]
+
+
+def test_map_lookup_first_duplicate_wins():
+    node = Map((Str('a'), Int(1)), (Str('a'), Int(2)))
+
+    assert node[Str('a')] == Int(1)
+
+
+def test_map_lookup_collection_key():
+    key = Sequence(Str('a'), Str('b'))
+    node = Map((key, Int(1)), (Str('c'), Int(2)))
+
+    assert node[Sequence(Str('a'), Str('b'))] == Int(1)
+    assert node[Str('c')] == Int(2)
+
+
+def test_sort_keys_large_map():
+    obj = {'key-%04d' % i: i for i in range(2000)}
+    text = pureyaml.dumps(obj, sort_keys=True)
+
+    assert text.splitlines()[:2] == ['key-0000: 0', 'key-0001: 1']
+    assert pureyaml.loads(text) == obj
+
+
+def test_equal_nodes_hash_equal():
+    first = Map((Str('a'), Sequence(Int(1), Float('nan'))), (Str('b'), Null(None)))
+    second = Map((Str('b'), Null(None)), (Str('a'), Sequence(Int(1), Float('nan'))))
+
+    assert first == second and hash(first) == hash(second)
+    assert hash(Int(1)) != hash(Str('1'))
+    assert len({Str('x'), Str('x'), Int(1)}) == 2
+
+
+def test_node_pool_shares_equal_subtrees():
+    text = 'a:\n  x: 1\n  y: [2, 3]\nb:\n  x: 1\n  y: [2, 3]\nc: [2, 3]\n'
+    pool = NodePool()
+    doc = get_parser().parse(text, constructor=NodeConstructor(pool=pool)).value[0].value[0]
+
+    assert doc[Str('a')] is doc[Str('b')]
+    assert doc[Str('a')][Str('y')] is doc[Str('c')]
+    assert len(pool) == len(set(pool.nodes))
+
+
+def test_node_pool_keeps_key_order():
+    text = 'a:\n  x: 1\n  y: 2\nb:\n  y: 2\n  x: 1\n'
+    doc = get_parser().parse(text, constructor=NodeConstructor(pool=NodePool())).value[0].value[0]
+
+    assert doc[Str('a')] == doc[Str('b')] and doc[Str('a')] is not doc[Str('b')]
+    assert [key.value for key in doc[Str('b')]] == ['y', 'x']
+
+
+def test_node_pool_drops_comments():
+    text = 'a: 1  # one\nb: 1\n'
+    doc = get_parser().parse(text, constructor=NodeConstructor(pool=NodePool())).value[0].value[0]
+
+    assert doc[Str('a')] is doc[Str('b')]
+    assert not doc[Str('a')].has_comments()
+
+
+def test_loads_pool():
+    text = '---\nlabels: {app: web}\n---\nlabels: {app: web}\n'
+
+    assert pureyaml.loads(text, direct=False, pool=True) == {'labels': {'app': 'web'}}
+    assert pureyaml.loads(text, lazy=True, pool=NodePool()) == {'labels': {'app': 'web'}}
+
+
+@mark.parametrize('kwargs', [{'direct': False}, {'lazy': True}])
+def test_loads_pool_keeps_key_order(kwargs):
+    docs = pureyaml.loads('- {a: 1, b: 2}\n- {b: 2, a: 1}\n', pool=True, **kwargs)
+
+    assert [list(doc) for doc in docs] == [['a', 'b'], ['b', 'a']]
+
+
+def test_loads_pool_needs_node_tree():
+    assert pureyaml.loads('a: {b: 1}\n', pool=NodePool()) == {'a': {'b': 1}}
+
+    with raises(ValueError):
+        pureyaml.loads('a: 1\n', direct=True, pool=True)
+    with raises(ValueError):
+        pureyaml.loads('a: 1\n', arena=True, pool=True)
+
+
+def test_nodes_use_slots():
+    nodes = [Docs(), Doc(Null(None)), Sequence(), Map(), Null(None), Str('a'), Int(1), Float(1.5), Bool(True),
+             Binary.from_decoded(b'\xff')]
+
+    for node in nodes:
+        assert not hasattr(node, '__dict__'), type(node).__name__
+        if isinstance(node, (Doc, Scalar)):
+            assert node.get_comments() is None and not node.has_comments()
+
+
+def test_collections_iterate_more_than_once():
+    sequence = Sequence(Int(1), Int(2))
+    node = Map((Str('a'), Int(1)), (Str('b'), Int(2)))
+
+    assert list(sequence) == list(sequence) == [Int(1), Int(2)]
+    assert list(node) == list(node) == [Str('a'), Str('b')]
+    assert node.raw_value is node.value
+
+
+def test_node_visitor_deep_tree():
+    node = Int(1)
+    for _ in range(5000):
+        node = Sequence(node)
+
+    result = YAMLDecoder(direct=False).visit(node)
+    for _ in range(5000):
+        result, = result
+    assert result == 1
+
+
+def test_node_visitor_dispatch_is_per_class():
+    class Upper(NodeVisitor):
+        def visit_Sequence(self, node):
+            items = []
+            for item in node.value:
+                items.append((yield item))
+            yield items
+
+        def visit_Str(self, node):
+            return node.value.upper()
+
+    class Lower(Upper):
+        def visit_Str(self, node):
+            return node.value.lower()
+
+    node = Sequence(Str('a'), Str('B'))
+
+    assert Upper().visit(node) == ['A', 'B']
+    assert Lower().visit(node) == ['a', 'b']
+    assert Upper().visit(Str('c')) == 'C'
+    assert Upper.dispatch_table() is not Lower.dispatch_table()
+    with raises(RuntimeError):
+        Upper().visit(Int(1))
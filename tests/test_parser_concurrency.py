@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from concurrent.futures import ThreadPoolExecutor
+from textwrap import dedent
+
+from pureyaml.nodes import *  # noqa
+from pureyaml.parser import YAMLParser
+
+
+def comments_of(docs):
+    """Flatten every comment attached in a parsed stream."""
+    found = []
+    for doc in docs.value:
+        found.append(doc.get_comments())
+        for node in doc.value:
+            if isinstance(node, Map):
+                for key, value in node.value:
+                    found.append(key.get_comments())
+                    found.append(value.get_comments())
+    return found
+
+
+def test_shared_parser_keeps_comments_per_parse():
+    texts = [dedent("""
+        ---
+        # doc {0}
+        key_{0}: value_{0}  # value {0}
+        other_{0}: {0}
+        ...
+    """)[1:].format(i) for i in range(8)]
+
+    parser = YAMLParser()
+    expected = [comments_of(parser.parse(text)) for text in texts]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda text: comments_of(parser.parse(text)), texts * 25))
+
+    assert results == expected * 25
+    assert expected[3] == [['doc 3'], None, ['value 3'], None, None]
+
+
+def test_lexer_instances_do_not_share_context():
+    from pureyaml.parser import YAMLLexer
+
+    first, second = YAMLLexer.build(), YAMLLexer.build()
+    assert first.lexmodule.context is not second.lexmodule.context
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from pureyaml.nodes import *  # noqa
+from pureyaml.parser import get_parser
+
+N = 3000
+
+
+def test_block_map():
+    text = ''.join('key_%d: %d\n' % (i, i) for i in range(N))
+    expected = Docs(Doc(Map(*[(Str('key_%d' % i), Int(i)) for i in range(N)])))
+    assert get_parser().parse(text) == expected
+
+
+def test_block_sequence_of_maps():
+    text = ''.join('- name: item_%d\n  size: %d\n' % (i, i) for i in range(N))
+    expected = Docs(Doc(Sequence(*[Map((Str('name'), Str('item_%d' % i)), (Str('size'), Int(i))) for i in range(N)])))
+    assert get_parser().parse(text) == expected
+
+
+def test_flow_collections():
+    text = 'seq: [%s]\nmap: {%s}\n' % (  # :off
+        ', '.join(str(i) for i in range(N)),
+        ', '.join('k%d: %d' % (i, i) for i in range(N)))  # :on
+    expected = Docs(Doc(Map(  # :off
+        (Str('seq'), Sequence(*[Int(i) for i in range(N)])),
+        (Str('map'), Map(*[(Str('k%d' % i), Int(i)) for i in range(N)])),
+    )))  # :on
+    assert get_parser().parse(text) == expected
+
+
+def test_documents():
+    text = ''.join('---\ndoc_%d\n...\n' % i for i in range(N))
+    nodes = get_parser().parse(text)
+    assert type(nodes) is Docs
+    assert nodes == Docs(*[Doc(Str('doc_%d' % i)) for i in range(N)])
+
+
+def test_literal_block():
+    text = 'text: |\n%s' % ''.join('  line %d\n' % i for i in range(N))
+    nodes = get_parser().parse(text)
+    assert nodes.value[0].value[0][Str('text')].value == ''.join('line %d\n' % i for i in range(N))
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from importlib import import_module
+
+from pytest import fixture
+
+from pureyaml import parser
+from pureyaml.nodes import *  # noqa
+from pureyaml.parser import LEXTAB, PARSETAB, YAMLLexer, YAMLParser, grammar_hash, tables_are_current
+from pureyaml.ply.lex import Lexer
+from pureyaml.ply.yacc import LRGeneratedTable
+
+
+@fixture
+def no_table_writes(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('tables written at runtime')
+
+    monkeypatch.setattr(Lexer, 'writetab', fail)
+    monkeypatch.setattr(LRGeneratedTable, 'write_table', fail)
+
+
+def test_tables_are_stamped_with_grammar_hash():
+    assert tables_are_current()
+    for name in (LEXTAB, PARSETAB):
+        assert import_module(name)._grammar_hash == grammar_hash()
+
+
+def test_current_tables_load_without_writing(no_table_writes):
+    lexer = YAMLLexer.build()
+    assert lexer.lexoptimize
+    assert YAMLParser().parse('a: 1\n') == Docs(Doc(Map((Str('a'), Int(1)))))
+
+
+def test_stale_tables_are_rebuilt_in_memory(no_table_writes, monkeypatch):
+    monkeypatch.setattr(parser, '_tables_current', False)
+
+    lexer = YAMLLexer.build()
+    assert not lexer.lexoptimize
+    assert YAMLParser().parse('a: 1\n') == Docs(Doc(Map((Str('a'), Int(1)))))
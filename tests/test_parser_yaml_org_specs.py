@@ -502,9 +502,9 @@ def test_ex_2_17_quoted_scalars():
     expected = Docs(  # :off
         Doc(
             Map(
-                (Str('unicode'), Str(r'Sosa did fine.\u263A')),
-                (Str('control'), Str(r'\b1998\t1999\t2000\n')),
-                (Str('hex esc'), Str(r'\x0d\x0a is \r\n')),
+                (Str('unicode'), Str(u'Sosa did fine.\u263A')),
+                (Str('control'), Str('\b1998\t1999\t2000\n')),
+                (Str('hex esc'), Str('\x0d\x0a is \r\n')),
                 (Str('single'), Str('"Howdy!" he cried.')),
                 (Str('quoted'), Str(" # Not a 'comment'.")),
                 (Str('tie-fighter'), Str(r'|\-*-/|')),
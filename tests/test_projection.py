@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from pytest import mark, raises
+
+import pureyaml
+from pureyaml.exceptions import YAMLSyntaxError
+from pureyaml.projection import parse_paths, project
+
+TEXT = """\
+# generated
+kind: Pod
+metadata:
+  name: web
+  labels:
+    app: web
+  annotations:
+    note: |
+      name: not a key
+spec:
+  replicas: 3
+  template:
+    containers:
+    - name: app
+      ports: [80, 443]
+  "quoted key": yes
+status: {phase: Running}
+"""
+
+
+def test_parse_paths():
+    assert parse_paths(['a.b', 'a.c.d', ('x.y', 1)]) == {'a': {'b': True, 'c': {'d': True}}, 'x.y': {'1': True}}
+    assert parse_paths(['a', 'a.b']) == {'a': True}
+
+
+def test_project_keeps_line_numbers():
+    projected = project(TEXT.splitlines(True), ['spec.replicas'])
+
+    assert projected.splitlines() == [''] * 9 + ['spec:', '  replicas: 3'] + [''] * 6
+
+
+@mark.parametrize('select,expected', [  # :off
+    (['kind'], {'kind': 'Pod'}),
+    (['metadata.name', 'spec.replicas'], {'metadata': {'name': 'web'}, 'spec': {'replicas': 3}}),
+    (['spec.template'], {'spec': {'template': {'containers': [{'name': 'app', 'ports': [80, 443]}]}}}),
+    (['spec.quoted key', 'status'], {'spec': {'quoted key': True}, 'status': {'phase': 'Running'}}),
+    (['metadata.annotations.note.name'], {'metadata': {'annotations': {'note': 'name: not a key\n'}}}),
+    (['metadata.missing', 'spec.replicas'], {'spec': {'replicas': 3}}),
+    (['missing'], {}),
+])  # :on
+def test_loads_select(select, expected):
+    assert pureyaml.loads(TEXT, select=select) == expected
+    assert pureyaml.loads(TEXT, select=select, direct=False) == expected
+
+
+def test_loads_select_non_map_document():
+    assert pureyaml.loads('- a\n- b\n', select=['a']) == ['a', 'b']
+
+
+def test_loads_select_lazy():
+    config = pureyaml.loads(TEXT, select=['spec.template'], lazy=True)
+
+    assert config['spec']['template']['containers'][0]['name'] == 'app'
+
+
+def test_loads_select_skips_unselected_errors():
+    text = 'good: 1\nbad:\n  - a\n  b: c\n'
+
+    assert pureyaml.loads(text, select=['good']) == {'good': 1}
+    with raises(YAMLSyntaxError):
+        pureyaml.loads(text, select=['bad'])
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from math import isnan
+
+from pytest import mark
+
+import pureyaml
+from pureyaml import events
+from pureyaml.nodes import *  # noqa
+from pureyaml.resolver import resolve
+
+
+@mark.parametrize('text,tag,value', [  # :off
+    ('', 'null', None),
+    ('  ', 'null', None),
+    ('~', 'null', None),
+    ('NuLL', 'null', None),
+    ('Yes   ', 'bool', True),
+    ('false', 'bool', False),
+    ('No', 'bool', False),
+    ('nope', 'str', 'nope'),
+    ('12', 'int10', 12),
+    ('-012', 'int10', -12),
+    ('0o17', 'int8', 15),
+    ('0x1F', 'int16', 31),
+    ('1.5', 'float', 1.5),
+    ('-.5e3', 'float', -500.0),
+    ('1e5', 'float', 100000.0),
+    ('.e5', 'str', '.e5'),
+    ('e5', 'str', 'e5'),
+    ('-.Inf', 'infinity', float('-inf')),
+    ('0x', 'str', '0x'),
+    ('1_000', 'str', '1_000'),
+    ('svc   ', 'str', 'svc   '),
+    ('two\nlines', 'str', 'two\nlines'),
+])  # :on
+def test_resolve(text, tag, value):
+    assert resolve(text) == (tag, value)
+    assert ScalarDispatch.tag(text) == tag
+    assert ScalarDispatch.resolve(text) == value
+
+
+def test_resolve_nan():
+    tag, value = resolve('.NaN')
+    assert tag == 'nan' and isnan(value)
+
+
+def test_node_and_direct_construction_agree():
+    text = 'a: Yes   \nb: 0o17\nc: .e5\n'
+    node = ScalarDispatch('Yes   ')
+
+    assert isinstance(node, Bool) and node.value is True
+    assert pureyaml.loads(text) == pureyaml.loads(text, direct=False) == {'a': True, 'b': 15, 'c': '.e5'}
+
+
+@mark.parametrize('text,value', [  # :off
+    ('a: 1\n  2\n', '1 2'),
+    ('a: 1.5\n  x\n', '1.5 x'),
+    ('a: true\n  x\n', 'true x'),
+    ('a: ~\n  x\n', '~ x'),
+    ('a: x\n  1\n', 'x 1'),
+])  # :on
+def test_multi_line_plain_scalar_is_text(text, value):
+    assert pureyaml.loads(text) == pureyaml.loads(text, direct=False) == {'a': value}
+    assert [event.value for event in events.iterparse(text)][3] == value
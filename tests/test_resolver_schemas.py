@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+import pickle
+
+from pytest import mark, raises
+
+import pureyaml
+from pureyaml.exceptions import YAMLCastTypeError
+from pureyaml.resolver import get_schema, schemas, default_schema, CoreSchema
+
+
+@mark.parametrize('schema,text,expected', [  # :off
+    ('failsafe', '12', ('str', '12')),
+    ('failsafe', 'null', ('str', 'null')),
+    ('json', 'null', ('null', None)),
+    ('json', 'true', ('bool', True)),
+    ('json', '-12', ('int10', -12)),
+    ('json', '1.5e3', ('float', 1500.0)),
+    ('core', 'TRUE', ('bool', True)),
+    ('core', 'Yes', ('str', 'Yes')),
+    ('core', 'tRUE', ('str', 'tRUE')),
+    ('core', '0o17', ('int8', 15)),
+    ('core', '0O17', ('str', '0O17')),
+    ('core', '+.inf', ('infinity', float('inf'))),
+    ('default', 'Yes', ('bool', True)),
+    ('default', '0O17', ('int8', 15)),
+])  # :on
+def test_schema_resolve(schema, text, expected):
+    assert schemas[schema].resolve(text) == expected
+
+
+@mark.parametrize('text', ['True', 'yes', '012', '+1', 'hello'])
+def test_json_schema_rejects_other_plain_scalars(text):
+    with raises(YAMLCastTypeError):
+        schemas['json'].resolve(text)
+
+
+@mark.parametrize('direct', [True, False])
+def test_loads_schema(direct):
+    text = 'a: yes\nb: 0x1F\n'
+
+    assert pureyaml.loads(text, direct=direct) == {'a': True, 'b': 31}
+    assert pureyaml.loads(text, direct=direct, schema='core') == {'a': 'yes', 'b': 31}
+    assert pureyaml.loads(text, direct=direct, schema='failsafe') == {'a': 'yes', 'b': '0x1F'}
+
+
+def test_loads_json_schema():
+    assert pureyaml.loads('"a": 1\n"b": [true, null]\n', schema='json') == {'a': 1, 'b': [True, None]}
+
+    with raises(YAMLCastTypeError):
+        pureyaml.loads('a: 1\n', schema='json')
+
+
+def test_get_schema():
+    schema = CoreSchema()
+
+    assert get_schema() is default_schema
+    assert get_schema('core') is schemas['core']
+    assert get_schema(schema) is schema
+
+    with raises(ValueError):
+        get_schema('yaml11')
+
+
+def test_schema_pickles():
+    schema = pickle.loads(pickle.dumps(schemas['json']))
+
+    assert schema.name == 'json'
+    assert schema.resolve('12') == ('int10', 12)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from pytest import mark, raises
+
+import pureyaml
+from pureyaml.exceptions import YAMLEscapeError
+from pureyaml.styles import DOUBLE, FOLDED, LITERAL, PLAIN, SINGLE, analyze, choose_style, escape, unescape
+
+STYLES = [  # :off
+    ('web', PLAIN),
+    ('hello world', PLAIN),
+    (u'héllo wörld', PLAIN),
+    ('1.5abc', PLAIN),
+    ('a:b', PLAIN),
+    ('-x', PLAIN),
+    ('x]', PLAIN),
+    ("it's", PLAIN),
+    ('a\tb', PLAIN),
+    ('C:\\path\\', DOUBLE),
+    ('a-', SINGLE),
+    ('yes', SINGLE),
+    ('No', SINGLE),
+    ('~', SINGLE),
+    ('null', SINGLE),
+    ('1', SINGLE),
+    ('0x1F', SINGLE),
+    ('1.5', SINGLE),
+    ('.inf', SINGLE),
+    (' padded ', SINGLE),
+    ('a: b', DOUBLE),
+    ('a:', SINGLE),
+    ('a # b', SINGLE),
+    ('a#b', SINGLE),
+    ('100%', SINGLE),
+    ('- x', SINGLE),
+    ('[x]', SINGLE),
+    ('*alias', SINGLE),
+    ('---', SINGLE),
+    ("'quoted'", SINGLE),
+    ('one\ntwo\n', LITERAL),
+    ('  code\n', DOUBLE),
+    ('one\n', FOLDED),
+    ('', DOUBLE),
+    ('one\ntwo', DOUBLE),
+    ('one\n\n', DOUBLE),
+    (' one\ntwo\n', DOUBLE),
+    ('bell\x07', DOUBLE),
+    (u'line\u2028break', DOUBLE),
+    ("a\\'b", PLAIN),
+    ("' a\\'", DOUBLE),
+]  # :on
+
+
+@mark.parametrize('text,style', STYLES)
+def test_choose_style(text, style):
+    assert choose_style(text) == style
+
+
+# Folded and literal scalars are values only.
+ROUND_TRIP = [text for text, style in STYLES if text] + ['x\n\n', ' indented\nx\n', '\x07', u'\u2028', 'a\\x']
+
+
+@mark.parametrize('text', [text for text in ROUND_TRIP if '\n' not in text])
+def test_round_trip(text):
+    obj = {'key': text, text: 'value'}
+
+    assert pureyaml.loads(pureyaml.dumps(obj)) == obj
+
+
+@mark.parametrize('text', [text for text in ROUND_TRIP if '\n' in text])
+def test_round_trip_value(text):
+    obj = {'key': text, 'next': 1}
+
+    assert pureyaml.loads(pureyaml.dumps(obj)) == obj
+
+
+def test_escape():
+    assert escape('tab\there') == 'tab\there'
+    assert escape('"q"\\') == '\\"q\\"\\x5C'
+    assert escape(u'\x00\x1b\x7f\x85\u2028\ufffe') == '\\0\\e\\x7F\\N\\L\\uFFFE'
+    assert escape('a: b:c') == 'a\\x3A b:c'
+    assert analyze('one\ntwo') == (DOUBLE, '"one\\ntwo"')
+
+
+@mark.parametrize('text', ['tab\there', '"q"\\', u'\x00\x1b\x7f\x85\u2028\ufffe', 'a: b', u'\u263a\U0001f600'])
+def test_unescape_reads_escape(text):
+    assert unescape(escape(text)) == text
+
+
+def test_unescape():
+    assert unescape('\\/\\_\\ \\q') == u'/\xa0 \\q'
+    assert unescape('one\n  two\\\n  three') == 'one twothree'
+
+
+@mark.parametrize('text', ['\\x', '\\xq', '\\x4', '\\u12', '\\u12G4', '\\U0001F60'])
+def test_unescape_keeps_partial_escapes(text):
+    assert unescape(text + 'z') == text + 'z'
+    assert pureyaml.loads('a: "%s"' % text) == {'a': text}
+
+
+@mark.parametrize('text', ['\\U00110000', '\\UFFFFFFFF'])
+def test_unescape_out_of_range(text):
+    with raises(YAMLEscapeError):
+        unescape(text)
+    with raises(YAMLEscapeError):
+        pureyaml.loads('a: "%s"' % text)
+
+
+def test_analyze_caches_short_strings():
+    text = ''.join(['en', 'abled'])
+
+    assert analyze(text) is analyze('enabled')
+    assert analyze('x' * 200) is not analyze('x' * 200)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from pytest import raises
+
+import pureyaml
+from pureyaml._compat import collections_abc as abc
+from pureyaml.views import MapView, SequenceView
+
+TEXT = """\
+name: web
+replicas: 3
+enabled: yes
+ratio: 0.5
+missing: ~
+labels:
+  app: web
+ports:
+  - 80
+  - 443
+  - [1, 2]
+"""
+
+
+def test_lazy_loads_equals_eager_loads():
+    config = pureyaml.loads(TEXT, lazy=True)
+
+    assert isinstance(config, MapView)
+    assert config == pureyaml.loads(TEXT)
+
+
+def test_lazy_views_are_read_only_collections():
+    config = pureyaml.loads(TEXT, lazy=True)
+
+    assert isinstance(config, abc.Mapping) and not isinstance(config, abc.MutableMapping)
+    assert isinstance(config['ports'], abc.Sequence) and not isinstance(config['ports'], abc.MutableSequence)
+    with raises(TypeError):
+        config['name'] = 'db'
+    with raises(TypeError):
+        config['ports'][0] = 8080
+
+
+def test_lazy_values_are_converted_once():
+    config = pureyaml.loads(TEXT, lazy=True)
+
+    assert config._cache == {}
+    assert config['labels'] is config['labels']
+    assert set(config._cache) == {'labels'}
+
+    ports = config['ports']
+    assert isinstance(ports, SequenceView)
+    assert ports[-1] is ports[2]
+    assert ports[1:] == [443, [1, 2]]
+
+
+def test_lazy_map_lookups():
+    config = pureyaml.loads(TEXT, lazy=True)
+
+    assert len(config) == 7
+    assert 'ratio' in config and 'other' not in config
+    assert config.get('missing', 'default') is None
+    assert config.get('other', 'default') == 'default'
+    assert config['enabled'] is True
+    with raises(KeyError):
+        config['other']
+
+
+def test_lazy_sequence_document():
+    ports = pureyaml.loads('- 80\n- 443\n', lazy=True)
+
+    assert ports == [80, 443] and ports != [80] and ports != '80'
+    assert len(ports) == 2 and 443 in ports
+    with raises(IndexError):
+        ports[2]
+
+
+def test_lazy_scalar_document():
+    assert pureyaml.loads('--- 12\n', lazy=True) == 12